@@ -1,53 +1,95 @@
+import { Suspense, lazy, useEffect, useState } from 'react'
 import { BrowserRouter as Router, Routes, Route } from 'react-router-dom'
 import { PublicRoute, PrivateRoute } from './utils/auth'
-import LandingPage from './pages/LandingPage'
-import Login from './pages/Login'
-import Register from './pages/Register'
-import ForgotPassword from './pages/ForgotPassword'
-import Dashboard from './pages/Dashboard'
+import { ProfiledRegion } from './utils/renderProfiler'
+import { LandingPage, Login, Register, ForgotPassword, Dashboard } from './pages/lazyPages'
+
+// Painel de telemetria da API: só é baixado quando aberto
+const PerfPanel = lazy(() => import('./components/PerfPanel'))
+
+// Exibido enquanto o chunk da página é baixado
+function PageLoading() {
+  return (
+    <div className="loading-state">
+      <p>Carregando...</p>
+    </div>
+  )
+}
+
+// Ctrl+Alt+P abre/fecha o painel; localStorage.perf_panel = '1' mantém aberto
+function PerfPanelToggle() {
+  const [open, setOpen] = useState(() => localStorage.getItem('perf_panel') === '1')
+
+  useEffect(() => {
+    const handleKeyDown = (event) => {
+      if (event.ctrlKey && event.altKey && event.key.toLowerCase() === 'p') {
+        setOpen(current => !current)
+      }
+    }
+    window.addEventListener('keydown', handleKeyDown)
+    return () => window.removeEventListener('keydown', handleKeyDown)
+  }, [])
+
+  const handleClose = () => {
+    localStorage.removeItem('perf_panel')
+    setOpen(false)
+  }
+
+  if (!open) return null
+  return (
+    <Suspense fallback={null}>
+      <PerfPanel onClose={handleClose} />
+    </Suspense>
+  )
+}
 
 function App() {
   return (
     <Router>
-      <Routes>
-        <Route path="/" element={<LandingPage />} />
-        
-        {/* Rotas públicas - redirecionam para dashboard se já estiver logado */}
-        <Route 
-          path="/login" 
-          element={
-            <PublicRoute>
-              <Login />
-            </PublicRoute>
-          } 
-        />
-        <Route 
-          path="/register" 
-          element={
-            <PublicRoute>
-              <Register />
-            </PublicRoute>
-          } 
-        />
-        <Route 
-          path="/forgot-password" 
-          element={
-            <PublicRoute>
-              <ForgotPassword />
-            </PublicRoute>
-          } 
-        />
-        
-        {/* Rotas privadas - requerem autenticação */}
-        <Route 
-          path="/dashboard" 
-          element={
-            <PrivateRoute>
-              <Dashboard />
-            </PrivateRoute>
-          } 
-        />
-      </Routes>
+      <PerfPanelToggle />
+      <Suspense fallback={<PageLoading />}>
+        <Routes>
+          <Route path="/" element={<LandingPage />} />
+          
+          {/* Rotas públicas - redirecionam para dashboard se já estiver logado */}
+          <Route 
+            path="/login" 
+            element={
+              <PublicRoute>
+                <Login />
+              </PublicRoute>
+            } 
+          />
+          <Route 
+            path="/register" 
+            element={
+              <PublicRoute>
+                <Register />
+              </PublicRoute>
+            } 
+          />
+          <Route 
+            path="/forgot-password" 
+            element={
+              <PublicRoute>
+                <ForgotPassword />
+              </PublicRoute>
+            } 
+          />
+          
+          {/* Rotas privadas - requerem autenticação */}
+          <Route 
+            path="/dashboard" 
+            element={
+              <PrivateRoute>
+                <ProfiledRegion id="Dashboard">
+                  <Dashboard />
+                </ProfiledRegion>
+              </PrivateRoute>
+            } 
+          />
+        </Routes>
+      </Suspense>
     </Router>
   )
 }
@@ -1,11 +1,24 @@
-import { useState } from 'react'
+import { useState, useEffect, useRef } from 'react'
 import api from '../../services/api'
-import axios from 'axios'
+import {
+  isCepLookupCancelled,
+  isCompleteCep,
+  normalizeCep,
+  peekCep,
+  resolveCep,
+  warmCepProvider
+} from '../../services/cepResolver'
 import { FontAwesomeIcon } from '@fortawesome/react-fontawesome'
 import { faTimes, faSearch } from '@fortawesome/free-solid-svg-icons'
 
+// Espera depois do último dígito antes de consultar o CEP automaticamente
+const CEP_DEBOUNCE_MS = 250
+
 function CreateRepublicModal({ showModal, onClose, onRepublicCreated, republicas }) {
   const [loadingCep, setLoadingCep] = useState(false)
+  // Consulta em andamento (cancelada quando o CEP muda) e consulta agendada
+  const cepLookupRef = useRef(null)
+  const cepTimerRef = useRef(null)
   const [newRepublic, setNewRepublic] = useState({
     nome: '',
     cep: '',
@@ -18,41 +31,61 @@ function CreateRepublicModal({ showModal, onClose, onRepublicCreated, republicas
   })
   const [formError, setFormError] = useState('')
 
-  // Buscar CEP na API ViaCEP
-  const buscarCep = async () => {
-    const cep = newRepublic.cep.replace(/\D/g, '')
+  // Preencher o endereço a partir do resultado da consulta
+  const applyAddress = (address) => {
+    if (!address) {
+      setFormError('CEP não encontrado')
+      return
+    }
+    setFormError('')
+    setNewRepublic(prev => ({ ...prev, ...address }))
+  }
+
+  const cancelCepLookup = () => {
+    clearTimeout(cepTimerRef.current)
+    cepTimerRef.current = null
+    if (cepLookupRef.current) {
+      cepLookupRef.current.abort()
+      cepLookupRef.current = null
+    }
+    setLoadingCep(false)
+  }
+
+  // Buscar CEP (cache local primeiro, depois o provedor configurado)
+  const buscarCep = async (value = newRepublic.cep) => {
+    const cep = normalizeCep(value)
     
     if (cep.length !== 8) {
       setFormError('CEP deve conter 8 dígitos')
       return
     }
 
+    cancelCepLookup()
+    const cached = peekCep(cep)
+    if (cached !== undefined) {
+      applyAddress(cached)
+      return
+    }
+
+    const controller = new AbortController()
+    cepLookupRef.current = controller
     setLoadingCep(true)
     setFormError('')
 
     try {
-      const response = await axios.get(`https://viacep.com.br/ws/${cep}/json/`)
-      
-      if (response.data.erro) {
-        setFormError('CEP não encontrado')
-        return
-      }
-
-      setNewRepublic(prev => ({
-        ...prev,
-        rua: response.data.logradouro || '',
-        bairro: response.data.bairro || '',
-        cidade: response.data.localidade || '',
-        estado: response.data.uf || ''
-      }))
+      applyAddress(await resolveCep(cep, { signal: controller.signal }))
     } catch (error) {
+      if (isCepLookupCancelled(error)) return
       setFormError('Erro ao buscar CEP. Tente novamente.')
     } finally {
-      setLoadingCep(false)
+      if (cepLookupRef.current === controller) {
+        cepLookupRef.current = null
+        setLoadingCep(false)
+      }
     }
   }
 
-  // Formatar CEP enquanto digita
+  // Formatar CEP enquanto digita e consultar assim que os 8 dígitos estiverem completos
   const handleCepChange = (e) => {
     let value = e.target.value.replace(/\D/g, '')
     if (value.length > 8) value = value.slice(0, 8)
@@ -63,8 +96,23 @@ function CreateRepublicModal({ showModal, onClose, onRepublicCreated, republicas
     }
     
     setNewRepublic(prev => ({ ...prev, cep: value }))
+
+    cancelCepLookup()
+    if (!isCompleteCep(value)) return
+    if (peekCep(value) !== undefined) {
+      buscarCep(value)
+    } else {
+      cepTimerRef.current = setTimeout(() => buscarCep(value), CEP_DEBOUNCE_MS)
+    }
   }
 
+  // Abrir a conexão com o provedor de CEP junto com o modal; cancelar ao fechar
+  useEffect(() => {
+    if (!showModal) return
+    warmCepProvider()
+    return cancelCepLookup
+  }, [showModal])
+
   // Criar nova república
   const handleCreateRepublic = async (e) => {
     e.preventDefault()
@@ -159,6 +207,7 @@ function CreateRepublicModal({ showModal, onClose, onRepublicCreated, republicas
   }
 
   const handleClose = () => {
+    cancelCepLookup()
     setFormError('')
     setNewRepublic({
       nome: '',
@@ -176,17 +225,17 @@ function CreateRepublicModal({ showModal, onClose, onRepublicCreated, republicas
   if (!showModal) return null
 
   return (
-    <div className="modal-overlay" onClick={handleClose}>
+    <div className="modal-overlay" data-testid="republic-create-modal" onClick={handleClose}>
       <div className="modal-content" onClick={(e) => e.stopPropagation()}>
         <div className="modal-header">
           <h2>Criar Nova República</h2>
-          <button className="modal-close" onClick={handleClose}>
+          <button className="modal-close" data-testid="modal-close" onClick={handleClose}>
             <FontAwesomeIcon icon={faTimes} />
           </button>
         </div>
 
         <form onSubmit={handleCreateRepublic} className="modal-form">
-          {formError && <div className="error-message">{formError}</div>}
+          {formError && <div className="error-message" data-testid="modal-error">{formError}</div>}
 
           <div className="form-group">
             <label htmlFor="nome">Nome da República *</label>
@@ -216,7 +265,7 @@ function CreateRepublicModal({ showModal, onClose, onRepublicCreated, republicas
                 <button 
                   type="button" 
                   className="btn-search-cep"
-                  onClick={buscarCep}
+                  onClick={() => buscarCep()}
                   disabled={loadingCep || newRepublic.cep.length < 9}
                 >
                   <FontAwesomeIcon icon={faSearch} />
@@ -307,10 +356,10 @@ function CreateRepublicModal({ showModal, onClose, onRepublicCreated, republicas
           </div>
 
           <div className="modal-footer">
-            <button type="button" className="btn-cancel" onClick={handleClose}>
+            <button type="button" className="btn-cancel" data-testid="modal-cancel" onClick={handleClose}>
               Cancelar
             </button>
-            <button type="submit" className="btn-submit">
+            <button type="submit" className="btn-submit" data-testid="modal-submit">
               Criar República
             </button>
           </div>
@@ -1,14 +1,38 @@
+import { Suspense } from 'react'
+import { ProfiledRegion } from '../../utils/renderProfiler'
 import SummaryCards from './SummaryCards'
 import ExpensesList from './ExpensesList'
 import RepublicsList from './RepublicsList'
-import MembersSection from './MembersSection'
-import ProfileSection from './ProfileSection'
-import RoomsSection from './RoomsSection'
-import ExpensesSection from './ExpensesSection'
-import PaymentsSection from './PaymentsSection'
-import ReportsSection from './ReportsSection'
+import {
+  MembersSection,
+  ProfileSection,
+  RoomsSection,
+  ExpensesSection,
+  PaymentsSection,
+  ReportsSection
+} from './lazySections'
 
-function DashboardContent({ 
+// Mesmo visual do "Carregando..." das seções enquanto o chunk é baixado
+function SectionLoading() {
+  return (
+    <div className="loading-state">
+      <p>Carregando...</p>
+    </div>
+  )
+}
+
+// No modo profile, cada seção é uma região própria do <Profiler> (secao:despesas, ...)
+function DashboardContent(props) {
+  return (
+    <Suspense fallback={<SectionLoading />}>
+      <ProfiledRegion id={`secao:${props.activeMenu}`}>
+        <ActiveSection {...props} />
+      </ProfiledRegion>
+    </Suspense>
+  )
+}
+
+function ActiveSection({ 
   activeMenu, 
   resumoData, 
   despesasRecentes, 
@@ -1,5 +1,10 @@
 import { useState, useEffect } from 'react'
 import api from '../../services/api'
+import { cachedGet } from '../../services/queryCache'
+import { fetchExpensePayments, peekExpensePayments } from '../../services/payments'
+import { useOptimisticList } from '../../hooks/useOptimisticList'
+import { useVirtualRows } from '../../hooks/useVirtualRows'
+import { selectExpenseTabs, selectMembersById, memberName } from '../../utils/selectors'
 import { FontAwesomeIcon } from '@fortawesome/react-fontawesome'
 import { 
   faPlus, 
@@ -13,6 +18,11 @@ import {
   faCalendar
 } from '@fortawesome/free-solid-svg-icons'
 
+// Cards por linha no .expenses-grid (minmax(350px, 1fr) com gap de 1.5rem)
+const CARD_MIN_WIDTH = 350
+const GRID_GAP = 24
+const getGridColumns = (width) => Math.floor((width + GRID_GAP) / (CARD_MIN_WIDTH + GRID_GAP))
+
 function ExpensesSection({ selectedRepublic }) {
   const [expenses, setExpenses] = useState([])
   const [members, setMembers] = useState([])
@@ -48,6 +58,9 @@ function ExpensesSection({ selectedRepublic }) {
   
   const [formError, setFormError] = useState('')
 
+  // Criar/editar/excluir/pagar atualizam a lista na hora e desfazem se a API recusar
+  const optimisticExpenses = useOptimisticList(setExpenses, { onError: setError, refresh: () => fetchExpenses() })
+
   // Categorias de despesas (mapeamento para exibição)
   const categories = {
     'luz': 'Luz',
@@ -67,7 +80,9 @@ function ExpensesSection({ selectedRepublic }) {
     try {
       setLoading(true)
       setError('')
-      const response = await api.get(`/despesas/${selectedRepublic}`)
+      const response = await cachedGet(`/despesas/${selectedRepublic}`, {
+        onUpdate: (res) => setExpenses(res.data.despesas || [])
+      })
       setExpenses(response.data.despesas || [])
     } catch (err) {
       console.error('Erro ao buscar despesas:', err)
@@ -86,7 +101,9 @@ function ExpensesSection({ selectedRepublic }) {
     if (!selectedRepublic) return
 
     try {
-      const response = await api.get(`/membros/${selectedRepublic}`)
+      const response = await cachedGet(`/membros/${selectedRepublic}`, {
+        onUpdate: (res) => setMembers(res.data.members || [])
+      })
       setMembers(response.data.members || [])
     } catch (err) {
       console.error('Erro ao buscar membros:', err)
@@ -113,21 +130,30 @@ function ExpensesSection({ selectedRepublic }) {
       return
     }
 
-    try {
-      await api.post(`/despesas/${selectedRepublic}`, {
-        descricao: formData.descricao,
-        valor_total: parseFloat(formData.valor_total),
-        data_vencimento: formData.data_vencimento,
-        categoria: formData.categoria
-      })
-      
-      await fetchExpenses()
-      setShowCreateModal(false)
-      setFormData({ descricao: '', valor_total: '', data_vencimento: '', categoria: '' })
-    } catch (err) {
-      console.error('Erro ao criar despesa:', err)
-      setFormError(err.response?.data?.detail || 'Erro ao criar despesa')
+    const expense = {
+      descricao: formData.descricao,
+      valor_total: parseFloat(formData.valor_total),
+      data_vencimento: formData.data_vencimento,
+      categoria: formData.categoria
     }
+
+    const values = formData
+    setShowCreateModal(false)
+    setFormData({ descricao: '', valor_total: '', data_vencimento: '', categoria: '' })
+    setError('')
+    await optimisticExpenses.create(
+      { ...expense, status: 'PENDENTE' },
+      () => api.post(`/despesas/${selectedRepublic}`, expense),
+      {
+        errorMessage: 'Erro ao criar despesa',
+        // Recusa do backend: o modal volta com o que foi digitado e o erro
+        onRejected: (message) => {
+          setFormData(values)
+          setFormError(message)
+          setShowCreateModal(true)
+        }
+      }
+    )
   }
 
   // Editar despesa
@@ -145,35 +171,48 @@ function ExpensesSection({ selectedRepublic }) {
       return
     }
 
-    try {
-      await api.patch(`/despesas/${selectedRepublic}/${editingExpense.id}`, {
-        descricao: formData.descricao,
-        valor_total: parseFloat(formData.valor_total),
-        data_vencimento: formData.data_vencimento,
-        categoria: formData.categoria
-      })
-      
-      await fetchExpenses()
-      setShowEditModal(false)
-      setEditingExpense(null)
-      setFormData({ descricao: '', valor_total: '', data_vencimento: '', categoria: '' })
-    } catch (err) {
-      console.error('Erro ao editar despesa:', err)
-      setFormError(err.response?.data?.detail || 'Erro ao editar despesa')
+    const expense = editingExpense
+    const values = formData
+    const expenseId = expense.id
+    const changes = {
+      descricao: formData.descricao,
+      valor_total: parseFloat(formData.valor_total),
+      data_vencimento: formData.data_vencimento,
+      categoria: formData.categoria
     }
+
+    setShowEditModal(false)
+    setEditingExpense(null)
+    setFormData({ descricao: '', valor_total: '', data_vencimento: '', categoria: '' })
+    setError('')
+    await optimisticExpenses.update(
+      expenseId,
+      changes,
+      () => api.patch(`/despesas/${selectedRepublic}/${expenseId}`, changes),
+      {
+        errorMessage: 'Erro ao editar despesa',
+        onRejected: (message) => {
+          setEditingExpense(expense)
+          setFormData(values)
+          setFormError(message)
+          setShowEditModal(true)
+        }
+      }
+    )
   }
 
   // Excluir despesa
   const handleDeleteExpense = async () => {
-    try {
-      await api.delete(`/despesas/${selectedRepublic}/${expenseToDelete.id}`)
-      await fetchExpenses()
-      setShowDeleteModal(false)
-      setExpenseToDelete(null)
-    } catch (err) {
-      console.error('Erro ao excluir despesa:', err)
-      setError(err.response?.data?.detail || 'Erro ao excluir despesa')
-    }
+    const expenseId = expenseToDelete.id
+
+    setShowDeleteModal(false)
+    setExpenseToDelete(null)
+    setError('')
+    await optimisticExpenses.remove(
+      expenseId,
+      () => api.delete(`/despesas/${selectedRepublic}/${expenseId}`),
+      { errorMessage: 'Erro ao excluir despesa' }
+    )
   }
 
   // Registrar pagamento
@@ -186,42 +225,58 @@ function ExpensesSection({ selectedRepublic }) {
       return
     }
 
+    const expense = selectedExpense
+    const expenseId = expense.id
+    const membroId = parseInt(paymentData.membro_id)
+
+    // A despesa fica paga quando todos os membros pagam: se os pagamentos dela
+    // já estão em cache, dá para prever o novo status (membros distintos, não registros)
+    const knownPayments = peekExpensePayments(selectedRepublic, expenseId)
+    const payers = knownPayments && new Set([...knownPayments.map(p => p.membro_id), membroId])
+    const changes = payers && members.length > 0 && payers.size >= members.length
+      ? { status: 'PAGO' }
+      : {}
+
+    setShowPaymentModal(false)
+    setSelectedExpense(null)
+    setPaymentData({ membro_id: '' })
+    setError('')
+    // Só o POST desfaz a mudança: a resposta é o pagamento, não a despesa
+    const response = await optimisticExpenses.update(
+      expenseId,
+      changes,
+      () => api.post(`/despesas/${selectedRepublic}/${expenseId}/pagamento`, { membro_id: membroId }),
+      {
+        errorMessage: 'Erro ao registrar pagamento',
+        fromResponse: (_, item) => item,
+        // Ex.: membro que já pagou esta despesa
+        onRejected: (message) => {
+          setSelectedExpense(expense)
+          setPaymentData({ membro_id: String(membroId) })
+          setFormError(message)
+          setShowPaymentModal(true)
+        }
+      }
+    )
+    if (!response) return
+
+    // O status real vem da despesa atualizada; se a busca falhar, o pagamento
+    // já salvo continua valendo com o status previsto
     try {
-      const expenseId = selectedExpense.id
-      
-      await api.post(`/despesas/${selectedRepublic}/${expenseId}/pagamento`, {
-        membro_id: parseInt(paymentData.membro_id)
-      })
-      
-      // Fechar modal primeiro
-      setShowPaymentModal(false)
-      setSelectedExpense(null)
-      setPaymentData({ membro_id: '' })
-      
-      // Aguardar para o backend atualizar o status
-      await new Promise(resolve => setTimeout(resolve, 300))
-      
-      // Buscar a despesa atualizada do backend
-      const updatedExpenseResponse = await api.get(`/despesas/${selectedRepublic}/${expenseId}`)
-      const updatedExpense = updatedExpenseResponse.data
-      
-      // Atualizar apenas a despesa específica no array
-      setExpenses(prevExpenses => 
-        prevExpenses.map(exp => 
-          exp.id === expenseId ? updatedExpense : exp
-        )
-      )
+      const { data } = await api.get(`/despesas/${selectedRepublic}/${expenseId}`)
+      if (data?.id === expenseId) {
+        setExpenses(items => items.map(expense => (expense.id === expenseId ? { ...expense, ...data } : expense)))
+      }
     } catch (err) {
-      console.error('Erro ao registrar pagamento:', err)
-      setFormError(err.response?.data?.detail || 'Erro ao registrar pagamento')
+      console.error('Erro ao atualizar status da despesa:', err)
     }
   }
 
-  // Listar pagamentos de uma despesa
+  // Listar pagamentos de uma despesa (reaproveita o cache da seção Pagamentos)
   const handleShowPayments = async (expense) => {
     try {
-      const response = await api.get(`/despesas/${selectedRepublic}/${expense.id}/pagamentos`)
-      setPayments(response.data.pagamentos || [])
+      const pagamentos = await fetchExpensePayments(selectedRepublic, expense.id)
+      setPayments(pagamentos)
       setSelectedExpense(expense)
       setShowPaymentsListModal(true)
     } catch (err) {
@@ -322,68 +377,19 @@ function ExpensesSection({ selectedRepublic }) {
     return due < today
   }
 
-    // Determinar status real da despesa baseado na data de vencimento
-  const getExpenseStatus = (expense) => {
-    const status = expense.status ? expense.status.toLowerCase() : 'pendente'
-    
-    // Se já está pago, retorna pago
-    if (status === 'pago') {
-      return 'pago'
-    }
-    
-    // Verificar se está vencido
-    if (expense.data_vencimento) {
-      const vencimento = expense.data_vencimento.includes('Z') || expense.data_vencimento.includes('+')
-        ? new Date(expense.data_vencimento)
-        : new Date(expense.data_vencimento + 'Z')
-      
-      const hoje = new Date()
-      // Zera as horas para comparar apenas as datas
-      hoje.setHours(0, 0, 0, 0)
-      vencimento.setHours(0, 0, 0, 0)
-      
-      // Se passou da data de vencimento, está vencido
-      if (hoje > vencimento) {
-        return 'vencida'
-      }
-    }
-    
-    // Caso contrário, está pendente
-    return 'pendente'
-  }
-
-  // Obter nome do membro por ID
-  const getMemberName = (memberId) => {
-    const member = members.find(m => m.id === memberId)
-    return member ? member.fullname : 'Desconhecido'
-  }
-
-  // Filtrar e ordenar despesas
-  const getFilteredAndSortedExpenses = () => {
-    // Separar despesas pagas e em aberto
-    const paidExpenses = expenses.filter(exp => getExpenseStatus(exp) === 'pago')
-    const openExpenses = expenses.filter(exp => getExpenseStatus(exp) !== 'pago')
-
-    // Ordenar em aberto por data de vencimento (ascendente - mais antiga primeiro)
-    const sortedOpen = openExpenses.sort((a, b) => {
-      const dateA = new Date(a.data_vencimento)
-      const dateB = new Date(b.data_vencimento)
-      return dateA - dateB
-    })
-
-    // Ordenar pagas por data de vencimento (descendente - mais recente primeiro)
-    const sortedPaid = paidExpenses.sort((a, b) => {
-      const dateA = new Date(a.data_vencimento)
-      const dateB = new Date(b.data_vencimento)
-      return dateB - dateA
-    })
-
-    return { openExpenses: sortedOpen, paidExpenses: sortedPaid }
-  }
-
-  const { openExpenses, paidExpenses } = getFilteredAndSortedExpenses()
+  // Status, abas e nomes vêm de seletores memoizados: só recalculam quando
+  // `expenses`/`members` mudam, não ao digitar num formulário ou abrir um modal
+  const membersById = selectMembersById(members)
+  const { openExpenses, paidExpenses, statusById } = selectExpenseTabs(expenses)
   const displayExpenses = activeTab === 'aberto' ? openExpenses : paidExpenses
 
+  // Só os cards visíveis são montados em listas longas
+  const virtualCards = useVirtualRows(displayExpenses.length, {
+    rowHeight: 260,
+    gap: GRID_GAP,
+    getColumns: getGridColumns
+  })
+
   if (!selectedRepublic) {
     return (
       <div className="empty-state">
@@ -402,20 +408,20 @@ function ExpensesSection({ selectedRepublic }) {
   }
 
   return (
-    <div className="expenses-section">
+    <div className="expenses-section" data-testid="section-despesas">
       {/* Modal Criar Despesa */}
       {showCreateModal && (
-        <div className="modal-overlay" onClick={() => setShowCreateModal(false)}>
+        <div className="modal-overlay" data-testid="expense-create-modal" onClick={() => setShowCreateModal(false)}>
           <div className="modal-content" onClick={(e) => e.stopPropagation()}>
             <div className="modal-header">
               <h2>Adicionar Despesa</h2>
-              <button className="modal-close" onClick={() => setShowCreateModal(false)}>
+              <button className="modal-close" data-testid="modal-close" onClick={() => setShowCreateModal(false)}>
                 <FontAwesomeIcon icon={faTimes} />
               </button>
             </div>
 
             <form onSubmit={handleCreateExpense} className="modal-form">
-              {formError && <div className="error-message">{formError}</div>}
+              {formError && <div className="error-message" data-testid="modal-error">{formError}</div>}
 
               <div className="form-group">
                 <label htmlFor="descricao">Descrição *</label>
@@ -484,10 +490,10 @@ function ExpensesSection({ selectedRepublic }) {
               </div>
 
               <div className="modal-footer">
-                <button type="button" className="btn-cancel" onClick={() => setShowCreateModal(false)}>
+                <button type="button" className="btn-cancel" data-testid="modal-cancel" onClick={() => setShowCreateModal(false)}>
                   Cancelar
                 </button>
-                <button type="submit" className="btn-submit">
+                <button type="submit" className="btn-submit" data-testid="modal-submit">
                   <FontAwesomeIcon icon={faPlus} style={{ marginRight: '0.5rem' }} />
                   Adicionar
                 </button>
@@ -499,17 +505,17 @@ function ExpensesSection({ selectedRepublic }) {
 
       {/* Modal Editar Despesa */}
       {showEditModal && (
-        <div className="modal-overlay" onClick={() => setShowEditModal(false)}>
+        <div className="modal-overlay" data-testid="expense-edit-modal" onClick={() => setShowEditModal(false)}>
           <div className="modal-content" onClick={(e) => e.stopPropagation()}>
             <div className="modal-header">
               <h2>Editar Despesa</h2>
-              <button className="modal-close" onClick={() => setShowEditModal(false)}>
+              <button className="modal-close" data-testid="modal-close" onClick={() => setShowEditModal(false)}>
                 <FontAwesomeIcon icon={faTimes} />
               </button>
             </div>
 
             <form onSubmit={handleEditExpense} className="modal-form">
-              {formError && <div className="error-message">{formError}</div>}
+              {formError && <div className="error-message" data-testid="modal-error">{formError}</div>}
 
               <div className="form-group">
                 <label htmlFor="edit_descricao">Descrição *</label>
@@ -566,10 +572,10 @@ function ExpensesSection({ selectedRepublic }) {
               </div>
 
               <div className="modal-footer">
-                <button type="button" className="btn-cancel" onClick={() => setShowEditModal(false)}>
+                <button type="button" className="btn-cancel" data-testid="modal-cancel" onClick={() => setShowEditModal(false)}>
                   Cancelar
                 </button>
-                <button type="submit" className="btn-submit">
+                <button type="submit" className="btn-submit" data-testid="modal-submit">
                   <FontAwesomeIcon icon={faEdit} style={{ marginRight: '0.5rem' }} />
                   Salvar
                 </button>
@@ -581,11 +587,11 @@ function ExpensesSection({ selectedRepublic }) {
 
       {/* Modal Excluir Despesa */}
       {showDeleteModal && (
-        <div className="modal-overlay" onClick={() => setShowDeleteModal(false)}>
+        <div className="modal-overlay" data-testid="expense-delete-modal" onClick={() => setShowDeleteModal(false)}>
           <div className="modal-content modal-small modal-confirm" onClick={(e) => e.stopPropagation()}>
             <div className="modal-header">
               <h2>Excluir Despesa</h2>
-              <button className="modal-close" onClick={() => setShowDeleteModal(false)}>
+              <button className="modal-close" data-testid="modal-close" onClick={() => setShowDeleteModal(false)}>
                 <FontAwesomeIcon icon={faTimes} />
               </button>
             </div>
@@ -603,10 +609,10 @@ function ExpensesSection({ selectedRepublic }) {
             </div>
 
             <div className="modal-footer">
-              <button type="button" className="btn-cancel" onClick={() => setShowDeleteModal(false)}>
+              <button type="button" className="btn-cancel" data-testid="modal-cancel" onClick={() => setShowDeleteModal(false)}>
                 Cancelar
               </button>
-              <button type="button" className="btn-delete-confirm" onClick={handleDeleteExpense}>
+              <button type="button" className="btn-delete-confirm" data-testid="modal-submit" onClick={handleDeleteExpense}>
                 <FontAwesomeIcon icon={faTrash} style={{ marginRight: '0.5rem' }} />
                 Excluir Despesa
               </button>
@@ -617,17 +623,17 @@ function ExpensesSection({ selectedRepublic }) {
 
       {/* Modal Registrar Pagamento */}
       {showPaymentModal && (
-        <div className="modal-overlay" onClick={() => setShowPaymentModal(false)}>
+        <div className="modal-overlay" data-testid="expense-payment-modal" onClick={() => setShowPaymentModal(false)}>
           <div className="modal-content modal-small" onClick={(e) => e.stopPropagation()}>
             <div className="modal-header">
               <h2>Registrar Pagamento</h2>
-              <button className="modal-close" onClick={() => setShowPaymentModal(false)}>
+              <button className="modal-close" data-testid="modal-close" onClick={() => setShowPaymentModal(false)}>
                 <FontAwesomeIcon icon={faTimes} />
               </button>
             </div>
 
             <form onSubmit={handleRegisterPayment} className="modal-form">
-              {formError && <div className="error-message">{formError}</div>}
+              {formError && <div className="error-message" data-testid="modal-error">{formError}</div>}
 
               <div className="form-group">
                 <label>Despesa</label>
@@ -665,10 +671,10 @@ function ExpensesSection({ selectedRepublic }) {
               </div>
 
               <div className="modal-footer">
-                <button type="button" className="btn-cancel" onClick={() => setShowPaymentModal(false)}>
+                <button type="button" className="btn-cancel" data-testid="modal-cancel" onClick={() => setShowPaymentModal(false)}>
                   Cancelar
                 </button>
-                <button type="submit" className="btn-submit">
+                <button type="submit" className="btn-submit" data-testid="modal-submit">
                   <FontAwesomeIcon icon={faCheckCircle} style={{ marginRight: '0.5rem' }} />
                   Registrar Pagamento
                 </button>
@@ -680,11 +686,11 @@ function ExpensesSection({ selectedRepublic }) {
 
       {/* Modal Lista de Pagamentos */}
       {showPaymentsListModal && (
-        <div className="modal-overlay" onClick={() => setShowPaymentsListModal(false)}>
+        <div className="modal-overlay" data-testid="expense-payments-list-modal" onClick={() => setShowPaymentsListModal(false)}>
           <div className="modal-content" onClick={(e) => e.stopPropagation()}>
             <div className="modal-header">
               <h2>Pagamentos - {selectedExpense?.descricao}</h2>
-              <button className="modal-close" onClick={() => setShowPaymentsListModal(false)}>
+              <button className="modal-close" data-testid="modal-close" onClick={() => setShowPaymentsListModal(false)}>
                 <FontAwesomeIcon icon={faTimes} />
               </button>
             </div>
@@ -701,7 +707,7 @@ function ExpensesSection({ selectedRepublic }) {
                       <div className="payment-info">
                         <FontAwesomeIcon icon={faCheckCircle} style={{ color: '#22c55e', marginRight: '0.75rem' }} />
                         <div>
-                          <strong>{getMemberName(payment.membro_id)}</strong>
+                          <strong>{memberName(membersById, payment.membro_id)}</strong>
                           <span className="payment-date">{formatDateTime(payment.data_pagamento)}</span>
                         </div>
                       </div>
@@ -721,7 +727,7 @@ function ExpensesSection({ selectedRepublic }) {
             </div>
 
             <div className="modal-footer">
-              <button type="button" className="btn-cancel" onClick={() => setShowPaymentsListModal(false)}>
+              <button type="button" className="btn-cancel" data-testid="modal-cancel" onClick={() => setShowPaymentsListModal(false)}>
                 Fechar
               </button>
             </div>
@@ -732,17 +738,18 @@ function ExpensesSection({ selectedRepublic }) {
       {/* Conteúdo Principal */}
       <div className="section-header">
         <h2>Despesas</h2>
-        <button className="btn-add" onClick={openCreateModal}>
+        <button className="btn-add" data-testid="add-button" onClick={openCreateModal}>
           <FontAwesomeIcon icon={faPlus} style={{ marginRight: '0.5rem' }} />
           Adicionar Despesa
         </button>
       </div>
 
-      {error && <div className="error-message">{error}</div>}
+      {error && <div className="error-message" data-testid="section-error">{error}</div>}
 
       {/* Abas */}
       <div className="expenses-tabs">
         <button 
+          data-testid="tab-aberto"
           className={`tab-button ${activeTab === 'aberto' ? 'active' : ''}`}
           onClick={() => setActiveTab('aberto')}
         >
@@ -750,6 +757,7 @@ function ExpensesSection({ selectedRepublic }) {
           Em Aberto ({openExpenses.length})
         </button>
         <button 
+          data-testid="tab-historico"
           className={`tab-button ${activeTab === 'historico' ? 'active' : ''}`}
           onClick={() => setActiveTab('historico')}
         >
@@ -771,15 +779,19 @@ function ExpensesSection({ selectedRepublic }) {
           </p>
         </div>
       ) : (
-        <div className="expenses-grid">
-          {displayExpenses.map(expense => {
-            const currentStatus = getExpenseStatus(expense)
+        <div
+          className="expenses-grid"
+          ref={virtualCards.containerRef}
+          style={{ paddingTop: virtualCards.paddingTop, paddingBottom: virtualCards.paddingBottom }}
+        >
+          {displayExpenses.slice(virtualCards.start, virtualCards.end).map((expense, index) => {
+            const currentStatus = statusById.get(expense.id)
             return (
-              <div key={expense.id} className={`expense-card ${
+              <div key={expense.id} ref={index === 0 ? virtualCards.measureRef : undefined} data-testid="expense-card" className={`expense-card ${
                 currentStatus === 'pago' ? 'paid' : 
                 currentStatus === 'vencida' ? 'overdue' : 
                 'pending'
-              }`}>
+              }${expense.pending ? ' optimistic-pending' : ''}`}>
                 <div className="expense-header">
                   <div className="expense-category">
                     <span className="category-badge">{categories[expense.categoria] || expense.categoria}</span>
@@ -797,16 +809,19 @@ function ExpensesSection({ selectedRepublic }) {
                   <div className="expense-actions">
                     <button
                       className="btn-icon btn-edit"
+                      data-testid="edit-button"
                       onClick={() => openEditModal(expense)}
                       title="Editar"
-                      disabled={expense.status === 'pago'}
+                      disabled={expense.status === 'pago' || expense.pending}
                     >
                       <FontAwesomeIcon icon={faEdit} />
                     </button>
                     <button
                       className="btn-icon btn-delete"
+                      data-testid="delete-button"
                       onClick={() => openDeleteModal(expense)}
                       title="Excluir"
+                      disabled={expense.pending}
                     >
                       <FontAwesomeIcon icon={faTrash} />
                     </button>
@@ -814,7 +829,7 @@ function ExpensesSection({ selectedRepublic }) {
                 </div>
 
                 <div className="expense-content">
-                  <h3>{expense.descricao}</h3>
+                  <h3 data-testid="expense-description">{expense.descricao}</h3>
                   
                   <div className="expense-details">
                     <div className="expense-value">
@@ -836,7 +851,9 @@ function ExpensesSection({ selectedRepublic }) {
                   <div className="expense-footer">
                     <button
                       className="btn-view-payments"
+                      data-testid="view-payments-button"
                       onClick={() => handleShowPayments(expense)}
+                      disabled={expense.pending}
                     >
                       <FontAwesomeIcon icon={faUsers} style={{ marginRight: '0.5rem' }} />
                       Ver Pagamentos
@@ -845,7 +862,9 @@ function ExpensesSection({ selectedRepublic }) {
                     {expense.status !== 'PAGO' && (
                       <button
                         className="btn-register-payment"
+                        data-testid="register-payment-button"
                         onClick={() => openPaymentModal(expense)}
+                        disabled={expense.pending}
                       >
                         <FontAwesomeIcon icon={faMoneyBill} style={{ marginRight: '0.5rem' }} />
                         Registrar Pagamento
@@ -1,5 +1,7 @@
 import { useState, useEffect } from 'react'
 import api from '../../services/api'
+import { cachedGet } from '../../services/queryCache'
+import { useOptimisticList } from '../../hooks/useOptimisticList'
 import { FontAwesomeIcon } from '@fortawesome/react-fontawesome'
 import { faPlus, faEdit, faTrash, faTimes, faUser } from '@fortawesome/free-solid-svg-icons'
 
@@ -20,6 +22,9 @@ function MembersSection({ selectedRepublic, onMembersChange }) {
   })
   const [formError, setFormError] = useState('')
 
+  // Mudanças aparecem na hora e são desfeitas se a API recusar
+  const optimisticMembers = useOptimisticList(setMembers, { onError: setError, refresh: () => fetchMembers() })
+
   // Buscar membros
   const fetchMembers = async () => {
     if (!selectedRepublic) return
@@ -27,7 +32,9 @@ function MembersSection({ selectedRepublic, onMembersChange }) {
     try {
       setLoading(true)
       setError('')
-      const response = await api.get(`/membros/${selectedRepublic}`)
+      const response = await cachedGet(`/membros/${selectedRepublic}`, {
+        onUpdate: (res) => setMembers(res.data.members || [])
+      })
       // Backend retorna { members: [...] }
       setMembers(response.data.members || [])
     } catch (err) {
@@ -44,7 +51,9 @@ function MembersSection({ selectedRepublic, onMembersChange }) {
     if (!selectedRepublic) return
 
     try {
-      const response = await api.get(`/quartos/?republica_id=${selectedRepublic}`)
+      const response = await cachedGet(`/quartos/?republica_id=${selectedRepublic}`, {
+        onUpdate: (res) => setRooms(res.data.quartos || [])
+      })
       setRooms(response.data.quartos || [])
     } catch (err) {
       console.error('Erro ao buscar quartos:', err)
@@ -102,36 +111,48 @@ function MembersSection({ selectedRepublic, onMembersChange }) {
       return
     }
 
-    try {
-      if (editingMember) {
-        // Editar membro existente (sem alterar quarto)
-        await api.put(`/membros/${selectedRepublic}/${editingMember.id}`, {
-          fullname: formData.fullname,
-          email: formData.email,
-          telephone: formData.telephone
-        })
-      } else {
-        // Criar novo membro (com quarto)
-        await api.post(`/membros/${selectedRepublic}`, {
-          fullname: formData.fullname,
-          email: formData.email,
-          telephone: formData.telephone,
-          quarto_id: parseInt(formData.quarto_id)
-        })
-      }
-
-      // Recarregar lista
-      await fetchMembers()
-      
-      // Atualizar contagem de membros
-      if (onMembersChange) {
-        onMembersChange(selectedRepublic)
-      }
-      
-      handleCloseModal()
-    } catch (err) {
-      console.error('Erro ao salvar membro:', err)
-      setFormError(err.response?.data?.detail || 'Erro ao salvar membro')
+    const member = editingMember
+    const values = formData
+    const editingId = member?.id
+    const quartoId = parseInt(formData.quarto_id)
+    const memberData = {
+      fullname: formData.fullname,
+      email: formData.email,
+      telephone: formData.telephone
+    }
+    handleCloseModal()
+    setError('')
+
+    // Recusa do backend (ex.: email repetido): o modal volta com o que foi digitado
+    const onRejected = (message) => {
+      setEditingMember(member)
+      setFormData(values)
+      setFormError(message)
+      setShowModal(true)
+    }
+
+    let response
+    if (editingId) {
+      // Editar membro existente (sem alterar quarto)
+      response = await optimisticMembers.update(
+        editingId,
+        memberData,
+        () => api.put(`/membros/${selectedRepublic}/${editingId}`, memberData),
+        { errorMessage: 'Erro ao salvar membro', onRejected }
+      )
+    } else {
+      // Criar novo membro (com quarto)
+      const newMember = { ...memberData, quarto_id: quartoId }
+      response = await optimisticMembers.create(
+        newMember,
+        () => api.post(`/membros/${selectedRepublic}`, newMember),
+        { errorMessage: 'Erro ao salvar membro', onRejected }
+      )
+    }
+
+    // Atualizar contagem de membros
+    if (response && onMembersChange) {
+      onMembersChange(selectedRepublic)
     }
   }
 
@@ -144,20 +165,19 @@ function MembersSection({ selectedRepublic, onMembersChange }) {
   const handleConfirmDelete = async () => {
     if (!memberToDelete) return
 
-    try {
-      await api.delete(`/membros/${selectedRepublic}/${memberToDelete.id}`)
-      await fetchMembers()
-      
-      // Atualizar contagem de membros
-      if (onMembersChange) {
-        onMembersChange(selectedRepublic)
-      }
-      
-      setShowDeleteModal(false)
-      setMemberToDelete(null)
-    } catch (err) {
-      console.error('Erro ao excluir membro:', err)
-      setError(err.response?.data?.detail || 'Erro ao excluir membro')
+    const memberId = memberToDelete.id
+    setShowDeleteModal(false)
+    setMemberToDelete(null)
+    setError('')
+    const response = await optimisticMembers.remove(
+      memberId,
+      () => api.delete(`/membros/${selectedRepublic}/${memberId}`),
+      { errorMessage: 'Erro ao excluir membro' }
+    )
+
+    // Atualizar contagem de membros
+    if (response && onMembersChange) {
+      onMembersChange(selectedRepublic)
     }
   }
 
@@ -184,14 +204,14 @@ function MembersSection({ selectedRepublic, onMembersChange }) {
   }
 
   return (
-    <div className="members-section">
+    <div className="members-section" data-testid="section-membros">
       {/* Modal de Confirmação de Exclusão */}
       {showDeleteModal && (
-        <div className="modal-overlay" onClick={handleCancelDelete}>
+        <div className="modal-overlay" data-testid="member-delete-modal" onClick={handleCancelDelete}>
           <div className="modal-content modal-small modal-confirm" onClick={(e) => e.stopPropagation()}>
             <div className="modal-header">
               <h2>Excluir Membro</h2>
-              <button className="modal-close" onClick={handleCancelDelete}>
+              <button className="modal-close" data-testid="modal-close" onClick={handleCancelDelete}>
                 <FontAwesomeIcon icon={faTimes} />
               </button>
             </div>
@@ -209,10 +229,10 @@ function MembersSection({ selectedRepublic, onMembersChange }) {
             </div>
 
             <div className="modal-footer">
-              <button type="button" className="btn-cancel" onClick={handleCancelDelete}>
+              <button type="button" className="btn-cancel" data-testid="modal-cancel" onClick={handleCancelDelete}>
                 Cancelar
               </button>
-              <button type="button" className="btn-delete-confirm" onClick={handleConfirmDelete}>
+              <button type="button" className="btn-delete-confirm" data-testid="modal-submit" onClick={handleConfirmDelete}>
                 <FontAwesomeIcon icon={faTrash} style={{ marginRight: '0.5rem' }} />
                 Excluir Membro
               </button>
@@ -223,17 +243,17 @@ function MembersSection({ selectedRepublic, onMembersChange }) {
 
       {/* Modal de Criar/Editar Membro */}
       {showModal && (
-        <div className="modal-overlay" onClick={handleCloseModal}>
+        <div className="modal-overlay" data-testid="member-form-modal" onClick={handleCloseModal}>
           <div className="modal-content modal-small" onClick={(e) => e.stopPropagation()}>
             <div className="modal-header">
               <h2>{editingMember ? 'Editar Membro' : 'Adicionar Membro'}</h2>
-              <button className="modal-close" onClick={handleCloseModal}>
+              <button className="modal-close" data-testid="modal-close" onClick={handleCloseModal}>
                 <FontAwesomeIcon icon={faTimes} />
               </button>
             </div>
 
             <form onSubmit={handleSubmit} className="modal-form">
-              {formError && <div className="error-message">{formError}</div>}
+              {formError && <div className="error-message" data-testid="modal-error">{formError}</div>}
 
               <div className="form-group">
                 <label htmlFor="fullname">Nome Completo *</label>
@@ -311,10 +331,10 @@ function MembersSection({ selectedRepublic, onMembersChange }) {
               )}
 
               <div className="modal-footer">
-                <button type="button" className="btn-cancel" onClick={handleCloseModal}>
+                <button type="button" className="btn-cancel" data-testid="modal-cancel" onClick={handleCloseModal}>
                   Cancelar
                 </button>
-                <button type="submit" className="btn-submit">
+                <button type="submit" className="btn-submit" data-testid="modal-submit">
                   {editingMember ? 'Salvar Alterações' : 'Adicionar Membro'}
                 </button>
               </div>
@@ -325,13 +345,13 @@ function MembersSection({ selectedRepublic, onMembersChange }) {
 
       <div className="section-header">
         <h2>Membros da República</h2>
-        <button className="btn-add" onClick={handleAddClick}>
+        <button className="btn-add" data-testid="add-button" onClick={handleAddClick}>
           <FontAwesomeIcon icon={faPlus} style={{ marginRight: '0.5rem' }} />
           Adicionar Membro
         </button>
       </div>
 
-      {error && <div className="error-message">{error}</div>}
+      {error && <div className="error-message" data-testid="section-error">{error}</div>}
 
       {members.length === 0 ? (
         <div className="empty-state">
@@ -355,7 +375,7 @@ function MembersSection({ selectedRepublic, onMembersChange }) {
               {members.map((member) => {
                 const room = rooms.find(r => r.id === member.quarto_id)
                 return (
-                  <tr key={member.id}>
+                  <tr key={member.id} data-testid="member-row" className={member.pending ? 'optimistic-pending' : undefined}>
                     <td>
                       <div className="member-name">
                         <FontAwesomeIcon icon={faUser} style={{ marginRight: '0.5rem', color: '#0050C3' }} />
@@ -369,15 +389,19 @@ function MembersSection({ selectedRepublic, onMembersChange }) {
                       <div className="action-buttons">
                         <button
                           className="btn-icon btn-edit"
+                          data-testid="edit-button"
                           onClick={() => handleEditClick(member)}
                           title="Editar"
+                          disabled={member.pending}
                         >
                           <FontAwesomeIcon icon={faEdit} />
                         </button>
                         <button
                           className="btn-icon btn-delete"
+                          data-testid="delete-button"
                           onClick={() => handleDeleteClick(member)}
                           title="Excluir"
+                          disabled={member.pending}
                         >
                           <FontAwesomeIcon icon={faTrash} />
                         </button>
@@ -1,5 +1,10 @@
-import { useState, useEffect } from 'react'
+import { useState, useEffect, useRef } from 'react'
 import api from '../../services/api'
+import { cachedGet } from '../../services/queryCache'
+import { streamRepublicPayments } from '../../services/payments'
+import { readOffline, writeOffline } from '../../services/offlineStore'
+import { useVirtualRows } from '../../hooks/useVirtualRows'
+import { selectPaymentsView, selectMembersById, memberName, paymentStatus } from '../../utils/selectors'
 import { FontAwesomeIcon } from '@fortawesome/react-fontawesome'
 import { 
   faMoneyBill, 
@@ -21,6 +26,9 @@ function PaymentsSection({ selectedRepublic }) {
   const [allPayments, setAllPayments] = useState([])
   const [loading, setLoading] = useState(true)
   const [error, setError] = useState('')
+  // Progresso do carregamento dos pagamentos (despesas já processadas)
+  const [paymentsProgress, setPaymentsProgress] = useState(null)
+  const loadIdRef = useRef(0)
   
   // Filtros
   const [selectedMember, setSelectedMember] = useState('all')
@@ -48,7 +56,9 @@ function PaymentsSection({ selectedRepublic }) {
     if (!selectedRepublic) return
 
     try {
-      const response = await api.get(`/membros/${selectedRepublic}`)
+      const response = await cachedGet(`/membros/${selectedRepublic}`, {
+        onUpdate: (res) => setMembers(res.data.members || [])
+      })
       setMembers(response.data.members || [])
     } catch (err) {
       console.error('Erro ao buscar membros:', err)
@@ -60,7 +70,7 @@ function PaymentsSection({ selectedRepublic }) {
     if (!selectedRepublic) return
 
     try {
-      const response = await api.get(`/despesas/${selectedRepublic}`)
+      const response = await cachedGet(`/despesas/${selectedRepublic}`)
       setExpenses(response.data.despesas || [])
     } catch (err) {
       console.error('Erro ao buscar despesas:', err)
@@ -68,64 +78,72 @@ function PaymentsSection({ selectedRepublic }) {
   }
 
   // Buscar todos os pagamentos (de todas as despesas)
-  const fetchAllPayments = async () => {
+  // A tela aparece assim que as despesas chegam; os pagamentos são carregados em
+  // lotes e exibidos à medida que cada lote termina. Se houver uma cópia local
+  // da última visita, ela é exibida na hora e trocada pela lista nova no fim
+  const fetchAllPayments = async (force = false) => {
     if (!selectedRepublic) return
 
+    // Um carregamento novo (troca de república ou "Atualizar") cancela o anterior
+    const loadId = ++loadIdRef.current
+    const isCancelled = () => loadIdRef.current !== loadId
+    const offlineKey = `payments:${selectedRepublic}`
+
     try {
       setLoading(true)
       setError('')
+
+      const saved = force ? undefined : await readOffline(offlineKey)
+      if (isCancelled()) return
+      if (saved) {
+        setExpenses(saved.data.expenses)
+        setAllPayments(saved.data.payments)
+        setLoading(false)
+      }
       
       // Primeiro buscar todas as despesas
-      const expensesResponse = await api.get(`/despesas/${selectedRepublic}`)
+      const expensesResponse = await cachedGet(`/despesas/${selectedRepublic}`, { force })
+      if (isCancelled()) return
       const allExpenses = expensesResponse.data.despesas || []
       setExpenses(allExpenses)
+      if (!saved) setAllPayments([])
+      setPaymentsProgress({ done: 0, total: allExpenses.length })
+      setLoading(false)
 
-      // Depois buscar os pagamentos de cada despesa
-      const paymentsPromises = allExpenses.map(expense =>
-        api.get(`/despesas/${selectedRepublic}/${expense.id}/pagamentos`)
-          .then(res => ({
-            despesaId: expense.id,
-            despesaDescricao: expense.descricao,
-            despesaCategoria: expense.categoria,
-            despesaStatus: expense.status,
-            despesaVencimento: expense.data_vencimento,
-            pagamentos: res.data.pagamentos || []
-          }))
-          .catch(() => ({ 
-            despesaId: expense.id, 
-            despesaDescricao: expense.descricao,
-            despesaCategoria: expense.categoria,
-            despesaStatus: expense.status,
-            despesaVencimento: expense.data_vencimento,
-            pagamentos: [] 
-          }))
-      )
-
-      const paymentsResults = await Promise.all(paymentsPromises)
-      
-      // Achatar array de pagamentos e adicionar info da despesa
-      const flatPayments = paymentsResults.flatMap(result =>
-        result.pagamentos.map(payment => ({
-          ...payment,
-          despesa_descricao: result.despesaDescricao,
-          despesa_categoria: result.despesaCategoria,
-          despesa_status: result.despesaStatus ? result.despesaStatus.toLowerCase() : 'pendente',
-          despesa_vencimento: result.despesaVencimento
-        }))
-      )
-      
-      setAllPayments(flatPayments)
+      // Depois buscar os pagamentos de cada despesa, em lotes
+      const collected = []
+      await streamRepublicPayments(selectedRepublic, allExpenses, {
+        force,
+        isCancelled,
+        onBatch: (batch) => {
+          collected.push(...batch)
+          if (!saved) setAllPayments(prev => prev.concat(batch))
+        },
+        onProgress: (done, total) => setPaymentsProgress({ done, total })
+      })
+      if (isCancelled()) return
+
+      if (saved) setAllPayments(collected)
+      writeOffline(offlineKey, { expenses: allExpenses, payments: collected })
     } catch (err) {
       console.error('Erro ao buscar pagamentos:', err)
       setError(err.response?.data?.detail || 'Erro ao carregar pagamentos')
     } finally {
-      setLoading(false)
+      if (!isCancelled()) {
+        setLoading(false)
+        setPaymentsProgress(null)
+      }
     }
   }
 
   useEffect(() => {
     fetchMembers()
     fetchAllPayments()
+
+    // Ao sair da seção, os lotes restantes não são mais buscados
+    return () => {
+      loadIdRef.current++
+    }
   }, [selectedRepublic])
 
   // Abrir detalhes do pagamento
@@ -145,12 +163,6 @@ function PaymentsSection({ selectedRepublic }) {
     }
   }
 
-  // Obter nome do membro por ID
-  const getMemberName = (memberId) => {
-    const member = members.find(m => m.id === memberId)
-    return member ? member.fullname : 'Desconhecido'
-  }
-
   // Formatar data (apenas data, sem conversão de timezone)
   const formatDate = (dateString) => {
     if (!dateString) return 'N/A'
@@ -191,71 +203,15 @@ function PaymentsSection({ selectedRepublic }) {
     }).format(value)
   }
 
-  // Determinar status real da despesa baseado na data de vencimento
-  const getExpenseStatus = (payment) => {
-    // Primeiro verifica o status que veio do backend
-    const status = payment.despesa_status ? payment.despesa_status.toLowerCase() : 'pendente'
-    
-    // Se já está pago (todos os membros pagaram), retorna pago
-    if (status === 'pago') {
-      return 'pago'
-    }
-    
-    // Para despesas que ainda não estão totalmente pagas, 
-    // verificar se está vencida baseado na data
-    if (payment.despesa_vencimento) {
-      const vencimento = payment.despesa_vencimento.includes('Z') || payment.despesa_vencimento.includes('+')
-        ? new Date(payment.despesa_vencimento)
-        : new Date(payment.despesa_vencimento + 'Z')
-      
-      const hoje = new Date()
-      // Zera as horas para comparar apenas as datas
-      hoje.setHours(0, 0, 0, 0)
-      vencimento.setHours(0, 0, 0, 0)
-      
-      // Se passou da data de vencimento e não está pago, está vencido
-      if (hoje > vencimento) {
-        return 'vencida'
-      }
-    }
-    
-    // Caso contrário, está pendente
-    return 'pendente'
-  }
-
-  // Filtrar pagamentos
-  const filteredPayments = allPayments.filter(payment => {
-    const memberFilter = selectedMember === 'all' || payment.membro_id === parseInt(selectedMember)
-    
-    // Usar status calculado baseado na data de vencimento
-    const paymentStatus = getExpenseStatus(payment)
-    const selectedStatusLower = selectedStatus.toLowerCase()
-    const statusFilter = selectedStatus === 'all' || paymentStatus === selectedStatusLower
-    
-    return memberFilter && statusFilter
-  })
-
-  // Calcular estatísticas
-  const calculateStats = () => {
-    const totalPaid = filteredPayments.reduce((sum, p) => sum + p.valor_pago, 0)
-    const totalPayments = filteredPayments.length
-    const memberPayments = {}
-
-    filteredPayments.forEach(payment => {
-      if (!memberPayments[payment.membro_id]) {
-        memberPayments[payment.membro_id] = {
-          count: 0,
-          total: 0
-        }
-      }
-      memberPayments[payment.membro_id].count++
-      memberPayments[payment.membro_id].total += payment.valor_pago
-    })
-
-    return { totalPaid, totalPayments, memberPayments }
-  }
+  // Filtro, ordenação (mais recentes primeiro) e totais num único passo,
+  // memoizados sobre a lista e os filtros
+  const membersById = selectMembersById(members)
+  const paymentsView = selectPaymentsView(allPayments, selectedMember, selectedStatus)
+  const filteredPayments = paymentsView.payments
+  const stats = paymentsView.stats
 
-  const stats = calculateStats()
+  // Só as linhas visíveis da tabela são montadas
+  const virtualRows = useVirtualRows(filteredPayments.length, { rowHeight: 57 })
 
   if (!selectedRepublic) {
     return (
@@ -275,14 +231,14 @@ function PaymentsSection({ selectedRepublic }) {
   }
 
   return (
-    <div className="payments-section">
+    <div className="payments-section" data-testid="section-pagamentos">
       {/* Modal Detalhes do Pagamento */}
       {showPaymentDetails && selectedPayment && paymentExpense && (
-        <div className="modal-overlay" onClick={() => setShowPaymentDetails(false)}>
+        <div className="modal-overlay" data-testid="payment-details-modal" onClick={() => setShowPaymentDetails(false)}>
           <div className="modal-content modal-small" onClick={(e) => e.stopPropagation()}>
             <div className="modal-header">
               <h2>Detalhes do Pagamento</h2>
-              <button className="modal-close" onClick={() => setShowPaymentDetails(false)}>
+              <button className="modal-close" data-testid="modal-close" onClick={() => setShowPaymentDetails(false)}>
                 <FontAwesomeIcon icon={faTimes} />
               </button>
             </div>
@@ -301,7 +257,7 @@ function PaymentsSection({ selectedRepublic }) {
                   </div>
                   <div className="payment-detail-row">
                     <span className="label">Membro:</span>
-                    <span className="value">{getMemberName(selectedPayment.membro_id)}</span>
+                    <span className="value">{memberName(membersById, selectedPayment.membro_id)}</span>
                   </div>
                 </div>
 
@@ -329,7 +285,7 @@ function PaymentsSection({ selectedRepublic }) {
                     <span className="label">Status:</span>
                     <span className="value">
                       {(() => {
-                        const status = getExpenseStatus(selectedPayment)
+                        const status = paymentStatus(selectedPayment)
                         if (status === 'pago') {
                           return (
                             <span className="status-badge-small paid">
@@ -360,7 +316,7 @@ function PaymentsSection({ selectedRepublic }) {
             </div>
 
             <div className="modal-footer">
-              <button type="button" className="btn-cancel" onClick={() => setShowPaymentDetails(false)}>
+              <button type="button" className="btn-cancel" data-testid="modal-cancel" onClick={() => setShowPaymentDetails(false)}>
                 Fechar
               </button>
             </div>
@@ -373,16 +329,23 @@ function PaymentsSection({ selectedRepublic }) {
         <h2>Pagamentos dos Membros</h2>
         <button 
           className="btn-add" 
-          onClick={fetchAllPayments}
-          disabled={loading}
+          data-testid="refresh-button"
+          onClick={() => fetchAllPayments(true)}
+          disabled={loading || paymentsProgress !== null}
           title="Atualizar dados"
         >
           <FontAwesomeIcon icon={faSync} style={{ marginRight: '0.5rem' }} />
-          {loading ? 'Atualizando...' : 'Atualizar'}
+          {loading || paymentsProgress ? 'Atualizando...' : 'Atualizar'}
         </button>
       </div>
 
-      {error && <div className="error-message">{error}</div>}
+      {error && <div className="error-message" data-testid="section-error">{error}</div>}
+
+      {paymentsProgress && paymentsProgress.total > 0 && (
+        <div className="payments-progress">
+          Carregando pagamentos... {paymentsProgress.done} de {paymentsProgress.total} despesas
+        </div>
+      )}
 
       {/* Estatísticas */}
       <div className="payments-stats">
@@ -474,7 +437,9 @@ function PaymentsSection({ selectedRepublic }) {
           <FontAwesomeIcon icon={faMoneyBill} style={{ fontSize: '3rem', color: '#ccc', marginBottom: '1rem' }} />
           <h3>Nenhum pagamento encontrado</h3>
           <p>
-            {allPayments.length === 0 
+            {paymentsProgress
+              ? 'Buscando pagamentos...'
+              : allPayments.length === 0 
               ? 'Ainda não há pagamentos registrados para esta república.'
               : 'Nenhum pagamento corresponde aos filtros selecionados.'}
           </p>
@@ -493,11 +458,14 @@ function PaymentsSection({ selectedRepublic }) {
                 <th>Ações</th>
               </tr>
             </thead>
-            <tbody>
+            <tbody ref={virtualRows.containerRef}>
+              {virtualRows.paddingTop > 0 && (
+                <tr className="virtual-spacer" style={{ height: virtualRows.paddingTop }}><td colSpan="7" /></tr>
+              )}
               {filteredPayments
-                .sort((a, b) => new Date(b.data_pagamento) - new Date(a.data_pagamento))
-                .map(payment => (
-                  <tr key={payment.id}>
+                .slice(virtualRows.start, virtualRows.end)
+                .map((payment, index) => (
+                  <tr key={payment.id} ref={index === 0 ? virtualRows.measureRef : undefined} data-testid="payment-row">
                     <td>
                       <div className="payment-date-cell">
                         <FontAwesomeIcon icon={faCalendar} style={{ marginRight: '0.5rem', color: '#6b7280' }} />
@@ -507,7 +475,7 @@ function PaymentsSection({ selectedRepublic }) {
                     <td>
                       <div className="payment-member-cell">
                         <FontAwesomeIcon icon={faUser} style={{ marginRight: '0.5rem', color: '#0050C3' }} />
-                        {getMemberName(payment.membro_id)}
+                        {memberName(membersById, payment.membro_id)}
                       </div>
                     </td>
                     <td>{payment.despesa_descricao}</td>
@@ -519,7 +487,7 @@ function PaymentsSection({ selectedRepublic }) {
                     </td>
                     <td>
                       {(() => {
-                        const status = getExpenseStatus(payment)
+                        const status = paymentsView.statusById.get(payment.id)
                         if (status === 'pago') {
                           return (
                             <span className="status-badge-small paid">
@@ -547,6 +515,7 @@ function PaymentsSection({ selectedRepublic }) {
                     <td>
                       <button
                         className="btn-icon btn-view"
+                        data-testid="details-button"
                         onClick={() => handleShowPaymentDetails(payment)}
                         title="Ver Detalhes"
                       >
@@ -555,6 +524,9 @@ function PaymentsSection({ selectedRepublic }) {
                     </td>
                   </tr>
                 ))}
+              {virtualRows.paddingBottom > 0 && (
+                <tr className="virtual-spacer" style={{ height: virtualRows.paddingBottom }}><td colSpan="7" /></tr>
+              )}
             </tbody>
           </table>
         </div>
@@ -569,7 +541,7 @@ function PaymentsSection({ selectedRepublic }) {
               <div key={memberId} className="member-summary-card">
                 <div className="member-summary-header">
                   <FontAwesomeIcon icon={faUser} />
-                  <span>{getMemberName(parseInt(memberId))}</span>
+                  <span>{memberName(membersById, parseInt(memberId))}</span>
                 </div>
                 <div className="member-summary-body">
                   <div className="summary-item">
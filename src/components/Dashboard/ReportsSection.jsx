@@ -1,5 +1,10 @@
-import { useState, useEffect } from 'react'
-import api from '../../services/api'
+import { useState, useEffect, useRef } from 'react'
+import { cachedGet } from '../../services/queryCache'
+import { useVirtualRows } from '../../hooks/useVirtualRows'
+import { expenseStatus } from '../../utils/selectors'
+import { selectReportIndex, selectReport } from '../../utils/reportQuery'
+import { streamRepublicPayments } from '../../services/payments'
+import { exportReport, downloadBlob, ExportCancelledError } from '../../services/reportExport'
 import { FontAwesomeIcon } from '@fortawesome/react-fontawesome'
 import { 
   faFileAlt,
@@ -9,12 +14,13 @@ import {
   faMoneyBill,
   faChartLine,
   faReceipt,
-  faHistory
+  faHistory,
+  faFileExcel,
+  faTimes
 } from '@fortawesome/free-solid-svg-icons'
 
 function ReportsSection({ selectedRepublic }) {
   const [expenses, setExpenses] = useState([])
-  const [filteredExpenses, setFilteredExpenses] = useState([])
   const [loading, setLoading] = useState(true)
   const [error, setError] = useState('')
   
@@ -22,6 +28,11 @@ function ReportsSection({ selectedRepublic }) {
   const [startDate, setStartDate] = useState('')
   const [endDate, setEndDate] = useState('')
   const [selectedCategory, setSelectedCategory] = useState('all')
+  const [selectedStatus, setSelectedStatus] = useState('all')
+
+  // Exportação em andamento: { format, stage, done, total }
+  const [exportProgress, setExportProgress] = useState(null)
+  const exportJobRef = useRef(null)
 
   // Mapeamento de categorias
   const categories = {
@@ -42,15 +53,15 @@ function ReportsSection({ selectedRepublic }) {
     try {
       setLoading(true)
       setError('')
-      const response = await api.get(`/despesas/${selectedRepublic}`)
+      const response = await cachedGet(`/despesas/${selectedRepublic}`, {
+        onUpdate: (res) => setExpenses(res.data.despesas || [])
+      })
       const allExpenses = response.data.despesas || []
       setExpenses(allExpenses)
-      setFilteredExpenses(allExpenses)
     } catch (err) {
       console.error('Erro ao buscar despesas:', err)
       if (err.response?.status === 404) {
         setExpenses([])
-        setFilteredExpenses([])
       } else {
         setError(err.response?.data?.detail || 'Erro ao carregar relatório')
       }
@@ -63,53 +74,11 @@ function ReportsSection({ selectedRepublic }) {
     fetchExpenses()
   }, [selectedRepublic])
 
-  // Aplicar filtros
-  useEffect(() => {
-    let filtered = [...expenses]
-
-    // Filtro por período
-    if (startDate) {
-      filtered = filtered.filter(exp => {
-        const expDate = new Date(exp.data_vencimento)
-        const start = new Date(startDate)
-        return expDate >= start
-      })
-    }
-
-    if (endDate) {
-      filtered = filtered.filter(exp => {
-        const expDate = new Date(exp.data_vencimento)
-        const end = new Date(endDate)
-        end.setHours(23, 59, 59, 999) // Incluir o dia todo
-        return expDate <= end
-      })
-    }
-
-    // Filtro por categoria
-    if (selectedCategory !== 'all') {
-      filtered = filtered.filter(exp => exp.categoria === selectedCategory)
-    }
-
-    setFilteredExpenses(filtered)
-  }, [startDate, endDate, selectedCategory, expenses])
-
-  // Calcular totais
-  const calculateTotals = () => {
-    const total = filteredExpenses.reduce((sum, exp) => sum + exp.valor_total, 0)
-    const paid = filteredExpenses.filter(exp => exp.status.toLowerCase() === 'pago')
-    const totalPaid = paid.reduce((sum, exp) => sum + exp.valor_total, 0)
-    const pending = total - totalPaid
-
-    return {
-      total,
-      totalPaid,
-      pending,
-      count: filteredExpenses.length,
-      paidCount: paid.length
-    }
-  }
-
-  const totals = calculateTotals()
+  // Índice montado quando as despesas chegam; filtros só consultam o índice
+  const reportIndex = selectReportIndex(expenses)
+  const report = selectReport(reportIndex, startDate, endDate, selectedCategory, selectedStatus)
+  const filteredExpenses = report.rows
+  const totals = report.totals
 
   // Formatar data (apenas data, sem conversão de timezone)
   const formatDate = (dateString) => {
@@ -130,53 +99,64 @@ function ReportsSection({ selectedRepublic }) {
     }).format(value)
   }
 
-  // Exportar para CSV
-  const exportToCSV = () => {
+  // Exportar CSV ou XLSX num Web Worker, com progresso e cancelamento.
+  // O XLSX inclui os pagamentos de cada membro, buscados antes da geração.
+  const handleExport = async (format) => {
     if (filteredExpenses.length === 0) {
       alert('Não há dados para exportar')
       return
     }
 
-    // Cabeçalho do CSV
-    const headers = ['Data Vencimento', 'Descrição', 'Categoria', 'Valor Total', 'Status']
-    
-    // Dados
-    const rows = filteredExpenses.map(exp => [
-      formatDate(exp.data_vencimento),
-      exp.descricao,
-      categories[exp.categoria] || exp.categoria,
-      formatCurrency(exp.valor_total),
-      exp.status.toLowerCase() === 'pago' ? 'Pago' : 
-      exp.status.toLowerCase() === 'vencida' ? 'Vencida' : 'Pendente'
-    ])
-
-    // Adicionar linha de totais
-    rows.push([])
-    rows.push(['TOTAIS', '', '', '', ''])
-    rows.push(['Total Geral', '', '', formatCurrency(totals.total), ''])
-    rows.push(['Total Pago', '', '', formatCurrency(totals.totalPaid), ''])
-    rows.push(['Total Pendente', '', '', formatCurrency(totals.pending), ''])
-    rows.push(['Quantidade de Despesas', '', '', totals.count, ''])
-
-    // Converter para CSV
-    const csvContent = [
-      headers.join(','),
-      ...rows.map(row => row.map(cell => `"${cell}"`).join(','))
-    ].join('\n')
-
-    // Download
-    const blob = new Blob([csvContent], { type: 'text/csv;charset=utf-8;' })
-    const link = document.createElement('a')
-    const url = URL.createObjectURL(blob)
-    
-    const fileName = `relatorio_despesas_${startDate || 'inicio'}_${endDate || 'fim'}.csv`
-    
-    link.setAttribute('href', url)
-    link.setAttribute('download', fileName)
-    link.style.visibility = 'hidden'
-    document.body.appendChild(link)
-    link.click()
-    document.body.removeChild(link)
+    let cancelled = false
+    exportJobRef.current = {
+      cancel: () => {
+        cancelled = true
+      }
+    }
+    setExportProgress({ format, stage: format === 'xlsx' ? 'payments' : 'file', done: 0, total: filteredExpenses.length })
+
+    try {
+      let members = []
+      const payments = []
+      if (format === 'xlsx') {
+        const membersResponse = await cachedGet(`/membros/${selectedRepublic}`)
+        members = membersResponse.data.members || []
+        await streamRepublicPayments(selectedRepublic, filteredExpenses, {
+          onBatch: (batch) => payments.push(...batch),
+          onProgress: (done, total) => setExportProgress({ format, stage: 'payments', done, total }),
+          isCancelled: () => cancelled
+        })
+        if (cancelled) return
+      }
+
+      const job = exportReport(format, {
+        expenses: filteredExpenses,
+        payments,
+        members,
+        categories,
+        totals
+      }, {
+        onProgress: (done, total) => setExportProgress({ format, stage: 'file', done, total })
+      })
+      exportJobRef.current = job
+
+      const blob = await job.promise
+      downloadBlob(blob, `relatorio_despesas_${startDate || 'inicio'}_${endDate || 'fim'}.${format}`)
+    } catch (err) {
+      if (!(err instanceof ExportCancelledError)) {
+        console.error('Erro ao exportar relatório:', err)
+        setError('Erro ao exportar relatório')
+      }
+    } finally {
+      exportJobRef.current = null
+      setExportProgress(null)
+    }
+  }
+
+  const cancelExport = () => {
+    if (exportJobRef.current) {
+      exportJobRef.current.cancel()
+    }
   }
 
   // Limpar filtros
@@ -184,8 +164,12 @@ function ReportsSection({ selectedRepublic }) {
     setStartDate('')
     setEndDate('')
     setSelectedCategory('all')
+    setSelectedStatus('all')
   }
 
+  // Só as linhas visíveis da tabela são montadas
+  const virtualRows = useVirtualRows(filteredExpenses.length, { rowHeight: 53 })
+
   if (!selectedRepublic) {
     return (
       <div className="empty-state">
@@ -205,7 +189,7 @@ function ReportsSection({ selectedRepublic }) {
   }
 
   return (
-    <div className="reports-section">
+    <div className="reports-section" data-testid="section-resumo">
       {/* Cabeçalho */}
       <div className="section-header">
         <div>
@@ -216,7 +200,7 @@ function ReportsSection({ selectedRepublic }) {
         </div>
       </div>
 
-      {error && <div className="error-message">{error}</div>}
+      {error && <div className="error-message" data-testid="section-error">{error}</div>}
 
       {/* Filtros */}
       <div className="reports-filters">
@@ -269,16 +253,52 @@ function ReportsSection({ selectedRepublic }) {
             </select>
           </div>
 
+          <div className="filter-group">
+            <label htmlFor="status">
+              <FontAwesomeIcon icon={faChartLine} style={{ marginRight: '0.5rem' }} />
+              Status:
+            </label>
+            <select
+              id="status"
+              value={selectedStatus}
+              onChange={(e) => setSelectedStatus(e.target.value)}
+            >
+              <option value="all">Todos os Status</option>
+              <option value="pago">Pago</option>
+              <option value="pendente">Pendente</option>
+              <option value="vencida">Vencida</option>
+            </select>
+          </div>
+
           <div className="filter-actions">
-            <button className="btn-secondary" onClick={clearFilters}>
+            <button className="btn-secondary" data-testid="clear-filters" onClick={clearFilters}>
               Limpar Filtros
             </button>
-            <button className="btn-download" onClick={exportToCSV} disabled={filteredExpenses.length === 0}>
+            <button className="btn-download" data-testid="export-csv" onClick={() => handleExport('csv')} disabled={filteredExpenses.length === 0 || exportProgress !== null}>
               <FontAwesomeIcon icon={faDownload} style={{ marginRight: '0.5rem' }} />
               Download CSV
             </button>
+            <button className="btn-download" data-testid="export-xlsx" onClick={() => handleExport('xlsx')} disabled={filteredExpenses.length === 0 || exportProgress !== null}>
+              <FontAwesomeIcon icon={faFileExcel} style={{ marginRight: '0.5rem' }} />
+              Download XLSX
+            </button>
           </div>
         </div>
+
+        {exportProgress && (
+          <div className="export-progress">
+            <span>
+              {exportProgress.stage === 'payments'
+                ? `Buscando pagamentos... ${exportProgress.done} de ${exportProgress.total} despesas`
+                : `Gerando ${exportProgress.format.toUpperCase()}... ${exportProgress.total > 0 ? Math.round(exportProgress.done / exportProgress.total * 100) : 0}%`}
+            </span>
+            <progress value={exportProgress.done} max={exportProgress.total || 1} />
+            <button className="btn-secondary" data-testid="export-cancel" onClick={cancelExport}>
+              <FontAwesomeIcon icon={faTimes} style={{ marginRight: '0.5rem' }} />
+              Cancelar
+            </button>
+          </div>
+        )}
       </div>
 
       {/* Estatísticas */}
@@ -351,11 +371,14 @@ function ReportsSection({ selectedRepublic }) {
                 <th>Status</th>
               </tr>
             </thead>
-            <tbody>
+            <tbody ref={virtualRows.containerRef}>
+              {virtualRows.paddingTop > 0 && (
+                <tr className="virtual-spacer" style={{ height: virtualRows.paddingTop }}><td colSpan="5" /></tr>
+              )}
               {filteredExpenses
-                .sort((a, b) => new Date(b.data_vencimento) - new Date(a.data_vencimento))
-                .map(expense => (
-                  <tr key={expense.id}>
+                .slice(virtualRows.start, virtualRows.end)
+                .map((expense, index) => (
+                  <tr key={expense.id} ref={index === 0 ? virtualRows.measureRef : undefined} data-testid="report-row">
                     <td>
                       <div className="date-cell">
                         <FontAwesomeIcon icon={faCalendar} style={{ marginRight: '0.5rem', color: '#6b7280' }} />
@@ -371,7 +394,7 @@ function ReportsSection({ selectedRepublic }) {
                     </td>
                     <td>
                       {(() => {
-                        const status = expense.status.toLowerCase()
+                        const status = expenseStatus(expense)
                         if (status === 'pago') {
                           return (
                             <span className="status-badge-small paid">
@@ -395,6 +418,9 @@ function ReportsSection({ selectedRepublic }) {
                     </td>
                   </tr>
                 ))}
+              {virtualRows.paddingBottom > 0 && (
+                <tr className="virtual-spacer" style={{ height: virtualRows.paddingBottom }}><td colSpan="5" /></tr>
+              )}
             </tbody>
             <tfoot>
               <tr className="totals-row">
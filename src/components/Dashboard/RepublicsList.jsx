@@ -1,12 +1,19 @@
 import { FontAwesomeIcon } from '@fortawesome/react-fontawesome'
 import { faHome, faPlus } from '@fortawesome/free-solid-svg-icons'
+import { CreateRepublicModal, prefetchSection } from './lazySections'
 
 function RepublicsList({ republicas, selectedRepublic, onSelectRepublic, onCreateClick, membersCount = {} }) {
   return (
-    <div className="republics-section">
+    <div className="republics-section" data-testid="section-republicas">
       <div className="section-header">
         <h2>Minhas Repúblicas</h2>
-        <button className="btn-add" onClick={onCreateClick}>
+        <button
+          className="btn-add"
+          data-testid="add-button"
+          onClick={onCreateClick}
+          onMouseEnter={CreateRepublicModal.prefetch}
+          onFocus={CreateRepublicModal.prefetch}
+        >
           <FontAwesomeIcon icon={faPlus} style={{ marginRight: '0.5rem' }} />
           Criar Nova República
         </button>
@@ -25,14 +32,16 @@ function RepublicsList({ republicas, selectedRepublic, onSelectRepublic, onCreat
             return (
               <div 
                 key={republic.id} 
+                data-testid="republic-card"
                 className={`republic-card ${selectedRepublic === republic.id ? 'selected' : ''}`}
                 onClick={() => onSelectRepublic(republic.id)}
+                onMouseEnter={() => prefetchSection('resumo')}
               >
                 <div className="republic-icon">
                   <FontAwesomeIcon icon={faHome} />
                 </div>
                 <div className="republic-info">
-                  <h3>{republic.nome}</h3>
+                  <h3 data-testid="republic-name">{republic.nome}</h3>
                   <p>{memberCount} {memberCount === 1 ? 'membro' : 'membros'}</p>
                 </div>
                 <div className="republic-actions">
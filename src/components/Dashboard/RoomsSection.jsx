@@ -1,5 +1,7 @@
 import { useState, useEffect } from 'react'
 import api from '../../services/api'
+import { cachedGet } from '../../services/queryCache'
+import { useOptimisticList } from '../../hooks/useOptimisticList'
 import { FontAwesomeIcon } from '@fortawesome/react-fontawesome'
 import { faPlus, faEdit, faTrash, faTimes, faDoorOpen, faUserPlus, faExchangeAlt } from '@fortawesome/free-solid-svg-icons'
 
@@ -27,6 +29,10 @@ function RoomsSection({ selectedRepublic }) {
   
   const [formError, setFormError] = useState('')
 
+  // Mudanças aparecem na hora e são desfeitas se a API recusar
+  const optimisticRooms = useOptimisticList(setRooms, { onError: setError, refresh: () => fetchRooms() })
+  const optimisticMembers = useOptimisticList(setMembers, { onError: setError })
+
   // Buscar quartos
   const fetchRooms = async () => {
     if (!selectedRepublic) return
@@ -34,7 +40,9 @@ function RoomsSection({ selectedRepublic }) {
     try {
       setLoading(true)
       setError('')
-      const response = await api.get(`/quartos/?republica_id=${selectedRepublic}`)
+      const response = await cachedGet(`/quartos/?republica_id=${selectedRepublic}`, {
+        onUpdate: (res) => setRooms(res.data.quartos || [])
+      })
       setRooms(response.data.quartos || [])
     } catch (err) {
       console.error('Erro ao buscar quartos:', err)
@@ -53,7 +61,9 @@ function RoomsSection({ selectedRepublic }) {
     if (!selectedRepublic) return
 
     try {
-      const response = await api.get(`/membros/${selectedRepublic}`)
+      const response = await cachedGet(`/membros/${selectedRepublic}`, {
+        onUpdate: (res) => setMembers(res.data.members || [])
+      })
       setMembers(response.data.members || [])
     } catch (err) {
       console.error('Erro ao buscar membros:', err)
@@ -75,18 +85,23 @@ function RoomsSection({ selectedRepublic }) {
       return
     }
 
-    try {
-      await api.post(`/quartos/?republica_id=${selectedRepublic}`, {
-        numero: roomNumber
-      })
-      
-      await fetchRooms()
-      setShowCreateModal(false)
-      setRoomNumber('')
-    } catch (err) {
-      console.error('Erro ao criar quarto:', err)
-      setFormError(err.response?.data?.detail || 'Erro ao criar quarto')
-    }
+    const numero = roomNumber
+    setShowCreateModal(false)
+    setRoomNumber('')
+    setError('')
+    await optimisticRooms.create(
+      { numero, republica_id: selectedRepublic },
+      () => api.post(`/quartos/?republica_id=${selectedRepublic}`, { numero }),
+      {
+        errorMessage: 'Erro ao criar quarto',
+        // Recusa do backend (ex.: número repetido): o modal volta com o que foi digitado
+        onRejected: (message) => {
+          setRoomNumber(numero)
+          setFormError(message)
+          setShowCreateModal(true)
+        }
+      }
+    )
   }
 
   // Editar quarto
@@ -99,36 +114,43 @@ function RoomsSection({ selectedRepublic }) {
       return
     }
 
-    try {
-      await api.patch(
-        `/quartos/${editingRoom.id}?republica_id=${selectedRepublic}`,
-        { numero: roomNumber }
-      )
-      
-      await fetchRooms()
-      setShowEditModal(false)
-      setEditingRoom(null)
-      setRoomNumber('')
-    } catch (err) {
-      console.error('Erro ao editar quarto:', err)
-      setFormError(err.response?.data?.detail || 'Erro ao editar quarto')
-    }
+    const room = editingRoom
+    const roomId = room.id
+    const numero = roomNumber
+    setShowEditModal(false)
+    setEditingRoom(null)
+    setRoomNumber('')
+    setError('')
+    await optimisticRooms.update(
+      roomId,
+      { numero },
+      () => api.patch(`/quartos/${roomId}?republica_id=${selectedRepublic}`, { numero }),
+      {
+        errorMessage: 'Erro ao editar quarto',
+        onRejected: (message) => {
+          setEditingRoom(room)
+          setRoomNumber(numero)
+          setFormError(message)
+          setShowEditModal(true)
+        }
+      }
+    )
   }
 
   // Excluir quarto
   const handleDeleteRoom = async () => {
-    try {
-      await api.delete(`/quartos/${roomToDelete.id}?republica_id=${selectedRepublic}`)
-      await fetchRooms()
-      setShowDeleteModal(false)
-      setRoomToDelete(null)
-    } catch (err) {
-      console.error('Erro ao excluir quarto:', err)
-      setError(err.response?.data?.detail || 'Erro ao excluir quarto')
-    }
+    const roomId = roomToDelete.id
+    setShowDeleteModal(false)
+    setRoomToDelete(null)
+    setError('')
+    await optimisticRooms.remove(
+      roomId,
+      () => api.delete(`/quartos/${roomId}?republica_id=${selectedRepublic}`),
+      { errorMessage: 'Erro ao excluir quarto' }
+    )
   }
 
-  // Adicionar membro ao quarto
+  // Adicionar membro ao quarto (o quarto do membro é o quarto_id dele)
   const handleAddMember = async (e) => {
     e.preventDefault()
     setFormError('')
@@ -138,20 +160,29 @@ function RoomsSection({ selectedRepublic }) {
       return
     }
 
-    try {
-      await api.patch(`/quartos/${selectedRoom.id}/membros`, {
-        membro_id: parseInt(selectedMemberId)
-      })
-      
-      await fetchRooms()
-      await fetchMembers()
-      setShowAddMemberModal(false)
-      setSelectedRoom(null)
-      setSelectedMemberId('')
-    } catch (err) {
-      console.error('Erro ao adicionar membro:', err)
-      setFormError(err.response?.data?.detail || 'Erro ao adicionar membro ao quarto')
-    }
+    const room = selectedRoom
+    const roomId = room.id
+    const memberId = parseInt(selectedMemberId)
+    setShowAddMemberModal(false)
+    setSelectedRoom(null)
+    setSelectedMemberId('')
+    setError('')
+    await optimisticMembers.update(
+      memberId,
+      { quarto_id: roomId },
+      () => api.patch(`/quartos/${roomId}/membros`, { membro_id: memberId }),
+      {
+        errorMessage: 'Erro ao adicionar membro ao quarto',
+        // A resposta é do quarto, não do membro: fica o quarto_id otimista
+        fromResponse: (_, item) => item,
+        onRejected: (message) => {
+          setSelectedRoom(room)
+          setSelectedMemberId(String(memberId))
+          setFormError(message)
+          setShowAddMemberModal(true)
+        }
+      }
+    )
   }
 
   // Transferir membro de quarto
@@ -171,28 +202,37 @@ function RoomsSection({ selectedRepublic }) {
       return
     }
 
-    try {
-      await api.delete(
-        `/quartos/${memberToTransfer.quarto_id}/membros/${memberToTransfer.id}?novo_quarto_id=${newRoomId}`
-      )
-      
-      await fetchRooms()
-      await fetchMembers()
-      setShowTransferModal(false)
-      setMemberToTransfer(null)
-      setNewRoomId('')
-    } catch (err) {
-      console.error('Erro ao transferir membro:', err)
-      
-      // Tratamento específico para quarto ocupado
-      if (err.response?.status === 409) {
-        setFormError('⚠️ Este quarto já está ocupado. Por favor, selecione um quarto vazio.')
-      } else if (err.response?.status === 404) {
-        setFormError('Quarto não encontrado. Por favor, atualize a página e tente novamente.')
-      } else {
-        setFormError(err.response?.data?.detail || 'Erro ao transferir membro. Tente novamente.')
+    const member = memberToTransfer
+    const targetRoomId = parseInt(newRoomId)
+    setShowTransferModal(false)
+    setMemberToTransfer(null)
+    setNewRoomId('')
+    setError('')
+    await optimisticMembers.update(
+      member.id,
+      { quarto_id: targetRoomId },
+      () => api.delete(`/quartos/${member.quarto_id}/membros/${member.id}?novo_quarto_id=${targetRoomId}`),
+      {
+        fromResponse: (_, item) => item,
+        // Quarto ocupado (409) e afins aparecem no modal, com o destino escolhido
+        onRejected: (message) => {
+          setMemberToTransfer(member)
+          setNewRoomId(String(targetRoomId))
+          setFormError(message)
+          setShowTransferModal(true)
+        },
+        errorMessage: (err) => {
+          // Tratamento específico para quarto ocupado
+          if (err.response?.status === 409) {
+            return '⚠️ Este quarto já está ocupado. Por favor, selecione um quarto vazio.'
+          }
+          if (err.response?.status === 404) {
+            return 'Quarto não encontrado. Por favor, atualize a página e tente novamente.'
+          }
+          return err.response?.data?.detail || 'Erro ao transferir membro. Tente novamente.'
+        }
       }
-    }
+    )
   }
 
   // Abrir modais
@@ -263,20 +303,20 @@ function RoomsSection({ selectedRepublic }) {
   }
 
   return (
-    <div className="rooms-section">
+    <div className="rooms-section" data-testid="section-quartos">
       {/* Modal Criar Quarto */}
       {showCreateModal && (
-        <div className="modal-overlay" onClick={() => setShowCreateModal(false)}>
+        <div className="modal-overlay" data-testid="room-create-modal" onClick={() => setShowCreateModal(false)}>
           <div className="modal-content modal-small" onClick={(e) => e.stopPropagation()}>
             <div className="modal-header">
               <h2>Adicionar Quarto</h2>
-              <button className="modal-close" onClick={() => setShowCreateModal(false)}>
+              <button className="modal-close" data-testid="modal-close" onClick={() => setShowCreateModal(false)}>
                 <FontAwesomeIcon icon={faTimes} />
               </button>
             </div>
 
             <form onSubmit={handleCreateRoom} className="modal-form">
-              {formError && <div className="error-message">{formError}</div>}
+              {formError && <div className="error-message" data-testid="modal-error">{formError}</div>}
 
               <div className="form-group">
                 <label htmlFor="roomNumber">Número do Quarto *</label>
@@ -291,10 +331,10 @@ function RoomsSection({ selectedRepublic }) {
               </div>
 
               <div className="modal-footer">
-                <button type="button" className="btn-cancel" onClick={() => setShowCreateModal(false)}>
+                <button type="button" className="btn-cancel" data-testid="modal-cancel" onClick={() => setShowCreateModal(false)}>
                   Cancelar
                 </button>
-                <button type="submit" className="btn-submit">
+                <button type="submit" className="btn-submit" data-testid="modal-submit">
                   <FontAwesomeIcon icon={faPlus} style={{ marginRight: '0.5rem' }} />
                   Adicionar
                 </button>
@@ -306,17 +346,17 @@ function RoomsSection({ selectedRepublic }) {
 
       {/* Modal Editar Quarto */}
       {showEditModal && (
-        <div className="modal-overlay" onClick={() => setShowEditModal(false)}>
+        <div className="modal-overlay" data-testid="room-edit-modal" onClick={() => setShowEditModal(false)}>
           <div className="modal-content modal-small" onClick={(e) => e.stopPropagation()}>
             <div className="modal-header">
               <h2>Editar Quarto</h2>
-              <button className="modal-close" onClick={() => setShowEditModal(false)}>
+              <button className="modal-close" data-testid="modal-close" onClick={() => setShowEditModal(false)}>
                 <FontAwesomeIcon icon={faTimes} />
               </button>
             </div>
 
             <form onSubmit={handleEditRoom} className="modal-form">
-              {formError && <div className="error-message">{formError}</div>}
+              {formError && <div className="error-message" data-testid="modal-error">{formError}</div>}
 
               <div className="form-group">
                 <label htmlFor="editRoomNumber">Número do Quarto *</label>
@@ -331,10 +371,10 @@ function RoomsSection({ selectedRepublic }) {
               </div>
 
               <div className="modal-footer">
-                <button type="button" className="btn-cancel" onClick={() => setShowEditModal(false)}>
+                <button type="button" className="btn-cancel" data-testid="modal-cancel" onClick={() => setShowEditModal(false)}>
                   Cancelar
                 </button>
-                <button type="submit" className="btn-submit">
+                <button type="submit" className="btn-submit" data-testid="modal-submit">
                   <FontAwesomeIcon icon={faEdit} style={{ marginRight: '0.5rem' }} />
                   Salvar
                 </button>
@@ -346,11 +386,11 @@ function RoomsSection({ selectedRepublic }) {
 
       {/* Modal Excluir Quarto */}
       {showDeleteModal && (
-        <div className="modal-overlay" onClick={() => setShowDeleteModal(false)}>
+        <div className="modal-overlay" data-testid="room-delete-modal" onClick={() => setShowDeleteModal(false)}>
           <div className="modal-content modal-small modal-confirm" onClick={(e) => e.stopPropagation()}>
             <div className="modal-header">
               <h2>Excluir Quarto</h2>
-              <button className="modal-close" onClick={() => setShowDeleteModal(false)}>
+              <button className="modal-close" data-testid="modal-close" onClick={() => setShowDeleteModal(false)}>
                 <FontAwesomeIcon icon={faTimes} />
               </button>
             </div>
@@ -368,10 +408,10 @@ function RoomsSection({ selectedRepublic }) {
             </div>
 
             <div className="modal-footer">
-              <button type="button" className="btn-cancel" onClick={() => setShowDeleteModal(false)}>
+              <button type="button" className="btn-cancel" data-testid="modal-cancel" onClick={() => setShowDeleteModal(false)}>
                 Cancelar
               </button>
-              <button type="button" className="btn-delete-confirm" onClick={handleDeleteRoom}>
+              <button type="button" className="btn-delete-confirm" data-testid="modal-submit" onClick={handleDeleteRoom}>
                 <FontAwesomeIcon icon={faTrash} style={{ marginRight: '0.5rem' }} />
                 Excluir Quarto
               </button>
@@ -382,17 +422,17 @@ function RoomsSection({ selectedRepublic }) {
 
       {/* Modal Adicionar Membro ao Quarto */}
       {showAddMemberModal && (
-        <div className="modal-overlay" onClick={() => setShowAddMemberModal(false)}>
+        <div className="modal-overlay" data-testid="room-add-member-modal" onClick={() => setShowAddMemberModal(false)}>
           <div className="modal-content modal-small" onClick={(e) => e.stopPropagation()}>
             <div className="modal-header">
               <h2>Adicionar Membro ao Quarto {selectedRoom?.numero}</h2>
-              <button className="modal-close" onClick={() => setShowAddMemberModal(false)}>
+              <button className="modal-close" data-testid="modal-close" onClick={() => setShowAddMemberModal(false)}>
                 <FontAwesomeIcon icon={faTimes} />
               </button>
             </div>
 
             <form onSubmit={handleAddMember} className="modal-form">
-              {formError && <div className="error-message">{formError}</div>}
+              {formError && <div className="error-message" data-testid="modal-error">{formError}</div>}
 
               <div className="form-group">
                 <label htmlFor="memberId">Selecione o Membro *</label>
@@ -412,10 +452,10 @@ function RoomsSection({ selectedRepublic }) {
               </div>
 
               <div className="modal-footer">
-                <button type="button" className="btn-cancel" onClick={() => setShowAddMemberModal(false)}>
+                <button type="button" className="btn-cancel" data-testid="modal-cancel" onClick={() => setShowAddMemberModal(false)}>
                   Cancelar
                 </button>
-                <button type="submit" className="btn-submit">
+                <button type="submit" className="btn-submit" data-testid="modal-submit">
                   <FontAwesomeIcon icon={faUserPlus} style={{ marginRight: '0.5rem' }} />
                   Adicionar
                 </button>
@@ -427,17 +467,17 @@ function RoomsSection({ selectedRepublic }) {
 
       {/* Modal Transferir Membro */}
       {showTransferModal && (
-        <div className="modal-overlay" onClick={() => setShowTransferModal(false)}>
+        <div className="modal-overlay" data-testid="room-transfer-modal" onClick={() => setShowTransferModal(false)}>
           <div className="modal-content modal-small" onClick={(e) => e.stopPropagation()}>
             <div className="modal-header">
               <h2>Transferir Membro</h2>
-              <button className="modal-close" onClick={() => setShowTransferModal(false)}>
+              <button className="modal-close" data-testid="modal-close" onClick={() => setShowTransferModal(false)}>
                 <FontAwesomeIcon icon={faTimes} />
               </button>
             </div>
 
             <form onSubmit={handleTransferMember} className="modal-form">
-              {formError && <div className="error-message">{formError}</div>}
+              {formError && <div className="error-message" data-testid="modal-error">{formError}</div>}
 
               <div className="form-group">
                 <label>Membro</label>
@@ -478,10 +518,10 @@ function RoomsSection({ selectedRepublic }) {
               </div>
 
               <div className="modal-footer">
-                <button type="button" className="btn-cancel" onClick={() => setShowTransferModal(false)}>
+                <button type="button" className="btn-cancel" data-testid="modal-cancel" onClick={() => setShowTransferModal(false)}>
                   Cancelar
                 </button>
-                <button type="submit" className="btn-submit">
+                <button type="submit" className="btn-submit" data-testid="modal-submit">
                   <FontAwesomeIcon icon={faExchangeAlt} style={{ marginRight: '0.5rem' }} />
                   Transferir
                 </button>
@@ -494,13 +534,13 @@ function RoomsSection({ selectedRepublic }) {
       {/* Conteúdo Principal */}
       <div className="section-header">
         <h2>Quartos</h2>
-        <button className="btn-add" onClick={openCreateModal}>
+        <button className="btn-add" data-testid="add-button" onClick={openCreateModal}>
           <FontAwesomeIcon icon={faPlus} style={{ marginRight: '0.5rem' }} />
           Adicionar Quarto
         </button>
       </div>
 
-      {error && <div className="error-message">{error}</div>}
+      {error && <div className="error-message" data-testid="section-error">{error}</div>}
 
       {rooms.length === 0 ? (
         <div className="empty-state">
@@ -513,7 +553,7 @@ function RoomsSection({ selectedRepublic }) {
           {rooms.map(room => {
             const member = getRoomMember(room.id)
             return (
-              <div key={room.id} className="room-card">
+              <div key={room.id} data-testid="room-card" className={`room-card${room.pending || member?.pending ? ' optimistic-pending' : ''}`}>
                 <div className="room-header">
                   <div className="room-number">
                     <FontAwesomeIcon icon={faDoorOpen} />
@@ -522,15 +562,19 @@ function RoomsSection({ selectedRepublic }) {
                   <div className="room-actions">
                     <button
                       className="btn-icon btn-edit"
+                      data-testid="edit-button"
                       onClick={() => openEditModal(room)}
                       title="Editar quarto"
+                      disabled={room.pending}
                     >
                       <FontAwesomeIcon icon={faEdit} />
                     </button>
                     <button
                       className="btn-icon btn-delete"
+                      data-testid="delete-button"
                       onClick={() => openDeleteModal(room)}
                       title="Excluir quarto"
+                      disabled={room.pending}
                     >
                       <FontAwesomeIcon icon={faTrash} />
                     </button>
@@ -547,8 +591,10 @@ function RoomsSection({ selectedRepublic }) {
                       </div>
                       <button
                         className="btn-transfer"
+                        data-testid="transfer-button"
                         onClick={() => openTransferModal(member)}
                         title="Transferir para outro quarto"
+                        disabled={member.pending}
                       >
                         <FontAwesomeIcon icon={faExchangeAlt} />
                         Transferir
@@ -559,7 +605,9 @@ function RoomsSection({ selectedRepublic }) {
                       <p>Quarto vazio</p>
                       <button
                         className="btn-add-member"
+                        data-testid="add-member-button"
                         onClick={() => openAddMemberModal(room)}
+                        disabled={room.pending}
                       >
                         <FontAwesomeIcon icon={faUserPlus} style={{ marginRight: '0.5rem' }} />
                         Adicionar Membro
@@ -9,10 +9,17 @@ import {
   faUser,
   faBuilding
 } from '@fortawesome/free-solid-svg-icons'
+import { prefetchSection } from './lazySections'
+
+// Baixar o chunk da seção quando o item do menu recebe hover ou foco
+const prefetchOn = (menu) => ({
+  onMouseEnter: () => prefetchSection(menu),
+  onFocus: () => prefetchSection(menu)
+})
 
 function Sidebar({ currentRepublic, activeMenu, setActiveMenu, onLogout, loading }) {
   return (
-    <aside className="sidebar">
+    <aside className="sidebar" data-testid="sidebar">
       <div className="sidebar-header">
         <div className="logo">
           <div className="logo-icon">
@@ -26,6 +33,7 @@ function Sidebar({ currentRepublic, activeMenu, setActiveMenu, onLogout, loading
       <nav className="sidebar-nav">
         <button 
           className={`nav-item ${activeMenu === 'republicas' ? 'active' : ''}`}
+          data-testid="nav-republicas"
           onClick={() => setActiveMenu('republicas')}
         >
           <FontAwesomeIcon icon={faBuilding} />
@@ -36,7 +44,9 @@ function Sidebar({ currentRepublic, activeMenu, setActiveMenu, onLogout, loading
         
         <button 
           className={`nav-item ${activeMenu === 'resumo' ? 'active' : ''}`}
+          data-testid="nav-resumo"
           onClick={() => setActiveMenu('resumo')}
+          {...prefetchOn('resumo')}
         >
           <FontAwesomeIcon icon={faChartLine} />
           <span>Resumo</span>
@@ -44,7 +54,9 @@ function Sidebar({ currentRepublic, activeMenu, setActiveMenu, onLogout, loading
         
         <button 
           className={`nav-item ${activeMenu === 'despesas' ? 'active' : ''}`}
+          data-testid="nav-despesas"
           onClick={() => setActiveMenu('despesas')}
+          {...prefetchOn('despesas')}
         >
           <FontAwesomeIcon icon={faReceipt} />
           <span>Despesas</span>
@@ -52,7 +64,9 @@ function Sidebar({ currentRepublic, activeMenu, setActiveMenu, onLogout, loading
         
         <button 
           className={`nav-item ${activeMenu === 'pagamentos' ? 'active' : ''}`}
+          data-testid="nav-pagamentos"
           onClick={() => setActiveMenu('pagamentos')}
+          {...prefetchOn('pagamentos')}
         >
           <FontAwesomeIcon icon={faCreditCard} />
           <span>Pagamentos</span>
@@ -60,7 +74,9 @@ function Sidebar({ currentRepublic, activeMenu, setActiveMenu, onLogout, loading
         
         <button 
           className={`nav-item ${activeMenu === 'quartos' ? 'active' : ''}`}
+          data-testid="nav-quartos"
           onClick={() => setActiveMenu('quartos')}
+          {...prefetchOn('quartos')}
         >
           <FontAwesomeIcon icon={faDoorOpen} />
           <span>Quartos</span>
@@ -68,7 +84,9 @@ function Sidebar({ currentRepublic, activeMenu, setActiveMenu, onLogout, loading
         
         <button 
           className={`nav-item ${activeMenu === 'membros' ? 'active' : ''}`}
+          data-testid="nav-membros"
           onClick={() => setActiveMenu('membros')}
+          {...prefetchOn('membros')}
         >
           <FontAwesomeIcon icon={faUser} />
           <span>Membros</span>
@@ -76,7 +94,9 @@ function Sidebar({ currentRepublic, activeMenu, setActiveMenu, onLogout, loading
         
         <button 
           className={`nav-item ${activeMenu === 'perfil' ? 'active' : ''}`}
+          data-testid="nav-perfil"
           onClick={() => setActiveMenu('perfil')}
+          {...prefetchOn('perfil')}
         >
           <FontAwesomeIcon icon={faUser} />
           <span>Perfil</span>
@@ -84,7 +104,7 @@ function Sidebar({ currentRepublic, activeMenu, setActiveMenu, onLogout, loading
       </nav>
 
       <div className="sidebar-footer">
-        <button onClick={onLogout} className="nav-item logout-btn" disabled={loading}>
+        <button onClick={onLogout} className="nav-item logout-btn" data-testid="nav-logout" disabled={loading}>
           <FontAwesomeIcon icon={faSignOutAlt} />
           <span>{loading ? 'Saindo...' : 'Sair'}</span>
         </button>
@@ -1,8 +1,7 @@
 export { default as Sidebar } from './Sidebar'
-export { default as CreateRepublicModal } from './CreateRepublicModal'
 export { default as RepublicsList } from './RepublicsList'
 export { default as SummaryCards } from './SummaryCards'
 export { default as ExpensesList } from './ExpensesList'
 export { default as DashboardContent } from './DashboardContent'
-export { default as MembersSection } from './MembersSection'
-export { default as ReportsSection } from './ReportsSection'
+// Seções e modal carregados sob demanda (chunks separados)
+export { CreateRepublicModal, MembersSection, ReportsSection, prefetchSection } from './lazySections'
@@ -0,0 +1,28 @@
+import { lazyWithPrefetch } from '../../utils/lazyWithPrefetch'
+
+// Seções do dashboard em chunks separados, baixados ao abrir a seção ou antes,
+// quando o usuário passa o mouse/foca o item correspondente do menu
+export const ReportsSection = lazyWithPrefetch(() => import('./ReportsSection'))
+export const ExpensesSection = lazyWithPrefetch(() => import('./ExpensesSection'))
+export const PaymentsSection = lazyWithPrefetch(() => import('./PaymentsSection'))
+export const RoomsSection = lazyWithPrefetch(() => import('./RoomsSection'))
+export const MembersSection = lazyWithPrefetch(() => import('./MembersSection'))
+export const ProfileSection = lazyWithPrefetch(() => import('./ProfileSection'))
+export const CreateRepublicModal = lazyWithPrefetch(() => import('./CreateRepublicModal'))
+
+// Item do menu (activeMenu) -> seção
+const SECTIONS_BY_MENU = {
+  resumo: ReportsSection,
+  despesas: ExpensesSection,
+  pagamentos: PaymentsSection,
+  quartos: RoomsSection,
+  membros: MembersSection,
+  perfil: ProfileSection
+}
+
+export function prefetchSection(menu) {
+  const section = SECTIONS_BY_MENU[menu]
+  if (section) {
+    section.prefetch()
+  }
+}
@@ -0,0 +1,98 @@
+import { useEffect, useState } from 'react'
+import { API_BASE_URL } from '../services/api'
+import { clearTelemetry, getEntries, getInFlight, subscribe, summarize } from '../services/telemetry'
+import './PerfPanel.css'
+
+// Painel de desenvolvimento com a telemetria da API (src/services/telemetry.js).
+// Fica escondido: Ctrl+Alt+P alterna, ou localStorage.perf_panel = '1' abre sempre.
+const RECENT = 8
+
+const ms = (value) => (value == null ? '-' : `${Math.round(value)}ms`)
+const kb = (bytes) => (bytes ? `${(bytes / 1024).toFixed(1)}KB` : '-')
+
+function PerfPanel({ onClose }) {
+  const [snapshot, setSnapshot] = useState(() => ({
+    summary: summarize(),
+    recent: getEntries().slice(-RECENT),
+    inFlight: getInFlight()
+  }))
+
+  // Vários registros chegam juntos (páginas de pagamentos): um render por quadro
+  useEffect(() => {
+    let frame = null
+    const unsubscribe = subscribe(() => {
+      if (frame) return
+      frame = requestAnimationFrame(() => {
+        frame = null
+        setSnapshot({
+          summary: summarize(),
+          recent: getEntries().slice(-RECENT),
+          inFlight: getInFlight()
+        })
+      })
+    })
+    return () => {
+      unsubscribe()
+      if (frame) cancelAnimationFrame(frame)
+    }
+  }, [])
+
+  const handleClear = () => {
+    clearTelemetry()
+    setSnapshot({ summary: [], recent: [], inFlight: getInFlight() })
+  }
+
+  return (
+    <aside className="perf-panel" aria-label="Telemetria da API">
+      <header className="perf-panel-header">
+        <strong>API</strong>
+        <span>{API_BASE_URL}</span>
+        <span>em andamento: {snapshot.inFlight.current} (máx. {snapshot.inFlight.max})</span>
+        <button type="button" onClick={handleClear}>Limpar</button>
+        <button type="button" onClick={onClose} aria-label="Fechar">×</button>
+      </header>
+
+      <table className="perf-panel-table">
+        <thead>
+          <tr>
+            <th>Rota</th>
+            <th>Req.</th>
+            <th>Cache</th>
+            <th>p50</th>
+            <th>p95</th>
+            <th>Máx.</th>
+            <th>Erros</th>
+            <th>Repet.</th>
+            <th>Recebido</th>
+          </tr>
+        </thead>
+        <tbody>
+          {snapshot.summary.map(group => (
+            <tr key={group.endpoint}>
+              <td>{group.endpoint}</td>
+              <td>{group.requests}</td>
+              <td>{group.cacheHits || '-'}</td>
+              <td>{ms(group.p50)}</td>
+              <td>{ms(group.p95)}</td>
+              <td>{ms(group.max)}</td>
+              <td className={group.errors ? 'perf-panel-error' : undefined}>{group.errors || '-'}</td>
+              <td>{group.retries || '-'}</td>
+              <td>{kb(group.bytesIn)}</td>
+            </tr>
+          ))}
+        </tbody>
+      </table>
+
+      <ol className="perf-panel-recent">
+        {snapshot.recent.map(entry => (
+          <li key={entry.id} className={entry.ok ? undefined : 'perf-panel-error'}>
+            {entry.method} {entry.url} — {entry.cache ? `cache (${entry.cache})` : `${entry.status ?? entry.error} em ${ms(entry.duration)}`}
+            {entry.retry > 0 && ` · tentativa ${entry.retry + 1}`}
+          </li>
+        ))}
+      </ol>
+    </aside>
+  )
+}
+
+export default PerfPanel
@@ -0,0 +1,89 @@
+import { useState, useEffect } from 'react'
+import { cachedGet, peekQuery } from '../services/queryCache'
+import { mapWithConcurrency } from '../utils/concurrency'
+
+// Máximo de requisições simultâneas de /membros ao montar a lista
+const MAX_CONCURRENT_REQUESTS = 4
+
+// A contagem vem da mesma lista de membros usada pelas seções, então o cache
+// (e as requisições em andamento) são compartilhados com MembersSection e afins
+const countFrom = (response) => response.data.members?.length || 0
+
+function loadMembersCount(republicaId, force = false) {
+  return cachedGet(`/membros/${republicaId}`, { force }).then(countFrom)
+}
+
+function cachedCount(republicaId) {
+  const response = peekQuery(`/membros/${republicaId}`)
+  return response ? countFrom(response) : undefined
+}
+
+export function useMembersCount(republicas) {
+  const [membersCount, setMembersCount] = useState(() => {
+    const counts = {}
+    for (const republica of republicas) {
+      const count = cachedCount(republica.id)
+      if (count !== undefined) {
+        counts[republica.id] = count
+      }
+    }
+    return counts
+  })
+
+  // Só refaz a busca quando o conjunto de repúblicas muda, não a cada novo array
+  const republicaIds = republicas.map(r => r.id).join(',')
+
+  useEffect(() => {
+    if (!republicaIds) return
+
+    let active = true
+    const ids = republicaIds.split(',').map(Number)
+
+    // O que já está em cache aparece na hora; o restante chega aos poucos
+    const cached = {}
+    const missing = []
+    for (const id of ids) {
+      const count = cachedCount(id)
+      if (count !== undefined) {
+        cached[id] = count
+      } else {
+        missing.push(id)
+      }
+    }
+    setMembersCount(prev => ({ ...prev, ...cached }))
+
+    mapWithConcurrency(
+      missing,
+      MAX_CONCURRENT_REQUESTS,
+      async (id) => {
+        try {
+          return await loadMembersCount(id)
+        } catch (err) {
+          console.error(`Erro ao buscar membros da república ${id}:`, err)
+          return 0
+        }
+      },
+      (count, id) => {
+        if (active) {
+          setMembersCount(prev => ({ ...prev, [id]: count }))
+        }
+      }
+    )
+
+    return () => {
+      active = false
+    }
+  }, [republicaIds])
+
+  // Atualizar contagem de membros de uma república específica
+  const updateMembersCount = async (republicaId) => {
+    try {
+      const count = await loadMembersCount(republicaId, true)
+      setMembersCount(prev => ({ ...prev, [republicaId]: count }))
+    } catch (err) {
+      console.error(`Erro ao atualizar contagem de membros:`, err)
+    }
+  }
+
+  return { membersCount, updateMembersCount }
+}
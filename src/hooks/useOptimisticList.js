@@ -0,0 +1,124 @@
+// Mutações otimistas sobre uma lista guardada em estado (useState).
+// A mudança esperada é aplicada na hora; quando a API responde, o item é
+// trocado pela versão do backend; se a requisição falhar, só o item afetado
+// volta ao que era (outras mutações em andamento não são desfeitas) e
+// `onError` recebe a mensagem para exibir.
+// Itens ainda não confirmados têm `pending: true` (ações sobre eles ficam desabilitadas).
+// Recusas de validação (4xx, menos 401) vão para o `onRejected` da chamada, quando
+// informado, para o formulário ser reaberto com o que o usuário digitou e o erro.
+// Se a criação não devolver o id do registro, o item continua pendente e a
+// lista é buscada de novo com `refresh`, quando informado.
+
+// Ids temporários negativos nunca colidem com os do backend
+let nextTempId = -1
+
+// Item confirmado, sem a marca de pendente
+function confirmed(item) {
+  const { pending, ...rest } = item
+  return rest
+}
+
+const isRejection = (err) => {
+  const status = err.response?.status
+  return status >= 400 && status < 500 && status !== 401
+}
+
+// Versão do backend quando a resposta traz o próprio registro (mesmo id); senão,
+// a versão otimista (a resposta pode ser de outro recurso, como o quarto)
+const defaultFromResponse = (response, item) =>
+  confirmed(response?.data?.id === item.id ? { ...item, ...response.data } : item)
+
+export function useOptimisticList(setItems, { onError, refresh } = {}) {
+  // Resolve com a resposta da API, ou null se falhou (já desfeito e exibido)
+  const run = async ({ apply, reconcile, rollback, request, errorMessage, onRejected }) => {
+    setItems(apply)
+    try {
+      const response = await request()
+      setItems(items => reconcile(items, response))
+      return response
+    } catch (err) {
+      // `errorMessage` pode ser uma função do erro, para mensagens por status
+      const message = typeof errorMessage === 'function'
+        ? errorMessage(err)
+        : err.response?.data?.detail || errorMessage
+      console.error(message, err)
+      setItems(rollback)
+      if (onRejected && isRejection(err)) {
+        onRejected(message, err)
+      } else if (onError) {
+        onError(message)
+      }
+      return null
+    }
+  }
+
+  // Incluir `item` no fim da lista até o backend devolver o registro criado
+  const create = async (item, request, { errorMessage = 'Erro ao salvar', fromResponse = defaultFromResponse, onRejected } = {}) => {
+    const tempId = nextTempId--
+    const optimistic = { ...item, id: tempId, pending: true }
+
+    const response = await run({
+      request,
+      errorMessage,
+      onRejected,
+      apply: items => [...items, optimistic],
+      // Sem id na resposta o item fica pendente: nada é enviado com o id temporário
+      reconcile: (items, response) => {
+        const id = response?.data?.id
+        if (id == null) return items
+        return items.map(current => (current.id === tempId ? fromResponse(response, { ...confirmed(current), id }) : current))
+      },
+      rollback: items => items.filter(current => current.id !== tempId)
+    })
+
+    if (response && response.data?.id == null && refresh) {
+      await refresh()
+    }
+    return response
+  }
+
+  // Aplicar `changes` ao item `id`
+  const update = (id, changes, request, { errorMessage = 'Erro ao salvar', fromResponse = defaultFromResponse, onRejected } = {}) => {
+    let previous = null
+
+    return run({
+      request,
+      errorMessage,
+      onRejected,
+      apply: items => items.map(current => {
+        if (current.id !== id) return current
+        previous = current
+        return { ...current, ...changes, pending: true }
+      }),
+      reconcile: (items, response) =>
+        items.map(current => (current.id === id ? fromResponse(response, confirmed(current)) : current)),
+      rollback: items => items.map(current => (current.id === id && previous ? previous : current))
+    })
+  }
+
+  // Tirar o item `id` da lista (volta na mesma posição se a exclusão falhar)
+  const remove = (id, request, { errorMessage = 'Erro ao excluir' } = {}) => {
+    let previous = null
+    let index = -1
+
+    return run({
+      request,
+      errorMessage,
+      apply: items => {
+        index = items.findIndex(current => current.id === id)
+        if (index === -1) return items
+        previous = items[index]
+        return items.filter(current => current.id !== id)
+      },
+      reconcile: items => items,
+      rollback: items => {
+        if (!previous || items.some(current => current.id === id)) return items
+        const restored = [...items]
+        restored.splice(Math.min(index, restored.length), 0, previous)
+        return restored
+      }
+    })
+  }
+
+  return { create, update, remove }
+}
@@ -1,5 +1,6 @@
 import { useState, useEffect } from 'react'
 import api from '../services/api'
+import { cachedGet } from '../services/queryCache'
 
 export function useRepublicas() {
   const [republicas, setRepublicas] = useState([])
@@ -11,7 +12,9 @@ export function useRepublicas() {
     try {
       setLoading(true)
       setError(null)
-      const response = await api.get('/republicas')
+      const response = await cachedGet('/republicas', {
+        onUpdate: (res) => setRepublicas(res.data)
+      })
       setRepublicas(response.data)
     } catch (err) {
       console.error('Erro ao buscar repúblicas:', err)
@@ -0,0 +1,103 @@
+import { useState, useEffect, useCallback } from 'react'
+
+// Listas menores que isso são renderizadas inteiras
+const VIRTUALIZE_THRESHOLD = 100
+// Linhas extras montadas acima e abaixo da área visível
+const OVERSCAN = 8
+
+// Janela de linhas visíveis de uma lista longa que rola com a página.
+// Só as linhas entre `start` e `end` são montadas; `paddingTop` e
+// `paddingBottom` ocupam o espaço das demais para a barra de rolagem não mudar.
+//
+// - `rowHeight`: altura estimada de uma linha (px), corrigida pela primeira
+//   linha medida com `measureRef`
+// - `gap`: espaço entre linhas (ex.: gap do grid)
+// - `getColumns(largura)`: itens por linha em layouts de grid (padrão: 1)
+export function useVirtualRows(itemCount, {
+  rowHeight,
+  gap = 0,
+  getColumns,
+  overscan = OVERSCAN,
+  threshold = VIRTUALIZE_THRESHOLD
+} = {}) {
+  // Callback ref: o container pode ser desmontado e montado de novo (ex.: loading)
+  const [container, containerRef] = useState(null)
+  const [measuredHeight, setMeasuredHeight] = useState(null)
+  const [columns, setColumns] = useState(1)
+  // Antes da primeira medição, monta o suficiente para cobrir uma tela
+  const [range, setRange] = useState({ first: 0, last: overscan * 4 })
+
+  const enabled = itemCount > threshold
+  const rowSize = (measuredHeight || rowHeight) + gap
+  const rowCount = Math.ceil(itemCount / columns)
+
+  // Recalcular as linhas visíveis a partir da posição do container na janela
+  const updateRange = useCallback(() => {
+    if (!container) return
+
+    const top = container.getBoundingClientRect().top
+    const viewportHeight = window.innerHeight || document.documentElement.clientHeight
+    const first = Math.max(0, Math.floor(-top / rowSize) - overscan)
+    const last = Math.min(rowCount, Math.ceil((viewportHeight - top) / rowSize) + overscan)
+
+    setRange(prev => (prev.first === first && prev.last === last ? prev : { first, last }))
+  }, [container, rowSize, rowCount, overscan])
+
+  useEffect(() => {
+    if (!enabled || !container) return
+
+    let frame = null
+    const onScroll = () => {
+      if (frame !== null) return
+      frame = window.requestAnimationFrame(() => {
+        frame = null
+        updateRange()
+      })
+    }
+
+    updateRange()
+    window.addEventListener('scroll', onScroll, { passive: true })
+    window.addEventListener('resize', onScroll)
+    return () => {
+      window.removeEventListener('scroll', onScroll)
+      window.removeEventListener('resize', onScroll)
+      if (frame !== null) window.cancelAnimationFrame(frame)
+    }
+  }, [enabled, container, updateRange])
+
+  // Colunas do grid acompanham a largura do container
+  useEffect(() => {
+    if (!enabled || !getColumns || !container || typeof ResizeObserver === 'undefined') return
+
+    const observer = new ResizeObserver(([entry]) => {
+      setColumns(Math.max(1, getColumns(entry.contentRect.width)))
+    })
+    observer.observe(container)
+    return () => observer.disconnect()
+  }, [enabled, container, getColumns])
+
+  // Medir a altura real de uma linha renderizada
+  const measureRef = useCallback((element) => {
+    if (!element) return
+    const height = element.getBoundingClientRect().height
+    if (height > 0) {
+      setMeasuredHeight(prev => (prev !== null && Math.abs(prev - height) < 1 ? prev : height))
+    }
+  }, [])
+
+  if (!enabled) {
+    return { containerRef, measureRef, start: 0, end: itemCount, paddingTop: 0, paddingBottom: 0 }
+  }
+
+  const first = Math.min(range.first, rowCount)
+  const last = Math.min(Math.max(range.last, first), rowCount)
+
+  return {
+    containerRef,
+    measureRef,
+    start: first * columns,
+    end: Math.min(itemCount, last * columns),
+    paddingTop: first * rowSize,
+    paddingBottom: Math.max(0, (rowCount - last) * rowSize)
+  }
+}
@@ -1,8 +1,9 @@
-import { useState, useEffect } from 'react'
+import { useState, useEffect, Suspense } from 'react'
 import { useNavigate } from 'react-router-dom'
 import { performLogout } from '../utils/auth'
+import { ProfiledRegion } from '../utils/renderProfiler'
 import { useRepublicas } from '../hooks/useRepublicas'
-import api from '../services/api'
+import { useMembersCount } from '../hooks/useMembersCount'
 import { 
   Sidebar, 
   CreateRepublicModal, 
@@ -16,7 +17,6 @@ function Dashboard() {
   const [activeMenu, setActiveMenu] = useState('republicas')
   const [selectedRepublic, setSelectedRepublic] = useState(null)
   const [showModal, setShowModal] = useState(false)
-  const [membersCount, setMembersCount] = useState({})
 
   // Hook para gerenciar repúblicas
   const { 
@@ -27,27 +27,8 @@ function Dashboard() {
     fetchRepublicas
   } = useRepublicas()
 
-  // Buscar número de membros de cada república
-  const fetchMembersCount = async () => {
-    const counts = {}
-    for (const republica of republicas) {
-      try {
-        const response = await api.get(`/membros/${republica.id}`)
-        counts[republica.id] = response.data.members?.length || 0
-      } catch (err) {
-        console.error(`Erro ao buscar membros da república ${republica.id}:`, err)
-        counts[republica.id] = 0
-      }
-    }
-    setMembersCount(counts)
-  }
-
-  // Atualizar contagem de membros quando repúblicas mudarem
-  useEffect(() => {
-    if (republicas.length > 0) {
-      fetchMembersCount()
-    }
-  }, [republicas])
+  // Número de membros de cada república (buscado em paralelo, com cache)
+  const { membersCount, updateMembersCount } = useMembersCount(republicas)
 
   // Selecionar primeira república quando carregar
   useEffect(() => {
@@ -84,19 +65,6 @@ function Dashboard() {
     setActiveMenu('resumo')
   }
 
-  // Atualizar contagem de membros de uma república específica
-  const updateMembersCount = async (republicaId) => {
-    try {
-      const response = await api.get(`/membros/${republicaId}`)
-      setMembersCount(prev => ({
-        ...prev,
-        [republicaId]: response.data.members?.length || 0
-      }))
-    } catch (err) {
-      console.error(`Erro ao atualizar contagem de membros:`, err)
-    }
-  }
-
   // Dados mockados
   const resumoData = {
     totalDespesas: 2450,
@@ -121,21 +89,27 @@ function Dashboard() {
       )}
 
       {/* Modal de Criar República */}
-      <CreateRepublicModal 
-        showModal={showModal}
-        onClose={() => setShowModal(false)}
-        onRepublicCreated={handleRepublicCreated}
-        republicas={republicas}
-      />
+      {showModal && (
+        <Suspense fallback={null}>
+          <CreateRepublicModal 
+            showModal={showModal}
+            onClose={() => setShowModal(false)}
+            onRepublicCreated={handleRepublicCreated}
+            republicas={republicas}
+          />
+        </Suspense>
+      )}
 
       {/* Sidebar */}
-      <Sidebar 
-        currentRepublic={currentRepublic}
-        activeMenu={activeMenu}
-        setActiveMenu={setActiveMenu}
-        onLogout={handleLogout}
-        loading={loading}
-      />
+      <ProfiledRegion id="Sidebar">
+        <Sidebar 
+          currentRepublic={currentRepublic}
+          activeMenu={activeMenu}
+          setActiveMenu={setActiveMenu}
+          onLogout={handleLogout}
+          loading={loading}
+        />
+      </ProfiledRegion>
 
       {/* Main Content */}
       <main className="main-content">
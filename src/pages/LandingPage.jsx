@@ -3,6 +3,7 @@ import { useEffect } from 'react'
 import { FontAwesomeIcon } from '@fortawesome/react-fontawesome'
 import { faHome, faUsers, faClipboardList, faClock, faCheckCircle } from '@fortawesome/free-solid-svg-icons'
 import { useAuth } from '../utils/auth'
+import { Login, Register } from './lazyPages'
 import './LandingPage.css'
 import imagemRepublica from '/assets/imagem_republica.png'
 
@@ -27,8 +28,8 @@ function LandingPage() {
           <span>República Fácil</span>
         </div>
         <div className="header-buttons">
-          <Link to="/login" className="btn btn-secondary">Entrar</Link>
-          <Link to="/register" className="btn btn-primary">Cadastrar</Link>
+          <Link to="/login" className="btn btn-secondary" onMouseEnter={Login.prefetch} onFocus={Login.prefetch}>Entrar</Link>
+          <Link to="/register" className="btn btn-primary" onMouseEnter={Register.prefetch} onFocus={Register.prefetch}>Cadastrar</Link>
         </div>
       </header>
 
@@ -42,10 +43,10 @@ function LandingPage() {
             divida contas automaticamente e mantenha tudo sobre controle.
           </p>
           <div className="hero-buttons">
-            <Link to="/register" className="btn btn-primary btn-large">
+            <Link to="/register" className="btn btn-primary btn-large" onMouseEnter={Register.prefetch} onFocus={Register.prefetch}>
               Crie Sua República Grátis
             </Link>
-            <Link to="/login" className="btn btn-secondary btn-large">
+            <Link to="/login" className="btn btn-secondary btn-large" onMouseEnter={Login.prefetch} onFocus={Login.prefetch}>
               Entrar
             </Link>
           </div>
@@ -1,6 +1,7 @@
 import { useState } from 'react'
 import { Link, useNavigate } from 'react-router-dom'
-import api from '../services/api'
+import api, { saveTokens } from '../services/api'
+import { Dashboard } from './lazyPages'
 import { FontAwesomeIcon } from '@fortawesome/react-fontawesome'
 import { faHome } from '@fortawesome/free-solid-svg-icons'
 import './Auth.css'
@@ -26,6 +27,8 @@ function Login() {
     e.preventDefault()
     setError('')
     setLoading(true)
+    // O chunk do dashboard baixa junto com o login
+    Dashboard.prefetch()
 
     try {
       // Enviar como form data (application/x-www-form-urlencoded)
@@ -40,9 +43,8 @@ function Login() {
         }
       })
 
-      // Salvar tokens no localStorage
-      localStorage.setItem('access_token', response.data.access_token)
-      localStorage.setItem('token_type', response.data.token_type)
+      // Salvar tokens no localStorage (acesso e renovação)
+      saveTokens(response.data)
 
       // Redirecionar para dashboard
       navigate('/dashboard')
@@ -1,6 +1,6 @@
 import { useState } from 'react'
 import { Link, useNavigate } from 'react-router-dom'
-import api from '../services/api'
+import api, { saveTokens } from '../services/api'
 import { FontAwesomeIcon } from '@fortawesome/react-fontawesome'
 import { faHome } from '@fortawesome/free-solid-svg-icons'
 import './Auth.css'
@@ -113,9 +113,8 @@ function Register() {
         }
       })
 
-      // 3. Salvar token no localStorage
-      localStorage.setItem('access_token', loginResponse.data.access_token)
-      localStorage.setItem('token_type', loginResponse.data.token_type)
+      // 3. Salvar tokens no localStorage
+      saveTokens(loginResponse.data)
 
       // 4. Redirecionar para dashboard
       navigate('/dashboard')
@@ -0,0 +1,8 @@
+import { lazyWithPrefetch } from '../utils/lazyWithPrefetch'
+
+// Cada página em um chunk separado: quem abre a landing page não baixa o dashboard
+export const LandingPage = lazyWithPrefetch(() => import('./LandingPage'))
+export const Login = lazyWithPrefetch(() => import('./Login'))
+export const Register = lazyWithPrefetch(() => import('./Register'))
+export const ForgotPassword = lazyWithPrefetch(() => import('./ForgotPassword'))
+export const Dashboard = lazyWithPrefetch(() => import('./Dashboard'))
@@ -1,12 +1,9 @@
 import axios from 'axios'
+import { instrumentClient } from './telemetry'
 
 // Usar variável de ambiente se disponível, senão usa proxy em dev ou localhost como fallback
 const API_BASE_URL = import.meta.env.VITE_API_URL || (import.meta.env.PROD ? 'http://localhost:8000' : '/api')
 
-console.log('API_BASE_URL configurada:', API_BASE_URL)
-console.log('VITE_API_URL:', import.meta.env.VITE_API_URL)
-console.log('PROD mode:', import.meta.env.PROD)
-
 // Criar instância do axios com configurações padrão
 const api = axios.create({
   baseURL: API_BASE_URL,
@@ -15,16 +12,151 @@ const api = axios.create({
   },
 })
 
+// Tempo, tamanho e concorrência de cada requisição (window.__perf); registrado
+// antes dos outros interceptors para medir cada tentativa isoladamente
+instrumentClient(api)
+
+// ============================================================================
+// Tokens
+// ============================================================================
+
+// Gravar os tokens devolvidos por /auth/login ou /auth/refresh
+export function saveTokens({ access_token, token_type, refresh_token }) {
+  localStorage.setItem('access_token', access_token)
+  localStorage.setItem('token_type', token_type || 'bearer')
+  if (refresh_token) {
+    localStorage.setItem('refresh_token', refresh_token)
+  }
+}
+
+export function clearTokens() {
+  localStorage.removeItem('access_token')
+  localStorage.removeItem('token_type')
+  localStorage.removeItem('refresh_token')
+}
+
+const authorizationHeader = () => {
+  const token = localStorage.getItem('access_token')
+  const tokenType = localStorage.getItem('token_type')
+  return token ? `${tokenType || 'Bearer'} ${token}` : null
+}
+
+// Renovação em andamento: enquanto ela não termina, requisições novas esperam
+// e as que receberam 401 aguardam a mesma promise (uma única renovação)
+let refreshPromise = null
+
+function refreshAccessToken() {
+  if (!refreshPromise) {
+    const refreshToken = localStorage.getItem('refresh_token')
+    // axios "puro": a renovação não passa pelos interceptors da instância
+    refreshPromise = (refreshToken
+      ? axios.post(`${API_BASE_URL}/auth/refresh`, { refresh_token: refreshToken })
+      : Promise.reject(new Error('Sem token de renovação')))
+      .then(response => {
+        saveTokens(response.data)
+        return response.data.access_token
+      })
+      .finally(() => {
+        refreshPromise = null
+      })
+  }
+  return refreshPromise
+}
+
+// Sessão sem renovação possível: volta para o login
+function endSession() {
+  clearTokens()
+
+  // Só redireciona se não estiver já na página de login
+  if (!window.location.pathname.includes('/login') &&
+      !window.location.pathname.includes('/register') &&
+      !window.location.pathname.includes('/forgot-password')) {
+    window.location.href = '/login'
+  }
+}
+
+// ============================================================================
+// Novas tentativas
+// ============================================================================
+
+// Tentativas extras por rota em falhas transitórias (5xx, 429, rede). A primeira
+// regra que casar vale. POST não é repetido: o backend pode ter processado o
+// pedido (ex.: pagamento registrado duas vezes)
+const RETRY_RULES = [
+  { prefix: '/auth', retries: 0 },
+  { method: 'get', prefix: '/despesas', retries: 3 },
+  { method: 'get', retries: 2 },
+  { method: 'put', retries: 1 },
+  { method: 'patch', retries: 1 },
+  { method: 'delete', retries: 1 },
+  { retries: 0 }
+]
+
+// Orçamento por recurso: no máximo RETRY_BUDGET novas tentativas a cada
+// RETRY_WINDOW, para um backend fora do ar não receber uma avalanche de repetições
+const RETRY_BUDGET = 20
+const RETRY_WINDOW = 10 * 1000
+const retryHistory = new Map()
+
+const BACKOFF_BASE = 300
+const BACKOFF_MAX = 5000
+
+const pathOf = (url = '') => '/' + url.replace(/^https?:\/\/[^/]+/, '').split('?')[0].replace(/^\/+/, '')
+
+function retriesFor(method, path) {
+  const rule = RETRY_RULES.find(candidate =>
+    (!candidate.method || candidate.method === method) &&
+    (!candidate.prefix || path === candidate.prefix || path.startsWith(`${candidate.prefix}/`))
+  )
+  return rule.retries
+}
+
+function takeRetryBudget(path) {
+  const resource = path.split('/')[1] || ''
+  const now = Date.now()
+  const recent = (retryHistory.get(resource) || []).filter(time => now - time < RETRY_WINDOW)
+  if (recent.length >= RETRY_BUDGET) {
+    retryHistory.set(resource, recent)
+    return false
+  }
+  recent.push(now)
+  retryHistory.set(resource, recent)
+  return true
+}
+
+const isTransient = (error) => {
+  if (axios.isCancel(error)) return false
+  if (!error.response) return true
+  const status = error.response.status
+  return status >= 500 || status === 429
+}
+
+// Espera exponencial com jitter completo; Retry-After do backend tem prioridade
+function retryDelay(attempt, error) {
+  const retryAfter = Number(error.response?.headers?.['retry-after'])
+  if (retryAfter > 0) return Math.min(retryAfter * 1000, BACKOFF_MAX)
+  return Math.random() * Math.min(BACKOFF_MAX, BACKOFF_BASE * 2 ** attempt)
+}
+
+const wait = (ms) => new Promise(resolve => setTimeout(resolve, ms))
+
+// ============================================================================
+// Interceptors
+// ============================================================================
+
 // Interceptor para adicionar token em todas as requisições
 api.interceptors.request.use(
-  (config) => {
-    const token = localStorage.getItem('access_token')
-    const tokenType = localStorage.getItem('token_type')
-    
-    if (token) {
-      config.headers.Authorization = `${tokenType || 'Bearer'} ${token}`
+  async (config) => {
+    // Não sair com um token que está sendo trocado
+    if (refreshPromise) {
+      await refreshPromise.catch(() => {})
+    }
+
+    const authorization = authorizationHeader()
+    if (authorization) {
+      config.headers.Authorization = authorization
     }
-    
+
     return config
   },
   (error) => {
@@ -32,22 +164,47 @@ api.interceptors.request.use(
   }
 )
 
-// Interceptor para tratar erros de autenticação
+// Interceptor para renovar o token (401) e repetir falhas transitórias
 api.interceptors.response.use(
   (response) => response,
-  (error) => {
-    if (error.response?.status === 401) {
-      // Token inválido ou expirado
-      localStorage.removeItem('access_token')
-      localStorage.removeItem('token_type')
-      
-      // Só redireciona se não estiver já na página de login
-      if (!window.location.pathname.includes('/login') && 
-          !window.location.pathname.includes('/register') &&
-          !window.location.pathname.includes('/forgot-password')) {
-        window.location.href = '/login'
+  async (error) => {
+    const config = error.config
+    if (!config) return Promise.reject(error)
+
+    const method = (config.method || 'get').toLowerCase()
+    const path = pathOf(config.url)
+
+    if (error.response?.status === 401 && !path.startsWith('/auth/') && !config._authRetried) {
+      config._authRetried = true
+
+      // Outra requisição já renovou o token depois que esta saiu: só repetir
+      if (config.headers?.Authorization && config.headers.Authorization !== authorizationHeader()) {
+        return api(config)
       }
+
+      try {
+        await refreshAccessToken()
+      } catch (refreshError) {
+        // Token de renovação ausente, vencido ou recusado
+        endSession()
+        return Promise.reject(error)
+      }
+      return api(config)
+    }
+
+    if (error.response?.status === 401) {
+      // Token inválido ou expirado mesmo após a renovação
+      if (!path.startsWith('/auth/')) endSession()
+      return Promise.reject(error)
     }
+
+    const attempt = config._retryCount || 0
+    if (isTransient(error) && attempt < retriesFor(method, path) && takeRetryBudget(path)) {
+      config._retryCount = attempt + 1
+      await wait(retryDelay(attempt, error))
+      return api(config)
+    }
+
     return Promise.reject(error)
   }
 )
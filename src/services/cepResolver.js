@@ -0,0 +1,204 @@
+import axios from 'axios'
+
+// Consulta de CEP com cache.
+// - Resultados (inclusive "não encontrado") ficam num LRU salvo no localStorage,
+//   então um CEP já consultado é resolvido na hora, mesmo em outra sessão
+// - Consultas iguais em andamento são reaproveitadas; a requisição só é
+//   cancelada (AbortController) quando todos que esperavam por ela desistem
+// - O provedor é injetável (setCepProvider): ViaCEP por padrão, ou uma base
+//   local nos testes e em builds sem internet (VITE_CEP_DATASET)
+const STORAGE_KEY = 'cep_cache'
+const MAX_ENTRIES = 200
+const FOUND_TTL = 30 * 24 * 60 * 60 * 1000
+const NOT_FOUND_TTL = 24 * 60 * 60 * 1000
+const REQUEST_TIMEOUT = 8000
+
+// Nos testes a consulta de CEP aponta para o backend falso (VITE_VIACEP_URL)
+const VIACEP_URL = import.meta.env.VITE_VIACEP_URL || 'https://viacep.com.br'
+
+export const normalizeCep = (value) => String(value || '').replace(/\D/g, '')
+
+export const isCompleteCep = (value) => normalizeCep(value).length === 8
+
+// ============================================================================
+// Provedores: (cep, { signal }) => Promise<endereço | null>
+// Endereço no formato do formulário: { rua, bairro, cidade, estado }
+// ============================================================================
+
+export function createViaCepProvider(baseUrl = VIACEP_URL, { timeout = REQUEST_TIMEOUT } = {}) {
+  const provider = async (cep, { signal } = {}) => {
+    const response = await axios.get(`${baseUrl}/ws/${cep}/json/`, { signal, timeout })
+    if (response.data.erro) return null
+    return {
+      rua: response.data.logradouro || '',
+      bairro: response.data.bairro || '',
+      cidade: response.data.localidade || '',
+      estado: response.data.uf || ''
+    }
+  }
+  provider.origin = new URL(baseUrl, window.location.href).origin
+  return provider
+}
+
+// Base local ({ "01310100": { rua, bairro, cidade, estado } }) ou uma URL de JSON
+// nesse formato, baixada uma única vez
+export function createLocalCepProvider(dataset) {
+  let loaded = typeof dataset === 'string' ? null : dataset
+
+  return async (cep, { signal } = {}) => {
+    if (!loaded) {
+      const response = await axios.get(dataset, { signal, timeout: REQUEST_TIMEOUT })
+      loaded = response.data
+    }
+    return loaded[cep] || null
+  }
+}
+
+let provider = import.meta.env.VITE_CEP_DATASET
+  ? createLocalCepProvider(import.meta.env.VITE_CEP_DATASET)
+  : createViaCepProvider()
+
+// Trocar o provedor descarta o cache (os dados podem não ser equivalentes)
+export function setCepProvider(nextProvider, { keepCache = false } = {}) {
+  provider = nextProvider
+  pending.clear()
+  if (!keepCache) clearCepCache()
+}
+
+// ============================================================================
+// Cache (LRU, ordem de inserção do Map = ordem de uso)
+// ============================================================================
+
+let cache = null
+const pending = new Map()
+
+function loadCache() {
+  if (cache) return cache
+  cache = new Map()
+  try {
+    const saved = JSON.parse(localStorage.getItem(STORAGE_KEY) || '[]')
+    const now = Date.now()
+    for (const [cep, entry] of saved) {
+      if (entry.expiresAt > now) cache.set(cep, entry)
+    }
+  } catch {
+    localStorage.removeItem(STORAGE_KEY)
+  }
+  return cache
+}
+
+function saveCache() {
+  try {
+    localStorage.setItem(STORAGE_KEY, JSON.stringify([...cache]))
+  } catch (err) {
+    console.error('Erro ao salvar cache de CEP:', err)
+  }
+}
+
+function remember(cep, address) {
+  const entries = loadCache()
+  entries.delete(cep)
+  entries.set(cep, { address, expiresAt: Date.now() + (address ? FOUND_TTL : NOT_FOUND_TTL) })
+  for (const key of entries.keys()) {
+    if (entries.size <= MAX_ENTRIES) break
+    entries.delete(key)
+  }
+  saveCache()
+}
+
+// Resultado em cache, sem requisição: endereço, null (não encontrado) ou undefined
+export function peekCep(value) {
+  const cep = normalizeCep(value)
+  const entries = loadCache()
+  const entry = entries.get(cep)
+  if (!entry) return undefined
+  if (entry.expiresAt <= Date.now()) {
+    entries.delete(cep)
+    return undefined
+  }
+  entries.delete(cep)
+  entries.set(cep, entry)
+  return entry.address
+}
+
+export function clearCepCache() {
+  cache = new Map()
+  localStorage.removeItem(STORAGE_KEY)
+}
+
+// ============================================================================
+// Consulta
+// ============================================================================
+
+function abortError() {
+  return new DOMException('Consulta de CEP cancelada', 'AbortError')
+}
+
+export const isCepLookupCancelled = (err) => err?.name === 'AbortError' || axios.isCancel(err)
+
+// Resolver um CEP. Resolve com o endereço ou null (não encontrado); rejeita com
+// AbortError se `signal` for abortado antes da resposta
+export function resolveCep(value, { signal } = {}) {
+  const cep = normalizeCep(value)
+  if (cep.length !== 8) return Promise.resolve(null)
+
+  const cached = peekCep(cep)
+  if (cached !== undefined) return Promise.resolve(cached)
+  if (signal?.aborted) return Promise.reject(abortError())
+
+  let lookup = pending.get(cep)
+  if (!lookup) {
+    const controller = new AbortController()
+    lookup = { controller, waiting: 0 }
+    lookup.promise = provider(cep, { signal: controller.signal })
+      .then(address => {
+        remember(cep, address)
+        return address
+      })
+      .finally(() => {
+        if (pending.get(cep) === lookup) pending.delete(cep)
+      })
+    pending.set(cep, lookup)
+  }
+
+  const current = lookup
+  current.waiting++
+
+  return new Promise((resolve, reject) => {
+    let settled = false
+    const leave = () => {
+      if (settled) return false
+      settled = true
+      signal?.removeEventListener('abort', onAbort)
+      current.waiting--
+      return true
+    }
+    const onAbort = () => {
+      if (!leave()) return
+      // Ninguém mais espera por este CEP: cancelar a requisição
+      if (current.waiting === 0) {
+        current.controller.abort()
+        if (pending.get(cep) === current) pending.delete(cep)
+      }
+      reject(abortError())
+    }
+
+    signal?.addEventListener('abort', onAbort)
+    current.promise.then(
+      address => { if (leave()) resolve(address) },
+      err => { if (leave()) reject(err) }
+    )
+  })
+}
+
+// Abrir a conexão com o provedor antes da primeira consulta (DNS + TLS)
+export function warmCepProvider() {
+  if (!provider.origin || provider.origin === window.location.origin) return
+  if (document.head.querySelector(`link[rel="preconnect"][href="${provider.origin}"]`)) return
+
+  const link = document.createElement('link')
+  link.rel = 'preconnect'
+  link.href = provider.origin
+  link.crossOrigin = 'anonymous'
+  document.head.appendChild(link)
+}
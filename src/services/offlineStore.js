@@ -0,0 +1,150 @@
+// Cópia local (IndexedDB) dos dados do dashboard, por usuário, para o próximo
+// carregamento pintar a tela na hora e depois conferir com a API.
+// - Cada registro guarda a versão do formato (DATA_VERSION); versões antigas são ignoradas
+// - Até MAX_BYTES/MAX_ENTRIES por usuário; acima disso saem os gravados há mais tempo
+// - Sem IndexedDB (ou com erro), tudo vira no-op e o app segue só com a API
+const DB_NAME = 'republica-facil'
+const DB_VERSION = 1
+const STORE = 'queries'
+
+// Mudar quando o formato dos dados salvos mudar (invalida as cópias antigas)
+const DATA_VERSION = 1
+const MAX_BYTES = 5 * 1024 * 1024
+const MAX_ENTRIES = 300
+
+let dbPromise = null
+
+function openDb() {
+  if (typeof indexedDB === 'undefined') return Promise.resolve(null)
+  if (!dbPromise) {
+    dbPromise = new Promise((resolve) => {
+      const request = indexedDB.open(DB_NAME, DB_VERSION)
+      request.onupgradeneeded = () => {
+        const store = request.result.createObjectStore(STORE, { keyPath: 'id' })
+        store.createIndex('userId', 'userId')
+      }
+      request.onsuccess = () => resolve(request.result)
+      request.onerror = () => {
+        console.error('IndexedDB indisponível:', request.error)
+        resolve(null)
+      }
+      request.onblocked = () => resolve(null)
+    })
+  }
+  return dbPromise
+}
+
+// Usuário do token atual (campo `id` do payload do JWT)
+export function currentUserId() {
+  const token = localStorage.getItem('access_token')
+  if (!token) return null
+  try {
+    const payload = token.split('.')[1].replace(/-/g, '+').replace(/_/g, '/')
+    return JSON.parse(atob(payload)).id ?? null
+  } catch {
+    return null
+  }
+}
+
+const promisify = (request) => new Promise((resolve, reject) => {
+  request.onsuccess = () => resolve(request.result)
+  request.onerror = () => reject(request.error)
+})
+
+// Todos os registros do usuário, na mesma transação usada para apagar
+async function userRecords(db, userId, mode = 'readonly') {
+  const tx = db.transaction(STORE, mode)
+  const records = await promisify(tx.objectStore(STORE).index('userId').getAll(userId))
+  return { tx, records }
+}
+
+// Ler a cópia local de uma chave: { data, savedAt } ou undefined
+export async function readOffline(key) {
+  const userId = currentUserId()
+  const db = userId !== null ? await openDb() : null
+  if (!db) return undefined
+
+  try {
+    const record = await promisify(db.transaction(STORE).objectStore(STORE).get(`${userId}:${key}`))
+    if (!record || record.version !== DATA_VERSION) return undefined
+    return { data: record.data, savedAt: record.savedAt }
+  } catch (err) {
+    console.error(`Erro ao ler cópia local de ${key}:`, err)
+    return undefined
+  }
+}
+
+// Gravar (em segundo plano) a resposta mais recente de uma chave
+export function writeOffline(key, data) {
+  const userId = currentUserId()
+  if (userId === null) return
+
+  const run = async () => {
+    const db = await openDb()
+    if (!db) return
+    try {
+      const size = JSON.stringify(data).length
+      if (size > MAX_BYTES) return
+
+      await promisify(db.transaction(STORE, 'readwrite').objectStore(STORE).put({
+        id: `${userId}:${key}`,
+        userId,
+        key,
+        data,
+        size,
+        version: DATA_VERSION,
+        savedAt: Date.now()
+      }))
+      await evict(db, userId)
+    } catch (err) {
+      console.error(`Erro ao gravar cópia local de ${key}:`, err)
+    }
+  }
+
+  // Serializar milhares de despesas não deve competir com a renderização
+  if (typeof requestIdleCallback === 'function') {
+    requestIdleCallback(() => run())
+  } else {
+    setTimeout(run, 0)
+  }
+}
+
+// Manter o usuário dentro dos limites, removendo os registros mais antigos
+async function evict(db, userId) {
+  const { tx, records } = await userRecords(db, userId, 'readwrite')
+  const store = tx.objectStore(STORE)
+  let totalBytes = records.reduce((sum, record) => sum + record.size, 0)
+  let count = records.length
+
+  records.sort((a, b) => a.savedAt - b.savedAt)
+  for (const record of records) {
+    if (totalBytes <= MAX_BYTES && count <= MAX_ENTRIES && record.version === DATA_VERSION) continue
+    store.delete(record.id)
+    totalBytes -= record.size
+    count--
+  }
+}
+
+// Remover as chaves do usuário que satisfazem `matches(key)`
+export async function removeOffline(matches) {
+  const userId = currentUserId()
+  const db = userId !== null ? await openDb() : null
+  if (!db) return
+
+  try {
+    const { tx, records } = await userRecords(db, userId, 'readwrite')
+    const store = tx.objectStore(STORE)
+    for (const record of records) {
+      if (matches(record.key)) {
+        store.delete(record.id)
+      }
+    }
+  } catch (err) {
+    console.error('Erro ao remover cópias locais:', err)
+  }
+}
+
+// Apagar todos os dados locais do usuário atual (logout)
+export function clearOffline() {
+  return removeOffline(() => true)
+}
@@ -0,0 +1,129 @@
+import api from './api'
+import { recordCacheHit } from './telemetry'
+import { mapWithConcurrency } from '../utils/concurrency'
+
+// O backend só expõe pagamentos por despesa, então a lista da república é
+// montada em páginas de despesas, com poucas requisições simultâneas
+const PAGE_SIZE = 50
+const MAX_CONCURRENT_REQUESTS = 6
+
+// Pagamentos em cache por despesa (5 minutos; "Atualizar" força nova busca)
+const CACHE_TTL = 5 * 60 * 1000
+const paymentsCache = new Map()
+const inFlight = new Map()
+
+const cacheKey = (republicaId, despesaId) => `${republicaId}:${despesaId}`
+
+// Buscar os pagamentos de uma despesa, reaproveitando cache e requisições em andamento
+export function fetchExpensePayments(republicaId, despesaId, { force = false } = {}) {
+  const key = cacheKey(republicaId, despesaId)
+  const cached = paymentsCache.get(key)
+
+  if (!force && cached && Date.now() - cached.fetchedAt < CACHE_TTL) {
+    recordCacheHit(`/despesas/${republicaId}/${despesaId}/pagamentos`, 'hit')
+    return Promise.resolve(cached.pagamentos)
+  }
+  if (!force && inFlight.has(key)) {
+    recordCacheHit(`/despesas/${republicaId}/${despesaId}/pagamentos`, 'shared')
+    return inFlight.get(key)
+  }
+
+  const request = api.get(`/despesas/${republicaId}/${despesaId}/pagamentos`)
+    .then(response => {
+      const pagamentos = response.data.pagamentos || []
+      paymentsCache.set(key, { pagamentos, fetchedAt: Date.now() })
+      return pagamentos
+    })
+    .finally(() => {
+      if (inFlight.get(key) === request) {
+        inFlight.delete(key)
+      }
+    })
+
+  inFlight.set(key, request)
+  return request
+}
+
+// Pagamentos em cache de uma despesa (sem requisição), ou undefined
+export function peekExpensePayments(republicaId, despesaId) {
+  const cached = paymentsCache.get(cacheKey(republicaId, despesaId))
+  if (!cached || Date.now() - cached.fetchedAt >= CACHE_TTL) return undefined
+  return cached.pagamentos
+}
+
+// Descartar o cache de uma despesa (após registrar pagamento, editar ou excluir)
+export function invalidateExpensePayments(republicaId, despesaId) {
+  paymentsCache.delete(cacheKey(republicaId, despesaId))
+}
+
+// Descartar o cache de uma república inteira (ou de todas, sem argumento)
+export function clearPaymentsCache(republicaId) {
+  if (republicaId === undefined) {
+    paymentsCache.clear()
+    return
+  }
+  for (const key of paymentsCache.keys()) {
+    if (key.startsWith(`${republicaId}:`)) {
+      paymentsCache.delete(key)
+    }
+  }
+}
+
+// Mutações que mudam pagamentos: registrar pagamento, editar/excluir despesa
+// (/despesas/{rep}/{id}/...) e excluir membro (remove os pagamentos dele)
+api.interceptors.response.use((response) => {
+  const method = response.config?.method?.toLowerCase()
+  if (method && method !== 'get' && response.config.url) {
+    const path = response.config.url.replace(/^https?:\/\/[^/]+/, '').split('?')[0]
+    const [resource, republicaId, itemId] = path.split('/').filter(Boolean)
+    if (resource === 'despesas' && itemId) {
+      invalidateExpensePayments(republicaId, itemId)
+    } else if (resource === 'membros' && method === 'delete') {
+      clearPaymentsCache(republicaId)
+    }
+  }
+  return response
+})
+
+// Pagamento achatado com as informações da despesa usadas pela tabela
+const withExpenseInfo = (payment, expense) => ({
+  ...payment,
+  despesa_id: payment.despesa_id ?? expense.id,
+  despesa_descricao: expense.descricao,
+  despesa_categoria: expense.categoria,
+  despesa_status: expense.status ? expense.status.toLowerCase() : 'pendente',
+  despesa_vencimento: expense.data_vencimento
+})
+
+// Carregar os pagamentos de todas as despesas em páginas. `onBatch` recebe os
+// pagamentos de cada página assim que ela termina e `onProgress` o número de
+// despesas já processadas. `isCancelled` interrompe as páginas seguintes.
+export async function streamRepublicPayments(republicaId, expenses, {
+  force = false,
+  onBatch,
+  onProgress,
+  isCancelled = () => false
+} = {}) {
+  let done = 0
+
+  for (let start = 0; start < expenses.length; start += PAGE_SIZE) {
+    if (isCancelled()) return
+
+    const page = expenses.slice(start, start + PAGE_SIZE)
+    const results = await mapWithConcurrency(page, MAX_CONCURRENT_REQUESTS, async (expense) => {
+      try {
+        const pagamentos = await fetchExpensePayments(republicaId, expense.id, { force })
+        return pagamentos.map(payment => withExpenseInfo(payment, expense))
+      } catch (err) {
+        console.error(`Erro ao buscar pagamentos da despesa ${expense.id}:`, err)
+        return []
+      }
+    })
+
+    if (isCancelled()) return
+
+    done += page.length
+    if (onBatch) onBatch(results.flat())
+    if (onProgress) onProgress(done, expenses.length)
+  }
+}
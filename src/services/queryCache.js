@@ -0,0 +1,186 @@
+import api from './api'
+import { readOffline, removeOffline, writeOffline } from './offlineStore'
+import { recordCacheHit } from './telemetry'
+
+// Cache compartilhado das leituras (GET) feitas pelas seções do dashboard.
+// - Requisições iguais em andamento são reaproveitadas (uma só ida ao backend)
+// - Dentro de STALE_TIME o dado em cache é usado sem nova requisição
+// - Depois disso, até MAX_AGE, o dado em cache é devolvido na hora e revalidado
+//   em segundo plano (stale-while-revalidate); `onUpdate` recebe a resposta nova
+// - Acima de MAX_ENTRIES as entradas usadas há mais tempo são descartadas (LRU)
+// - POST/PUT/PATCH/DELETE bem-sucedidos invalidam as chaves do mesmo recurso
+// - Respostas dos recursos em PERSISTED também são gravadas no IndexedDB
+//   (services/offlineStore.js); numa abertura nova do app, quem passa `onUpdate`
+//   recebe a cópia local na hora e a resposta da API quando ela chegar
+const STALE_TIME = 30 * 1000
+const MAX_AGE = 5 * 60 * 1000
+const MAX_ENTRIES = 100
+const PERSISTED = ['/republicas', '/membros', '/quartos', '/despesas']
+
+const entries = new Map()
+
+// Chave = URL + parâmetros em ordem alfabética
+function buildKey(url, params) {
+  if (!params || Object.keys(params).length === 0) return url
+  const query = Object.keys(params)
+    .sort()
+    .map(name => `${name}=${params[name]}`)
+    .join('&')
+  return `${url}${url.includes('?') ? '&' : '?'}${query}`
+}
+
+// "/membros/3" casa com "/membros/3", "/membros/3/..." e "/membros/3?...", mas não "/membros/30"
+function matchesPrefix(key, prefix) {
+  const next = key.charAt(prefix.length)
+  return key.startsWith(prefix) && (next === '' || next === '/' || next === '?')
+}
+
+const isPersisted = (key) => PERSISTED.some(prefix => matchesPrefix(key, prefix))
+
+// Marcar a entrada como usada agora (fim da fila do LRU)
+function touch(key, entry) {
+  entries.delete(key)
+  entries.set(key, entry)
+}
+
+function evict() {
+  for (const [key, entry] of entries) {
+    if (entries.size <= MAX_ENTRIES) break
+    if (!entry.promise) {
+      entries.delete(key)
+    }
+  }
+}
+
+function revalidate(key, url, params) {
+  const entry = entries.get(key) || { response: null, fetchedAt: 0, promise: null }
+  if (entry.promise) {
+    recordCacheHit(key, 'shared')
+    return entry.promise
+  }
+
+  const request = api.get(url, params ? { params } : undefined)
+    .then(response => {
+      // A entrada pode ter sido invalidada enquanto a requisição estava em andamento
+      if (entries.get(key) === entry) {
+        entry.response = response
+        entry.fetchedAt = Date.now()
+        if (isPersisted(key)) {
+          writeOffline(key, response.data)
+        }
+      }
+      return response
+    })
+    .finally(() => {
+      entry.promise = null
+    })
+
+  entry.promise = request
+  touch(key, entry)
+  evict()
+  return request
+}
+
+// GET com cache: mesma assinatura de retorno do axios ({ data, ... })
+export function cachedGet(url, { params, force = false, onUpdate } = {}) {
+  const key = buildKey(url, params)
+  const entry = entries.get(key)
+  const age = entry?.response ? Date.now() - entry.fetchedAt : Infinity
+
+  if (!force && entry?.response && age < MAX_AGE) {
+    touch(key, entry)
+    recordCacheHit(key, age >= STALE_TIME ? 'stale' : 'hit')
+
+    if (age >= STALE_TIME) {
+      revalidate(key, url, params)
+        .then(response => {
+          if (onUpdate) onUpdate(response)
+        })
+        .catch(err => console.error(`Erro ao revalidar ${key}:`, err))
+    }
+    return Promise.resolve(entry.response)
+  }
+
+  // Sem cache válido (ou com `force`): busca, reaproveitando uma requisição em andamento
+  const request = revalidate(key, url, params)
+  if (force || !onUpdate || !isPersisted(key)) return request
+
+  // Enquanto a API não responde, serve a cópia local; a resposta nova vai para `onUpdate`
+  const readStart = performance.now()
+  return readOffline(key).then(saved => {
+    if (!saved || entries.get(key)?.response) return request
+
+    recordCacheHit(key, 'offline', { duration: performance.now() - readStart })
+    request
+      .then(response => onUpdate(response))
+      .catch(err => console.error(`Erro ao revalidar ${key}:`, err))
+    return { data: saved.data, offline: true, savedAt: saved.savedAt }
+  })
+}
+
+// Dado em cache (sem requisição), para o primeiro render
+export function peekQuery(url, params) {
+  const entry = entries.get(buildKey(url, params))
+  if (!entry?.response || Date.now() - entry.fetchedAt >= MAX_AGE) return undefined
+  return entry.response
+}
+
+// Remover as chaves de um recurso (em memória e no IndexedDB): "/membros/3"
+// remove "/membros/3" e "/membros/3/..." mas não "/membros/30"
+export function invalidateQueries(prefix) {
+  for (const key of [...entries.keys()]) {
+    if (matchesPrefix(key, prefix)) {
+      entries.delete(key)
+    }
+  }
+  if (isPersisted(prefix)) {
+    removeOffline(key => matchesPrefix(key, prefix))
+  }
+}
+
+export function clearQueryCache() {
+  entries.clear()
+}
+
+// Recursos afetados por uma mutação, a partir da URL chamada
+function invalidateForMutation(url) {
+  const path = url.replace(/^https?:\/\/[^/]+/, '').split('?')[0]
+  const [resource, republicaId] = path.split('/').filter(Boolean)
+
+  switch (resource) {
+    case 'republicas':
+      invalidateQueries('/republicas')
+      break
+    case 'membros':
+      invalidateQueries(`/membros/${republicaId}`)
+      // Quartos exibem os membros alocados
+      invalidateQueries('/quartos')
+      break
+    case 'quartos':
+      // Alocar/remover membro de quarto altera o quarto_id dos membros
+      invalidateQueries('/quartos')
+      invalidateQueries('/membros')
+      break
+    case 'despesas':
+      // Inclui a lista, a despesa e os pagamentos (status muda com o pagamento)
+      invalidateQueries(`/despesas/${republicaId}`)
+      break
+    case 'users':
+      invalidateQueries('/users')
+      break
+    case 'auth':
+      clearQueryCache()
+      break
+    default:
+      break
+  }
+}
+
+// Invalidar após qualquer mutação bem-sucedida feita pela instância `api`
+api.interceptors.response.use((response) => {
+  const method = response.config?.method?.toLowerCase()
+  if (method && method !== 'get' && response.config.url) {
+    invalidateForMutation(response.config.url)
+  }
+  return response
+})
@@ -0,0 +1,75 @@
+import { buildCsv, buildXlsx, ExportCancelledError } from '../utils/reportExport'
+
+export { ExportCancelledError }
+
+// Gerar o arquivo do relatório num Web Worker. Devolve { promise, cancel }:
+// `promise` resolve com o Blob e `cancel()` interrompe a geração na hora
+// (a promise é rejeitada com ExportCancelledError).
+export function exportReport(format, data, { onProgress } = {}) {
+  if (typeof Worker === 'undefined') {
+    return exportOnMainThread(format, data, { onProgress })
+  }
+
+  const worker = new Worker(new URL('../workers/reportExport.worker.js', import.meta.url), { type: 'module' })
+  let rejectJob
+
+  const promise = new Promise((resolve, reject) => {
+    rejectJob = reject
+
+    worker.onmessage = (event) => {
+      const message = event.data
+      if (message.type === 'progress') {
+        if (onProgress) onProgress(message.done, message.total)
+      } else if (message.type === 'done') {
+        worker.terminate()
+        resolve(message.blob)
+      } else if (message.type === 'error') {
+        worker.terminate()
+        reject(new Error(message.message))
+      }
+    }
+    worker.onerror = (event) => {
+      worker.terminate()
+      reject(new Error(event.message || 'Erro ao gerar o arquivo'))
+    }
+  })
+
+  worker.postMessage({ format, data })
+
+  return {
+    promise,
+    cancel: () => {
+      worker.terminate()
+      rejectJob(new ExportCancelledError())
+    }
+  }
+}
+
+// Sem suporte a workers: mesma geração em blocos, cedendo a thread entre eles
+function exportOnMainThread(format, data, { onProgress }) {
+  let cancelled = false
+  const build = format === 'xlsx' ? buildXlsx : buildCsv
+
+  return {
+    promise: build(data, { onProgress, isCancelled: () => cancelled }),
+    cancel: () => {
+      cancelled = true
+    }
+  }
+}
+
+// Baixar um Blob com o nome informado
+export function downloadBlob(blob, fileName) {
+  const link = document.createElement('a')
+  const url = URL.createObjectURL(blob)
+
+  link.setAttribute('href', url)
+  link.setAttribute('download', fileName)
+  link.style.visibility = 'hidden'
+  document.body.appendChild(link)
+  link.click()
+  document.body.removeChild(link)
+
+  // Dar tempo para o navegador iniciar o download antes de liberar a URL
+  setTimeout(() => URL.revokeObjectURL(url), 1000)
+}
@@ -0,0 +1,201 @@
+// Telemetria das chamadas à API, só em memória.
+// - Cada tentativa de requisição (inclusive as repetições do api.js) vira um
+//   registro com rota normalizada (/despesas/:rep/:id/pagamentos), status,
+//   duração, bytes enviados/recebidos e quantas requisições estavam em andamento
+// - Respostas servidas pelos caches (queryCache, pagamentos, IndexedDB) entram
+//   como registros sem rede, com `cache` = 'hit' | 'stale' | 'offline' | 'shared'
+//   ('shared' = reaproveitou uma requisição igual já em andamento)
+// - Os registros ficam num buffer circular de CAPACITY posições
+// - `window.__perf` expõe os dados para o painel (PerfPanel) e para os testes Selenium
+const CAPACITY = 1000
+
+const buffer = new Array(CAPACITY)
+let writeIndex = 0
+let size = 0
+let nextId = 1
+let inFlight = 0
+let maxInFlight = 0
+const listeners = new Set()
+
+// Instante em ms desde a época, comparável com o `performance.timeOrigin` do Selenium
+const now = () => performance.timeOrigin + performance.now()
+
+// Primeiro id numérico depois de despesas/membros/republicas é a república
+const REPUBLIC_SCOPED = new Set(['despesas', 'membros', 'republicas'])
+
+export function endpointTemplate(url = '') {
+  const path = url.replace(/^https?:\/\/[^/]+/, '').split('?')[0]
+  const segments = path.split('/').filter(Boolean)
+  let seenId = false
+
+  const normalized = segments.map(segment => {
+    if (!/^\d+$/.test(segment)) return segment
+    const name = !seenId && REPUBLIC_SCOPED.has(segments[0]) ? ':rep' : ':id'
+    seenId = true
+    return name
+  })
+  return '/' + normalized.join('/')
+}
+
+function push(entry) {
+  buffer[writeIndex] = entry
+  writeIndex = (writeIndex + 1) % CAPACITY
+  size = Math.min(size + 1, CAPACITY)
+  for (const listener of listeners) listener(entry)
+}
+
+// Registros em ordem cronológica (opcionalmente só os que começaram em `since` ou depois)
+export function getEntries(since = 0) {
+  const entries = []
+  const first = size < CAPACITY ? 0 : writeIndex
+  for (let i = 0; i < size; i++) {
+    const entry = buffer[(first + i) % CAPACITY]
+    if (entry.start >= since) entries.push(entry)
+  }
+  return entries
+}
+
+const byteLength = (value) => {
+  if (value == null) return 0
+  if (typeof value === 'string') return value.length
+  if (value instanceof Blob) return value.size
+  if (value instanceof ArrayBuffer) return value.byteLength
+  if (value instanceof URLSearchParams) return value.toString().length
+  return 0
+}
+
+function responseBytes(response) {
+  const header = Number(response?.headers?.['content-length'])
+  if (header > 0) return header
+  const text = response?.request?.responseText
+  return typeof text === 'string' ? text.length : 0
+}
+
+// Registrar as requisições de uma instância do axios. Deve ser chamada antes
+// de registrar os outros interceptors, para medir só a ida à rede de cada tentativa
+export function instrumentClient(client) {
+  client.interceptors.request.use((config) => {
+    inFlight++
+    maxInFlight = Math.max(maxInFlight, inFlight)
+    config.telemetry = { start: now(), inFlight }
+    return config
+  })
+
+  const finish = (config, response, error) => {
+    const started = config?.telemetry
+    if (!started || started.finished) return
+    started.finished = true
+    inFlight = Math.max(0, inFlight - 1)
+
+    push({
+      id: nextId++,
+      method: (config.method || 'get').toUpperCase(),
+      endpoint: endpointTemplate(config.url),
+      url: config.url,
+      status: response?.status ?? null,
+      ok: !error,
+      error: error ? error.code || error.message : null,
+      start: started.start,
+      duration: now() - started.start,
+      bytesOut: byteLength(config.data),
+      bytesIn: responseBytes(response),
+      inFlight: started.inFlight,
+      retry: config._retryCount || 0,
+      cache: null
+    })
+  }
+
+  client.interceptors.response.use(
+    (response) => {
+      finish(response.config, response, null)
+      return response
+    },
+    (error) => {
+      finish(error.config, error.response, error)
+      return Promise.reject(error)
+    }
+  )
+}
+
+// Resposta entregue por um cache, sem rede
+export function recordCacheHit(url, cache = 'hit', { method = 'GET', duration = 0 } = {}) {
+  push({
+    id: nextId++,
+    method,
+    endpoint: endpointTemplate(url),
+    url,
+    status: null,
+    ok: true,
+    error: null,
+    start: now() - duration,
+    duration,
+    bytesOut: 0,
+    bytesIn: 0,
+    inFlight,
+    retry: 0,
+    cache
+  })
+}
+
+function percentile(sorted, p) {
+  if (sorted.length === 0) return null
+  return sorted[Math.min(sorted.length - 1, Math.floor((sorted.length - 1) * p))]
+}
+
+// Resumo por "MÉTODO rota": contagem, p50/p95/máximo da rede, erros, bytes e acertos de cache
+export function summarize(since = 0) {
+  const groups = new Map()
+  for (const entry of getEntries(since)) {
+    const key = `${entry.method} ${entry.endpoint}`
+    if (!groups.has(key)) {
+      groups.set(key, { endpoint: key, count: 0, network: [], errors: 0, retries: 0, bytesIn: 0, cacheHits: 0 })
+    }
+    const group = groups.get(key)
+    group.count++
+    if (entry.cache) {
+      group.cacheHits++
+      continue
+    }
+    group.network.push(entry.duration)
+    group.bytesIn += entry.bytesIn
+    if (!entry.ok) group.errors++
+    if (entry.retry) group.retries++
+  }
+
+  return [...groups.values()]
+    .map(({ network, ...group }) => {
+      const sorted = network.sort((a, b) => a - b)
+      return {
+        ...group,
+        requests: sorted.length,
+        p50: percentile(sorted, 0.5),
+        p95: percentile(sorted, 0.95),
+        max: sorted.length ? sorted[sorted.length - 1] : null
+      }
+    })
+    .sort((a, b) => (b.p95 ?? -1) - (a.p95 ?? -1))
+}
+
+export function clearTelemetry() {
+  writeIndex = 0
+  size = 0
+  maxInFlight = inFlight
+}
+
+export const getInFlight = () => ({ current: inFlight, max: maxInFlight })
+
+// Avisar a cada registro novo; devolve a função para cancelar
+export function subscribe(listener) {
+  listeners.add(listener)
+  return () => listeners.delete(listener)
+}
+
+if (typeof window !== 'undefined') {
+  window.__perf = {
+    entries: getEntries,
+    summary: summarize,
+    inFlight: getInFlight,
+    clear: clearTelemetry,
+    now
+  }
+}
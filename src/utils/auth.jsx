@@ -1,17 +1,23 @@
 import { Navigate } from 'react-router-dom'
-import api from '../services/api'
+import api, { clearTokens } from '../services/api'
+import { clearOffline } from '../services/offlineStore'
+import { clearPaymentsCache } from '../services/payments'
+import { clearQueryCache } from '../services/queryCache'
 
 // Função para fazer logout completo (backend + frontend)
 export async function performLogout() {
   try {
-    // Tenta fazer logout no backend
-    await api.post('/auth/logout')
+    // Tenta fazer logout no backend (revogando também o token de renovação)
+    await api.post('/auth/logout', { refresh_token: localStorage.getItem('refresh_token') })
   } catch (error) {
     console.error('Erro ao fazer logout no backend:', error)
   } finally {
+    // Dados locais são do usuário do token: apagar antes de removê-lo
+    clearOffline()
     // Remove tokens do localStorage
-    localStorage.removeItem('access_token')
-    localStorage.removeItem('token_type')
+    clearTokens()
+    clearQueryCache()
+    clearPaymentsCache()
   }
 }
 
@@ -46,10 +52,7 @@ export function useAuth() {
     isAuthenticated: !!token,
     token,
     tokenType,
-    logout: () => {
-      localStorage.removeItem('access_token')
-      localStorage.removeItem('token_type')
-    },
+    logout: clearTokens,
     performLogout // Logout completo com chamada ao backend
   }
 }
@@ -0,0 +1,22 @@
+// Executa `worker` para cada item com no máximo `limit` chamadas simultâneas.
+// `onResult` é chamado assim que cada item termina (ordem de chegada), o que
+// permite atualizar a tela aos poucos em vez de esperar o mais lento.
+// O `worker` deve tratar os próprios erros: uma rejeição interrompe o lote.
+export async function mapWithConcurrency(items, limit, worker, onResult) {
+  const results = new Array(items.length)
+  let next = 0
+
+  const run = async () => {
+    while (next < items.length) {
+      const index = next++
+      results[index] = await worker(items[index], index)
+      if (onResult) {
+        onResult(results[index], items[index], index)
+      }
+    }
+  }
+
+  const runners = Array.from({ length: Math.min(Math.max(limit, 1), items.length) }, run)
+  await Promise.all(runners)
+  return results
+}
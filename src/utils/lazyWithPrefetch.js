@@ -0,0 +1,24 @@
+import { lazy } from 'react'
+
+// React.lazy com `prefetch()`: o chunk pode ser baixado antes do primeiro
+// render (ex.: ao passar o mouse no item do menu) e o lazy reaproveita a
+// mesma promise. Se o download falhar, a próxima tentativa busca de novo.
+export function lazyWithPrefetch(loader) {
+  let promise = null
+
+  const load = () => {
+    if (!promise) {
+      promise = loader().catch(err => {
+        promise = null
+        throw err
+      })
+    }
+    return promise
+  }
+
+  const Component = lazy(load)
+  Component.prefetch = () => {
+    load().catch(err => console.error('Erro ao pré-carregar módulo:', err))
+  }
+  return Component
+}
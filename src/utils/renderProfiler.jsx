@@ -0,0 +1,88 @@
+import { Profiler } from 'react'
+
+// Medição de renders do dashboard com <Profiler>, só no modo "profile"
+// (npm run dev:profile / npm run build:profile; ver vite.config.js).
+// - Cada região envolvida por <ProfiledRegion id="..."> soma commits, renders
+//   de montagem/atualização e o tempo de render (actualDuration/baseDuration)
+// - As somas são separadas por interação: `window.__profile.mark(nome)` fecha a
+//   interação atual (registrada com console.table) e abre a próxima
+// - `window.__profile.report()` devolve tudo para o test/perfil_render.py
+// Fora do modo profile, ProfiledRegion só devolve os filhos (sem custo).
+export const PROFILING = import.meta.env.MODE === 'profile'
+
+const round = (value) => Math.round(value * 100) / 100
+
+let interactions = []
+let current = null
+
+function startInteraction(name) {
+  current = { nome: name, inicio: performance.now(), regioes: {} }
+  interactions.push(current)
+  return current
+}
+
+function logInteraction(interaction) {
+  const rows = Object.entries(interaction.regioes).map(([id, region]) => ({ regiao: id, ...region }))
+  if (rows.length === 0) return
+  console.groupCollapsed(`[profile] ${interaction.nome}: ${rows.reduce((total, row) => total + row.commits, 0)} commits`)
+  console.table(rows)
+  console.groupEnd()
+}
+
+function handleRender(id, phase, actualDuration, baseDuration) {
+  const interaction = current || startInteraction('inicial')
+  const region = interaction.regioes[id] || (interaction.regioes[id] = {
+    commits: 0,
+    montagens: 0,
+    atualizacoes: 0,
+    render_ms: 0,
+    maior_render_ms: 0,
+    base_ms: 0
+  })
+
+  region.commits++
+  if (phase === 'mount') region.montagens++
+  else region.atualizacoes++
+  region.render_ms = round(region.render_ms + actualDuration)
+  region.maior_render_ms = round(Math.max(region.maior_render_ms, actualDuration))
+  // Custo de renderizar a região inteira sem memoização (último commit)
+  region.base_ms = round(baseDuration)
+}
+
+// Fechar a interação atual e começar `name`
+export function markInteraction(name) {
+  if (current) logInteraction(current)
+  startInteraction(name)
+}
+
+export function getProfileReport() {
+  return {
+    gerado_em: new Date().toISOString(),
+    interacoes: interactions.map(({ inicio, ...interaction }) => ({
+      ...interaction,
+      inicio_ms: round(inicio)
+    }))
+  }
+}
+
+export function clearProfile() {
+  interactions = []
+  current = null
+}
+
+export function ProfiledRegion({ id, children }) {
+  if (!PROFILING) return children
+  return (
+    <Profiler id={id} onRender={handleRender}>
+      {children}
+    </Profiler>
+  )
+}
+
+if (PROFILING && typeof window !== 'undefined') {
+  window.__profile = {
+    mark: markInteraction,
+    report: getProfileReport,
+    clear: clearProfile
+  }
+}
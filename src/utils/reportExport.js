@@ -0,0 +1,326 @@
+import { expenseStatus } from './selectors'
+
+// Geração dos arquivos do relatório (CSV e XLSX). Roda dentro do Web Worker
+// (workers/reportExport.worker.js) e, sem suporte a workers, na thread principal.
+// As linhas são convertidas em blocos de CHUNK_SIZE e viram partes do Blob,
+// sem montar uma string única com o arquivo inteiro.
+
+const CHUNK_SIZE = 1000
+const encoder = new TextEncoder()
+
+// Formatadores criados uma vez e reaproveitados em todas as células
+const currencyFormatter = new Intl.NumberFormat('pt-BR', { style: 'currency', currency: 'BRL' })
+const dateFormatter = new Intl.DateTimeFormat('pt-BR', { timeZone: 'UTC' })
+const dateTimeFormatter = new Intl.DateTimeFormat('pt-BR', {
+  timeZone: 'America/Sao_Paulo',
+  year: 'numeric',
+  month: '2-digit',
+  day: '2-digit',
+  hour: '2-digit',
+  minute: '2-digit',
+  second: '2-digit'
+})
+
+export class ExportCancelledError extends Error {
+  constructor() {
+    super('Exportação cancelada')
+    this.name = 'ExportCancelledError'
+  }
+}
+
+const formatCurrency = (value) => currencyFormatter.format(value)
+
+const formatDate = (dateString) => (dateString ? dateFormatter.format(new Date(dateString)) : 'N/A')
+
+const formatDateTime = (dateString) => {
+  if (!dateString) return 'N/A'
+  const date = dateString.includes('Z') || dateString.includes('+')
+    ? new Date(dateString)
+    : new Date(dateString + 'Z')
+  return dateTimeFormatter.format(date)
+}
+
+const STATUS_LABELS = { pago: 'Pago', vencida: 'Vencida', pendente: 'Pendente' }
+
+// Converter `items` em blocos, devolvendo o controle ao event loop entre eles
+// (é quando a mensagem de cancelamento consegue chegar)
+async function eachChunk(items, convert, { onChunk, onProgress, isCancelled }) {
+  for (let start = 0; start < items.length; start += CHUNK_SIZE) {
+    if (isCancelled()) throw new ExportCancelledError()
+    onChunk(items.slice(start, start + CHUNK_SIZE).map(convert))
+    if (onProgress) onProgress(Math.min(start + CHUNK_SIZE, items.length))
+    await new Promise(resolve => setTimeout(resolve, 0))
+  }
+}
+
+// ============================================================================
+// Planilhas (mesmo conteúdo para CSV e XLSX)
+// ============================================================================
+
+const EXPENSE_HEADERS = ['Data Vencimento', 'Descrição', 'Categoria', 'Valor Total', 'Status']
+
+const expenseRow = (categories) => (exp) => [
+  formatDate(exp.data_vencimento),
+  exp.descricao,
+  categories[exp.categoria] || exp.categoria,
+  formatCurrency(exp.valor_total),
+  STATUS_LABELS[expenseStatus(exp)]
+]
+
+const totalsRows = (totals) => [
+  [],
+  ['TOTAIS', '', '', '', ''],
+  ['Total Geral', '', '', formatCurrency(totals.total), ''],
+  ['Total Pago', '', '', formatCurrency(totals.totalPaid), ''],
+  ['Total Pendente', '', '', formatCurrency(totals.pending), ''],
+  ['Quantidade de Despesas', '', '', totals.count, '']
+]
+
+const PAYMENT_HEADERS = ['Membro', 'Despesa', 'Categoria', 'Data do Pagamento', 'Valor Pago']
+
+const memberNames = (members) => new Map(members.map(m => [m.id, m.fullname]))
+
+// Pagamentos agrupados por membro (ordem alfabética), com subtotal de cada um
+function paymentsByMember(payments, members) {
+  const names = memberNames(members)
+  const groups = new Map()
+  for (const payment of payments) {
+    const name = names.get(payment.membro_id) || 'Desconhecido'
+    if (!groups.has(name)) groups.set(name, [])
+    groups.get(name).push(payment)
+  }
+  return [...groups.entries()].sort(([a], [b]) => a.localeCompare(b, 'pt-BR'))
+}
+
+// ============================================================================
+// CSV
+// ============================================================================
+
+const csvCell = (cell) => `"${String(cell ?? '').replace(/"/g, '""')}"`
+const csvLine = (row) => row.map(csvCell).join(',') + '\n'
+
+export async function buildCsv({ expenses, categories, totals }, { onProgress, isCancelled = () => false } = {}) {
+  const parts = [EXPENSE_HEADERS.join(',') + '\n']
+
+  await eachChunk(expenses, expenseRow(categories), {
+    onChunk: (rows) => parts.push(rows.map(csvLine).join('')),
+    onProgress: onProgress && ((done) => onProgress(done, expenses.length)),
+    isCancelled
+  })
+
+  parts.push(totalsRows(totals).map(csvLine).join('').replace(/\n$/, ''))
+  return new Blob(parts, { type: 'text/csv;charset=utf-8;' })
+}
+
+// ============================================================================
+// XLSX (Office Open XML sem compressão: um ZIP "stored" com as planilhas)
+// ============================================================================
+
+const escapeXml = (value) => String(value ?? '')
+  .replace(/&/g, '&amp;')
+  .replace(/</g, '&lt;')
+  .replace(/>/g, '&gt;')
+  .replace(/"/g, '&quot;')
+  // Caracteres de controle não são permitidos em XML
+  .replace(/[\u0000-\u0008\u000B\u000C\u000E-\u001F]/g, '')
+
+const xlsxCell = (cell) => (typeof cell === 'number'
+  ? `<c t="n"><v>${cell}</v></c>`
+  : `<c t="inlineStr"><is><t xml:space="preserve">${escapeXml(cell)}</t></is></c>`)
+
+const xlsxRow = (row) => `<row>${row.map(xlsxCell).join('')}</row>`
+
+const SHEET_START = '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>' +
+  '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"><sheetData>'
+const SHEET_END = '</sheetData></worksheet>'
+
+const CRC_TABLE = (() => {
+  const table = new Uint32Array(256)
+  for (let n = 0; n < 256; n++) {
+    let c = n
+    for (let k = 0; k < 8; k++) {
+      c = c & 1 ? 0xEDB88320 ^ (c >>> 1) : c >>> 1
+    }
+    table[n] = c >>> 0
+  }
+  return table
+})()
+
+function crc32(bytes, crc = 0) {
+  let c = crc ^ 0xFFFFFFFF
+  for (let i = 0; i < bytes.length; i++) {
+    c = CRC_TABLE[(c ^ bytes[i]) & 0xFF] ^ (c >>> 8)
+  }
+  return (c ^ 0xFFFFFFFF) >>> 0
+}
+
+// Arquivos do ZIP escritos em partes: o cabeçalho local de cada arquivo é
+// preenchido depois que o conteúdo termina (CRC e tamanho só são conhecidos no fim)
+class ZipWriter {
+  constructor() {
+    this.parts = []
+    this.entries = []
+    this.offset = 0
+  }
+
+  startFile(name) {
+    const nameBytes = encoder.encode(name)
+    const header = new Uint8Array(30 + nameBytes.length)
+    this.parts.push(header)
+    this.current = { name: nameBytes, header, crc: 0, size: 0, offset: this.offset }
+    this.offset += header.length
+  }
+
+  write(text) {
+    const bytes = encoder.encode(text)
+    this.current.crc = crc32(bytes, this.current.crc)
+    this.current.size += bytes.length
+    this.offset += bytes.length
+    this.parts.push(bytes)
+  }
+
+  endFile() {
+    const { name, header, crc, size } = this.current
+    const view = new DataView(header.buffer)
+    view.setUint32(0, 0x04034b50, true)
+    view.setUint16(4, 20, true)
+    view.setUint16(6, 0x0800, true) // nomes em UTF-8
+    view.setUint16(8, 0, true) // sem compressão
+    view.setUint32(14, crc, true)
+    view.setUint32(18, size, true)
+    view.setUint32(22, size, true)
+    view.setUint16(26, name.length, true)
+    header.set(name, 30)
+    this.entries.push(this.current)
+    this.current = null
+  }
+
+  addFile(name, text) {
+    this.startFile(name)
+    this.write(text)
+    this.endFile()
+  }
+
+  finish(type) {
+    const start = this.offset
+    for (const entry of this.entries) {
+      const record = new Uint8Array(46 + entry.name.length)
+      const view = new DataView(record.buffer)
+      view.setUint32(0, 0x02014b50, true)
+      view.setUint16(4, 20, true)
+      view.setUint16(6, 20, true)
+      view.setUint16(8, 0x0800, true)
+      view.setUint32(16, entry.crc, true)
+      view.setUint32(20, entry.size, true)
+      view.setUint32(24, entry.size, true)
+      view.setUint16(28, entry.name.length, true)
+      view.setUint32(42, entry.offset, true)
+      record.set(entry.name, 46)
+      this.parts.push(record)
+      this.offset += record.length
+    }
+
+    const end = new Uint8Array(22)
+    const view = new DataView(end.buffer)
+    view.setUint32(0, 0x06054b50, true)
+    view.setUint16(8, this.entries.length, true)
+    view.setUint16(10, this.entries.length, true)
+    view.setUint32(12, this.offset - start, true)
+    view.setUint32(16, start, true)
+    this.parts.push(end)
+
+    return new Blob(this.parts, { type })
+  }
+}
+
+const XLSX_TYPE = 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+
+function workbookFiles(sheetNames) {
+  const sheets = sheetNames.map((name, i) => ({ name, id: i + 1 }))
+  return {
+    '[Content_Types].xml': '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>' +
+      '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">' +
+      '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>' +
+      '<Default Extension="xml" ContentType="application/xml"/>' +
+      '<Override PartName="/xl/workbook.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>' +
+      sheets.map(s => `<Override PartName="/xl/worksheets/sheet${s.id}.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>`).join('') +
+      '</Types>',
+    '_rels/.rels': '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>' +
+      '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">' +
+      '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="xl/workbook.xml"/>' +
+      '</Relationships>',
+    'xl/workbook.xml': '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>' +
+      '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" ' +
+      'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships"><sheets>' +
+      sheets.map(s => `<sheet name="${escapeXml(s.name)}" sheetId="${s.id}" r:id="rId${s.id}"/>`).join('') +
+      '</sheets></workbook>',
+    'xl/_rels/workbook.xml.rels': '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>' +
+      '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">' +
+      sheets.map(s => `<Relationship Id="rId${s.id}" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" Target="worksheets/sheet${s.id}.xml"/>`).join('') +
+      '</Relationships>'
+  }
+}
+
+// Planilhas: Despesas (igual ao CSV), Pagamentos (por membro, com subtotais)
+// e Resumo por Membro
+export async function buildXlsx({ expenses, payments = [], members = [], categories, totals }, {
+  onProgress,
+  isCancelled = () => false
+} = {}) {
+  const zip = new ZipWriter()
+  const total = expenses.length + payments.length
+  let done = 0
+  const progress = (count) => {
+    if (onProgress) onProgress(done + count, total)
+  }
+
+  const files = workbookFiles(['Despesas', 'Pagamentos', 'Resumo por Membro'])
+  for (const [name, content] of Object.entries(files)) {
+    zip.addFile(name, content)
+  }
+
+  zip.startFile('xl/worksheets/sheet1.xml')
+  zip.write(SHEET_START + xlsxRow(EXPENSE_HEADERS))
+  await eachChunk(expenses, expenseRow(categories), {
+    onChunk: (rows) => zip.write(rows.map(xlsxRow).join('')),
+    onProgress: progress,
+    isCancelled
+  })
+  zip.write(totalsRows(totals).map(xlsxRow).join('') + SHEET_END)
+  zip.endFile()
+  done = expenses.length
+
+  const groups = paymentsByMember(payments, members)
+  zip.startFile('xl/worksheets/sheet2.xml')
+  zip.write(SHEET_START + xlsxRow(PAYMENT_HEADERS))
+  const summary = []
+  for (const [name, memberPayments] of groups) {
+    let subtotal = 0
+    await eachChunk(memberPayments, (payment) => {
+      subtotal += payment.valor_pago
+      return [
+        name,
+        payment.despesa_descricao,
+        categories[payment.despesa_categoria] || payment.despesa_categoria,
+        formatDateTime(payment.data_pagamento),
+        formatCurrency(payment.valor_pago)
+      ]
+    }, {
+      onChunk: (rows) => zip.write(rows.map(xlsxRow).join('')),
+      onProgress: progress,
+      isCancelled
+    })
+    zip.write(xlsxRow([`Subtotal ${name}`, '', '', '', formatCurrency(subtotal)]))
+    summary.push([name, memberPayments.length, formatCurrency(subtotal)])
+    done += memberPayments.length
+  }
+  zip.write(SHEET_END)
+  zip.endFile()
+
+  zip.addFile('xl/worksheets/sheet3.xml', SHEET_START +
+    xlsxRow(['Membro', 'Quantidade de Pagamentos', 'Total Pago']) +
+    summary.map(xlsxRow).join('') +
+    SHEET_END)
+
+  return zip.finish(XLSX_TYPE)
+}
@@ -0,0 +1,165 @@
+import { dateInfo, expenseStatus, memoizeLast, today } from './selectors'
+
+// Índice das despesas do relatório, montado uma vez quando a lista carrega.
+// - Registros ordenados por vencimento: o período vira duas buscas binárias
+// - Um "bucket" por valor de cada dimensão (categoria, status), também ordenado
+// - Somas de prefixo de valor_total (total e pago) em cada bucket, então os
+//   totais de um período saem em O(1)
+// Mudar período, categoria ou status custa O(log n + linhas encontradas).
+//
+// Para um novo filtro por valor discreto (ex.: membro), basta incluir a
+// dimensão em DIMENSIONS: o bucket é criado e `filters[nome]` passa a valer.
+
+const DIMENSIONS = {
+  category: (expense) => expense.categoria,
+  status: (expense, todayTime) => expenseStatus(expense, todayTime)
+}
+
+const ALL = 'all'
+
+function buildBucket(items) {
+  const count = items.length
+  const times = new Float64Array(count)
+  const prefixTotal = new Float64Array(count + 1)
+  const prefixPaid = new Float64Array(count + 1)
+  const prefixPaidCount = new Uint32Array(count + 1)
+  let datedCount = 0
+
+  items.forEach((expense, i) => {
+    const time = dateInfo(expense, 'data_vencimento').time
+    // Sem vencimento: fim da lista, fora de qualquer filtro de período
+    times[i] = time === null ? Infinity : time
+    if (time !== null) datedCount = i + 1
+
+    const paid = expense.status?.toLowerCase() === 'pago'
+    prefixTotal[i + 1] = prefixTotal[i] + expense.valor_total
+    prefixPaid[i + 1] = prefixPaid[i] + (paid ? expense.valor_total : 0)
+    prefixPaidCount[i + 1] = prefixPaidCount[i] + (paid ? 1 : 0)
+  })
+
+  return { items, times, datedCount, prefixTotal, prefixPaid, prefixPaidCount }
+}
+
+// Primeira posição com times[i] >= value (ou > value, com `strict`)
+function lowerBound(times, value, hi, strict = false) {
+  let lo = 0
+  while (lo < hi) {
+    const mid = (lo + hi) >>> 1
+    if (times[mid] < value || (strict && times[mid] === value)) {
+      lo = mid + 1
+    } else {
+      hi = mid
+    }
+  }
+  return lo
+}
+
+export function createReportIndex(expenses, todayTime = today()) {
+  const sorted = expenses
+    .map(expense => ({ expense, time: dateInfo(expense, 'data_vencimento').time }))
+    .sort((a, b) => {
+      if (a.time === b.time) return 0
+      if (a.time === null) return 1
+      if (b.time === null) return -1
+      return a.time - b.time
+    })
+    .map(entry => entry.expense)
+
+  const buckets = new Map()
+  const groups = new Map()
+  for (const expense of sorted) {
+    for (const [name, keyOf] of Object.entries(DIMENSIONS)) {
+      const key = `${name}:${keyOf(expense, todayTime)}`
+      if (!groups.has(key)) groups.set(key, [])
+      groups.get(key).push(expense)
+    }
+  }
+  buckets.set(ALL, buildBucket(sorted))
+  for (const [key, items] of groups) {
+    buckets.set(key, buildBucket(items))
+  }
+
+  return { buckets, todayTime, size: sorted.length }
+}
+
+// Limites do período em ms (datas do filtro são dias inteiros, em UTC como o vencimento)
+const startBound = (startDate) => (startDate ? Date.parse(`${startDate}T00:00:00Z`) : null)
+const endBound = (endDate) => (endDate ? Date.parse(`${endDate}T23:59:59.999Z`) : null)
+
+function rangeOf(bucket, start, end) {
+  const hasPeriod = start !== null || end !== null
+  const limit = hasPeriod ? bucket.datedCount : bucket.items.length
+  const lo = start !== null ? lowerBound(bucket.times, start, limit) : 0
+  const hi = end !== null ? lowerBound(bucket.times, end, limit, true) : limit
+  return { lo, hi: Math.max(lo, hi) }
+}
+
+const EMPTY_BUCKET = buildBucket([])
+
+// Consultar o índice. `filters` tem um valor por dimensão ('all' ou ausente = sem filtro).
+// Devolve as despesas em ordem de vencimento decrescente (como a tabela) e os totais.
+export function queryReport(index, { startDate = '', endDate = '', filters = {} } = {}) {
+  const start = startBound(startDate)
+  const end = endBound(endDate)
+
+  const active = Object.entries(filters)
+    .filter(([name, value]) => DIMENSIONS[name] && value !== undefined && value !== ALL)
+
+  // Menor intervalo entre os buckets dos filtros ativos; os demais filtros
+  // são conferidos só nas linhas desse intervalo
+  let best = { bucket: index.buckets.get(ALL) || EMPTY_BUCKET, lo: 0, hi: 0, name: null }
+  best = { ...best, ...rangeOf(best.bucket, start, end) }
+  for (const [name, value] of active) {
+    const bucket = index.buckets.get(`${name}:${value}`) || EMPTY_BUCKET
+    const range = rangeOf(bucket, start, end)
+    if (best.name === null || range.hi - range.lo < best.hi - best.lo) {
+      best = { bucket, name, ...range }
+    }
+  }
+
+  const { bucket, lo, hi } = best
+  const remaining = active.filter(([name]) => name !== best.name)
+
+  let rows
+  let totals
+  if (remaining.length === 0) {
+    rows = bucket.items.slice(lo, hi)
+    const total = bucket.prefixTotal[hi] - bucket.prefixTotal[lo]
+    const totalPaid = bucket.prefixPaid[hi] - bucket.prefixPaid[lo]
+    totals = {
+      total,
+      totalPaid,
+      pending: total - totalPaid,
+      count: hi - lo,
+      paidCount: bucket.prefixPaidCount[hi] - bucket.prefixPaidCount[lo]
+    }
+  } else {
+    rows = []
+    let total = 0
+    let totalPaid = 0
+    let paidCount = 0
+    for (let i = lo; i < hi; i++) {
+      const expense = bucket.items[i]
+      if (!remaining.every(([name, value]) => String(DIMENSIONS[name](expense, index.todayTime)) === String(value))) {
+        continue
+      }
+      rows.push(expense)
+      total += expense.valor_total
+      if (expense.status?.toLowerCase() === 'pago') {
+        totalPaid += expense.valor_total
+        paidCount++
+      }
+    }
+    totals = { total, totalPaid, pending: total - totalPaid, count: rows.length, paidCount }
+  }
+
+  return { rows: rows.reverse(), totals }
+}
+
+// Seletores memoizados para o ReportsSection
+const computeReportIndex = memoizeLast(createReportIndex)
+
+export const selectReportIndex = (expenses) => computeReportIndex(expenses, today())
+
+export const selectReport = memoizeLast((index, startDate, endDate, category, status) =>
+  queryReport(index, { startDate, endDate, filters: { category, status } }))
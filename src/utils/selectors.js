@@ -0,0 +1,160 @@
+// Estado derivado das listas do dashboard (status, filtros, ordenação e totais).
+// - Datas são convertidas uma vez por registro (cache por objeto em WeakMap)
+// - Cada seletor guarda o último resultado e só recalcula quando alguma
+//   entrada muda de referência (ou o dia vira, já que o status depende de hoje)
+// - Buscas por id usam Maps em vez de `find` na lista
+
+// Memoização do último resultado, comparando os argumentos por referência
+export function memoizeLast(fn) {
+  let lastArgs = null
+  let lastResult
+
+  return (...args) => {
+    if (
+      lastArgs !== null &&
+      lastArgs.length === args.length &&
+      lastArgs.every((arg, i) => Object.is(arg, args[i]))
+    ) {
+      return lastResult
+    }
+    lastResult = fn(...args)
+    lastArgs = args
+    return lastResult
+  }
+}
+
+// Datas da API sem fuso são UTC
+export function parseApiDate(value) {
+  if (!value) return null
+  const time = (value.includes('Z') || value.includes('+') ? new Date(value) : new Date(value + 'Z')).getTime()
+  return Number.isNaN(time) ? null : time
+}
+
+// Início do dia (horário local), como os componentes comparavam o vencimento
+function startOfDay(time) {
+  const date = new Date(time)
+  date.setHours(0, 0, 0, 0)
+  return date.getTime()
+}
+
+export function today() {
+  return startOfDay(Date.now())
+}
+
+// Datas já convertidas de cada registro: { [campo]: { time, day } }
+const parsedDates = new WeakMap()
+
+export function dateInfo(record, field) {
+  let fields = parsedDates.get(record)
+  if (!fields) {
+    fields = {}
+    parsedDates.set(record, fields)
+  }
+  if (!(field in fields)) {
+    const time = parseApiDate(record[field])
+    fields[field] = { time, day: time === null ? null : startOfDay(time) }
+  }
+  return fields[field]
+}
+
+// Status real: 'pago' vem do backend; sem pagamento, vence no dia seguinte ao vencimento
+export function statusFrom(rawStatus, dueDay, todayTime = today()) {
+  const status = rawStatus ? rawStatus.toLowerCase() : 'pendente'
+  if (status === 'pago') return 'pago'
+  if (dueDay !== null && todayTime > dueDay) return 'vencida'
+  return 'pendente'
+}
+
+export function expenseStatus(expense, todayTime = today()) {
+  return statusFrom(expense.status, dateInfo(expense, 'data_vencimento').day, todayTime)
+}
+
+// Pagamento achatado (services/payments.js) carrega o status e o vencimento da despesa
+export function paymentStatus(payment, todayTime = today()) {
+  return statusFrom(payment.despesa_status, dateInfo(payment, 'despesa_vencimento').day, todayTime)
+}
+
+// Ordenação por uma data já convertida (registros sem data vão para o fim)
+function sortByDate(list, field, direction) {
+  const sign = direction === 'desc' ? -1 : 1
+  return list
+    .map(item => ({ item, time: dateInfo(item, field).time }))
+    .sort((a, b) => {
+      if (a.time === b.time) return 0
+      if (a.time === null) return 1
+      if (b.time === null) return -1
+      return (a.time - b.time) * sign
+    })
+    .map(entry => entry.item)
+}
+
+// ============================================================================
+// Seletores
+// ============================================================================
+
+// Map id -> registro (membros, despesas)
+export const selectMembersById = memoizeLast((members) => new Map(members.map(m => [m.id, m])))
+
+export const memberName = (membersById, memberId) => membersById.get(memberId)?.fullname || 'Desconhecido'
+
+// Abas do ExpensesSection: em aberto (vencimento mais antigo primeiro) e
+// histórico (mais recente primeiro), com o status de cada despesa por id
+const computeExpenseTabs = memoizeLast((expenses, todayTime) => {
+  const statusById = new Map()
+  const open = []
+  const paid = []
+
+  for (const expense of expenses) {
+    const status = expenseStatus(expense, todayTime)
+    statusById.set(expense.id, status)
+    if (status === 'pago') {
+      paid.push(expense)
+    } else {
+      open.push(expense)
+    }
+  }
+
+  return {
+    openExpenses: sortByDate(open, 'data_vencimento', 'asc'),
+    paidExpenses: sortByDate(paid, 'data_vencimento', 'desc'),
+    statusById
+  }
+})
+
+export const selectExpenseTabs = (expenses) => computeExpenseTabs(expenses, today())
+
+// Pagamentos filtrados por membro/status, mais recentes primeiro, com totais por membro
+const computePaymentsView = memoizeLast((payments, selectedMember, selectedStatus, todayTime) => {
+  const memberId = selectedMember === 'all' ? null : parseInt(selectedMember)
+  const status = selectedStatus === 'all' ? null : selectedStatus.toLowerCase()
+  const statusById = new Map()
+  const filtered = []
+  const memberPayments = {}
+  let totalPaid = 0
+
+  for (const payment of payments) {
+    if (memberId !== null && payment.membro_id !== memberId) continue
+
+    const currentStatus = paymentStatus(payment, todayTime)
+    if (status !== null && currentStatus !== status) continue
+
+    statusById.set(payment.id, currentStatus)
+    filtered.push(payment)
+    totalPaid += payment.valor_pago
+
+    if (!memberPayments[payment.membro_id]) {
+      memberPayments[payment.membro_id] = { count: 0, total: 0 }
+    }
+    memberPayments[payment.membro_id].count++
+    memberPayments[payment.membro_id].total += payment.valor_pago
+  }
+
+  return {
+    payments: sortByDate(filtered, 'data_pagamento', 'desc'),
+    statusById,
+    stats: { totalPaid, totalPayments: filtered.length, memberPayments }
+  }
+})
+
+export const selectPaymentsView = (payments, selectedMember, selectedStatus) =>
+  computePaymentsView(payments, selectedMember, selectedStatus, today())
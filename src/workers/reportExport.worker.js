@@ -0,0 +1,18 @@
+import { buildCsv, buildXlsx } from '../utils/reportExport'
+
+// Exportação do relatório fora da thread principal.
+// Recebe { format, data } e responde com progress (done, total), done (blob) ou error.
+// O cancelamento é feito por quem criou o worker, com terminate().
+self.onmessage = async (event) => {
+  const { format, data } = event.data
+  const build = format === 'xlsx' ? buildXlsx : buildCsv
+
+  try {
+    const blob = await build(data, {
+      onProgress: (done, total) => self.postMessage({ type: 'progress', done, total })
+    })
+    self.postMessage({ type: 'done', blob })
+  } catch (err) {
+    self.postMessage({ type: 'error', message: err.message })
+  }
+}
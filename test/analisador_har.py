@@ -0,0 +1,332 @@
+import argparse
+import glob
+import json
+import os
+import statistics
+import sys
+from datetime import datetime
+
+# Analisador de HAR: procura nas requisições de API de cada interação (uma
+# "page" do HAR gravado pelo executor; ver har.py) os anti-padrões de
+# carregamento de dados e estima o tempo desperdiçado por cada um:
+# - cadeia_serial: mesma rota com ids diferentes, uma só começa quando a outra termina
+#   (poderiam ir em paralelo; desperdício = soma das durações - a maior)
+# - n_mais_1: uma requisição por item da lista (a partir de LIMIAR_N_MAIS_1 ids);
+#   desperdício = duração do grupo - mediana de uma requisição (custo de um endpoint em lote)
+# - get_duplicado: o mesmo GET repetido na interação sem mutação no meio
+#   (desperdício = duração das repetições)
+# - refetch_apos_mutacao: GET do recurso logo após POST/PUT/PATCH/DELETE nele,
+#   quando a resposta da mutação poderia atualizar o estado (desperdício = ida e volta do GET)
+# Funciona com HARs exportados pelo Chrome DevTools (pages/pageref) também.
+
+RELATORIO_HAR = "relatorio_har.json"
+
+LIMIAR_N_MAIS_1 = 5
+# Folga entre o fim de uma requisição e o início da seguinte para contar como "em série"
+FOLGA_SERIAL_MS = 50
+# Até quanto tempo depois da mutação um GET do mesmo recurso conta como refetch
+JANELA_REFETCH_MS = 3000
+
+TIPOS_API = {"xhr", "fetch"}
+MUTACOES = {"POST", "PUT", "PATCH", "DELETE"}
+# Rotas cujo primeiro número é o id da república (mesma regra de src/services/telemetry.js)
+ROTAS_POR_REPUBLICA = {"despesas", "membros", "republicas"}
+
+PADROES = {
+    "cadeia_serial": "requisições em série que poderiam ser paralelas",
+    "n_mais_1": "uma requisição por item (N+1)",
+    "get_duplicado": "GET repetido na mesma interação",
+    "refetch_apos_mutacao": "GET do recurso logo após mutá-lo",
+}
+
+
+# ============================================================================
+# LEITURA
+# ============================================================================
+def segmentos(url):
+    caminho = url.split("://", 1)[-1]
+    caminho = "/" + caminho.split("/", 1)[1] if "/" in caminho else "/"
+    partes = [p for p in caminho.split("?")[0].split("#")[0].split("/") if p]
+    # Proxy do Vite: /api/despesas/1 -> /despesas/1
+    return partes[1:] if partes[:1] == ["api"] else partes
+
+
+def molde(url):
+    partes = segmentos(url)
+    normalizadas = []
+    viu_id = False
+    for parte in partes:
+        if parte.isdigit():
+            parte = ":rep" if not viu_id and partes[0] in ROTAS_POR_REPUBLICA else ":id"
+            viu_id = True
+        normalizadas.append(parte)
+    return "/" + "/".join(normalizadas)
+
+
+def _instante_ms(texto):
+    return datetime.fromisoformat(texto.replace("Z", "+00:00")).timestamp() * 1000
+
+
+# Requisições de API do HAR, agrupadas por interação (pageref)
+def requisicoes_por_interacao(har, escopo="passo"):
+    grupos = {}
+    for entrada in har["log"]["entries"]:
+        tipo = (entrada.get("_resourceType") or "").lower()
+        if tipo and tipo not in TIPOS_API:
+            continue
+        if not tipo and "json" not in entrada["response"].get("content", {}).get("mimeType", ""):
+            continue
+        metodo = entrada["request"]["method"].upper()
+        if metodo == "OPTIONS" or entrada.get("_fromCache"):
+            continue
+        inicio = _instante_ms(entrada["startedDateTime"])
+        duracao = max(entrada.get("time") or 0, 0)
+        interacao = (entrada.get("pageref") or "(sem página)") if escopo == "passo" else "(arquivo)"
+        grupos.setdefault(interacao, []).append({
+            "metodo": metodo,
+            "url": entrada["request"]["url"].split("#")[0],
+            "molde": molde(entrada["request"]["url"]),
+            "status": entrada["response"].get("status", 0),
+            "inicio": inicio,
+            "fim": inicio + duracao,
+            "duracao": duracao,
+        })
+    for requisicoes in grupos.values():
+        requisicoes.sort(key=lambda r: r["inicio"])
+    return grupos
+
+
+# ============================================================================
+# ANTI-PADRÕES (cada função devolve uma lista de achados de uma interação)
+# ============================================================================
+def _achado(padrao, chave, requisicoes, desperdicio):
+    return {
+        "padrao": padrao,
+        "chave": chave,
+        "requisicoes": len(requisicoes),
+        "desperdicio_ms": round(max(desperdicio, 0), 1),
+        "urls": sorted({r["url"] for r in requisicoes})[:5],
+    }
+
+
+def _por_rota(requisicoes, metodo="GET"):
+    grupos = {}
+    for r in requisicoes:
+        if r["metodo"] == metodo:
+            grupos.setdefault(r["molde"], []).append(r)
+    return grupos
+
+
+def _sobrepoe(a, b):
+    return a["inicio"] < b["fim"] and b["inicio"] < a["fim"]
+
+
+def n_mais_1(requisicoes, limiar=LIMIAR_N_MAIS_1):
+    achados = []
+    for rota, grupo in _por_rota(requisicoes).items():
+        if ":id" not in rota or len({r["url"] for r in grupo}) < limiar:
+            continue
+        duracao = max(r["fim"] for r in grupo) - min(r["inicio"] for r in grupo)
+        achados.append(_achado("n_mais_1", f"GET {rota}", grupo,
+                               duracao - statistics.median(r["duracao"] for r in grupo)))
+    return achados
+
+
+def cadeias_seriais(requisicoes, limiar=LIMIAR_N_MAIS_1, folga=FOLGA_SERIAL_MS):
+    achados = []
+    for rota, grupo in _por_rota(requisicoes).items():
+        # Um grupo grande já aparece como N+1; lá o desperdício inclui o da série
+        if ":id" in rota and len({r["url"] for r in grupo}) >= limiar:
+            continue
+        # Só entram as que não correram junto com outra da mesma rota
+        isoladas = [r for r in grupo if not any(o is not r and _sobrepoe(r, o) for o in grupo)]
+        cadeia = []
+        for r in isoladas + [None]:
+            if r and cadeia and 0 <= r["inicio"] - cadeia[-1]["fim"] <= folga and r["url"] != cadeia[-1]["url"]:
+                cadeia.append(r)
+                continue
+            if len(cadeia) >= 2:
+                desperdicio = sum(c["duracao"] for c in cadeia) - max(c["duracao"] for c in cadeia)
+                achados.append(_achado("cadeia_serial", f"GET {rota}", cadeia, desperdicio))
+            cadeia = [r] if r else []
+    return achados
+
+
+def _relacionadas(url_a, url_b):
+    a, b = segmentos(url_a), segmentos(url_b)
+    comum = min(len(a), len(b))
+    return comum >= 2 and a[:comum] == b[:comum]
+
+
+def _mutacao_entre(requisicoes, url, inicio, fim):
+    return next((m for m in requisicoes if m["metodo"] in MUTACOES and inicio <= m["inicio"] < fim
+                 and _relacionadas(m["url"], url)), None)
+
+
+def gets_duplicados(requisicoes):
+    achados = []
+    vistos = {}
+    for r in requisicoes:
+        if r["metodo"] == "GET":
+            vistos.setdefault(r["url"], []).append(r)
+    for url, repetidas in vistos.items():
+        desperdicadas = []
+        referencia = repetidas[0]
+        for r in repetidas[1:]:
+            # Com mutação no meio o segundo GET é refetch (outro padrão), e passa a ser a referência
+            if _mutacao_entre(requisicoes, url, referencia["inicio"], r["inicio"]):
+                referencia = r
+            else:
+                desperdicadas.append(r)
+        if desperdicadas:
+            achados.append(_achado("get_duplicado", f"GET {referencia['molde']}", [referencia] + desperdicadas,
+                                   sum(r["duracao"] for r in desperdicadas)))
+    return achados
+
+
+def refetches_apos_mutacao(requisicoes, janela=JANELA_REFETCH_MS):
+    achados = []
+    for mutacao in requisicoes:
+        if mutacao["metodo"] not in MUTACOES or not 200 <= mutacao["status"] < 300:
+            continue
+        urls = set()
+        for r in requisicoes:
+            if (r["metodo"] == "GET" and r["url"] not in urls and 0 <= r["inicio"] - mutacao["fim"] <= janela
+                    and _relacionadas(mutacao["url"], r["url"])):
+                urls.add(r["url"])
+                achados.append(_achado("refetch_apos_mutacao",
+                                       f"{mutacao['metodo']} {mutacao['molde']} → GET {r['molde']}",
+                                       [mutacao, r], r["duracao"]))
+    return achados
+
+
+def analisar_har(har, escopo="passo", limiar=LIMIAR_N_MAIS_1):
+    achados = []
+    for interacao, requisicoes in requisicoes_por_interacao(har, escopo).items():
+        encontrados = (n_mais_1(requisicoes, limiar) + cadeias_seriais(requisicoes, limiar)
+                       + gets_duplicados(requisicoes) + refetches_apos_mutacao(requisicoes))
+        for achado in encontrados:
+            achado["interacao"] = interacao
+        achados.extend(encontrados)
+    return achados
+
+
+# ============================================================================
+# RANKING
+# ============================================================================
+# Soma os achados iguais (padrão + rota) de todos os arquivos e ordena pelo desperdício
+def ranquear(achados_por_arquivo):
+    grupos = {}
+    for arquivo, achados in achados_por_arquivo.items():
+        for achado in achados:
+            grupo = grupos.setdefault((achado["padrao"], achado["chave"]), {
+                "padrao": achado["padrao"],
+                "chave": achado["chave"],
+                "ocorrencias": 0,
+                "requisicoes": 0,
+                "desperdicio_ms": 0,
+                "arquivos": set(),
+                "interacoes": set(),
+            })
+            grupo["ocorrencias"] += 1
+            grupo["requisicoes"] += achado["requisicoes"]
+            grupo["desperdicio_ms"] += achado["desperdicio_ms"]
+            grupo["arquivos"].add(os.path.basename(arquivo))
+            grupo["interacoes"].add(achado["interacao"])
+
+    execucoes = max(len(achados_por_arquivo), 1)
+    ranking = []
+    for grupo in grupos.values():
+        ranking.append({
+            **grupo,
+            "desperdicio_ms": round(grupo["desperdicio_ms"], 1),
+            "por_execucao_ms": round(grupo["desperdicio_ms"] / execucoes, 1),
+            "arquivos": sorted(grupo["arquivos"]),
+            "interacoes": sorted(grupo["interacoes"]),
+        })
+    return sorted(ranking, key=lambda g: -g["desperdicio_ms"])
+
+
+def imprimir_ranking(ranking, execucoes, top=20):
+    print("\n" + "="*80)
+    print(f"ANTI-PADRÕES DE CARREGAMENTO ({execucoes} HAR(s); desperdício estimado)")
+    print("="*80)
+    if not ranking:
+        print("✓ Nenhum anti-padrão encontrado")
+        return
+    for posicao, grupo in enumerate(ranking[:top], 1):
+        print(f"{posicao:>2}. {grupo['padrao']:<21} {grupo['chave']}")
+        print(f"    {grupo['desperdicio_ms']:>9.0f}ms no total ({grupo['por_execucao_ms']:.0f}ms por execução)   "
+              f"{grupo['ocorrencias']} ocorrência(s), {grupo['requisicoes']} requisições")
+        interacoes = ", ".join(grupo["interacoes"][:4]) + (" ..." if len(grupo["interacoes"]) > 4 else "")
+        print(f"    em: {interacoes}")
+    if len(ranking) > top:
+        print(f"... e mais {len(ranking) - top} (ver o relatório JSON)")
+
+
+def salvar_analise(caminho, ranking, achados_por_arquivo, parametros):
+    pasta = os.path.dirname(caminho)
+    if pasta:
+        os.makedirs(pasta, exist_ok=True)
+    with open(caminho, "w", encoding="utf-8") as arquivo:
+        json.dump({
+            "gerado_em": datetime.now().isoformat(timespec="seconds"),
+            "parametros": parametros,
+            "padroes": PADROES,
+            "ranking": ranking,
+            "achados": achados_por_arquivo,
+        }, arquivo, ensure_ascii=False, indent=2)
+    return caminho
+
+
+def analisar_arquivos(caminhos, escopo="passo", limiar=LIMIAR_N_MAIS_1):
+    achados_por_arquivo = {}
+    for caminho in caminhos:
+        with open(caminho, encoding="utf-8") as arquivo:
+            achados_por_arquivo[caminho] = analisar_har(json.load(arquivo), escopo, limiar)
+    return ranquear(achados_por_arquivo), achados_por_arquivo
+
+
+def expandir(caminhos):
+    arquivos = []
+    for caminho in caminhos:
+        if os.path.isdir(caminho):
+            arquivos.extend(sorted(glob.glob(os.path.join(caminho, "*.har"))))
+        else:
+            arquivos.append(caminho)
+    return arquivos
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Procura anti-padrões de carregamento de dados em arquivos HAR")
+    parser.add_argument("hars", nargs="+", help="arquivos .har ou pastas com eles (ex.: a pasta de --har do executor)")
+    parser.add_argument("--escopo", choices=["passo", "arquivo"], default="passo",
+                        help="interação analisada: cada passo (page do HAR) ou o arquivo inteiro")
+    parser.add_argument("--limiar-n1", type=int, default=LIMIAR_N_MAIS_1,
+                        help=f"requisições da mesma rota por id para contar como N+1 (padrão: {LIMIAR_N_MAIS_1})")
+    parser.add_argument("--top", type=int, default=20, help="quantos itens do ranking mostrar")
+    parser.add_argument("--relatorio", default=RELATORIO_HAR, metavar="ARQUIVO.json")
+    parser.add_argument("--limite-ms", type=float, metavar="MS",
+                        help="sai com código 1 se algum item desperdiçar mais que isso por execução")
+    args = parser.parse_args()
+
+    arquivos = expandir(args.hars)
+    if not arquivos:
+        print("❌ Nenhum arquivo .har encontrado")
+        sys.exit(2)
+    ranking, achados = analisar_arquivos(arquivos, args.escopo, args.limiar_n1)
+    imprimir_ranking(ranking, len(arquivos), args.top)
+    caminho = salvar_analise(args.relatorio, ranking, achados,
+                             {"escopo": args.escopo, "limiar_n1": args.limiar_n1, "arquivos": len(arquivos)})
+    print(f"\n✓ Relatório: {caminho}")
+
+    if args.limite_ms is not None:
+        acima = [g for g in ranking if g["por_execucao_ms"] > args.limite_ms]
+        for grupo in acima:
+            print(f"❌ {grupo['padrao']} {grupo['chave']}: {grupo['por_execucao_ms']:.0f}ms por execução "
+                  f"(limite {args.limite_ms:.0f}ms)")
+        sys.exit(1 if acima else 0)
+
+
+if __name__ == "__main__":
+    main()
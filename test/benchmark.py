@@ -0,0 +1,323 @@
+import argparse
+import json
+import math
+import os
+import statistics
+import sys
+from datetime import datetime
+
+from selenium.webdriver.support.ui import Select
+
+from esperas import (
+    esperar_clicavel,
+    esperar_dom_estavel,
+    esperar_rede_ociosa,
+)
+from navegador import criar_navegador, limpar_sessao
+from metricas import Metricas, commit_atual, salvar_relatorio
+from paginas import BarraLateral, SecaoResumo
+from perfis_rede import PERFIL_PADRAO, PERFIS
+from servidor_falso import ServidorFalso
+from sessao import entrar_com_sessao
+
+# Benchmark de regressão: repete cada interação K vezes contra o backend falso
+# com dados semeados (10 a 5.000 despesas) e compara mediana/p95 com a baseline.
+# Para as tabelas virtualizadas, `--tamanhos 10000` mede também nós do DOM e heap.
+# O frontend precisa estar rodando com o proxy apontando para o backend falso:
+#   API_PROXY_TARGET=http://127.0.0.1:8000 npm run dev
+
+TAMANHOS_PADRAO = [10, 100, 1000, 5000]
+BASELINE_PADRAO = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline_desempenho.json")
+RELATORIO_BENCHMARK = "relatorio_benchmark.json"
+
+# Seções com milhares de despesas podem levar bem mais que as esperas normais
+TEMPO_LIMITE_BENCHMARK = 180
+
+
+# ============================================================================
+# INTERAÇÕES MEDIDAS
+# ============================================================================
+def ir_para(navegador, menu):
+    return BarraLateral(navegador, TEMPO_LIMITE_BENCHMARK).abrir(menu)
+
+
+# Abrir uma seção pesada a partir de uma leve (Quartos)
+def abrir_secao(menu):
+    def interacao(navegador, metricas, rodada):
+        barra = BarraLateral(navegador, TEMPO_LIMITE_BENCHMARK)
+        barra.abrir("quartos")
+        item = esperar_clicavel(navegador, barra.item(menu))
+        with metricas.medir(f"abrir_{menu}"):
+            item.click()
+            barra.secao(menu).carregada()
+    interacao.__name__ = f"abrir_{menu}"
+    return interacao
+
+
+# Trocar de república no RepublicsList (alterna entre as duas semeadas)
+def trocar_republica(navegador, metricas, rodada):
+    cartoes = ir_para(navegador, "republicas").itens()
+    cartao = cartoes[(rodada + 1) % len(cartoes)]
+    with metricas.medir("trocar_republica"):
+        cartao.click()
+        SecaoResumo(navegador, TEMPO_LIMITE_BENCHMARK).carregada()
+
+
+# Aplicar um filtro de categoria no ReportsSection
+def filtrar_relatorio(navegador, metricas, rodada):
+    categoria = Select(ir_para(navegador, "resumo").campo("category"))
+    with metricas.medir("filtrar_relatorio"):
+        categoria.select_by_value("luz")
+        esperar_dom_estavel(navegador, tempo=TEMPO_LIMITE_BENCHMARK)
+    categoria.select_by_value("all")
+    esperar_dom_estavel(navegador, tempo=TEMPO_LIMITE_BENCHMARK)
+
+
+INTERACOES = [
+    abrir_secao("despesas"),
+    abrir_secao("pagamentos"),
+    abrir_secao("resumo"),
+    trocar_republica,
+    filtrar_relatorio,
+]
+
+
+# O estado do backend falso é recriado a cada tamanho, então o login também
+def entrar(navegador, credenciais):
+    limpar_sessao(navegador)
+    entrar_com_sessao(navegador, credenciais, cadastrar=False, tempo=TEMPO_LIMITE_BENCHMARK)
+    esperar_rede_ociosa(navegador, tempo=TEMPO_LIMITE_BENCHMARK)
+
+
+# ============================================================================
+# ESTATÍSTICAS E BASELINE
+# ============================================================================
+def percentil(valores, p):
+    ordenados = sorted(valores)
+    return ordenados[max(0, math.ceil(p / 100 * len(ordenados)) - 1)]
+
+
+def mediana_ou_nada(valores):
+    valores = [v for v in valores if v is not None]
+    return statistics.median(valores) if valores else None
+
+
+# Agrupa os passos por "tamanho:passo" e calcula mediana/p95 do tempo total,
+# mais a mediana de nós do DOM, heap JS e tempo de API (window.__perf) do passo
+def calcular_estatisticas(execucoes):
+    grupos = {}
+    for tamanho, passos in execucoes:
+        for passo in passos:
+            if passo["sucesso"]:
+                grupos.setdefault(f"{tamanho}:{passo['passo']}", []).append(passo)
+    estatisticas = {}
+    for chave, passos in grupos.items():
+        tempos = [p["tempo_ms"] for p in passos]
+        nos_dom = mediana_ou_nada([p.get("nos_dom") for p in passos])
+        heap = mediana_ou_nada([p.get("heap_bytes") for p in passos])
+        api_ms = mediana_ou_nada([p.get("api_ms") for p in passos])
+        chamadas = mediana_ou_nada([p.get("chamadas_api") for p in passos])
+        estatisticas[chave] = {
+            "amostras": len(tempos),
+            "mediana_ms": round(statistics.median(tempos), 1),
+            "p95_ms": round(percentil(tempos, 95), 1),
+            "api_ms": None if api_ms is None else round(api_ms, 1),
+            "chamadas_api": None if chamadas is None else int(chamadas),
+            "nos_dom": None if nos_dom is None else int(nos_dom),
+            "heap_mb": None if heap is None else round(heap / 1024 / 1024, 1),
+        }
+    return estatisticas
+
+
+def carregar_baseline(caminho):
+    if not os.path.exists(caminho):
+        return None
+    with open(caminho, encoding="utf-8") as arquivo:
+        return json.load(arquivo)
+
+
+def salvar_baseline(caminho, estatisticas, repeticoes, perfil=PERFIL_PADRAO):
+    with open(caminho, "w", encoding="utf-8") as arquivo:
+        json.dump({
+            "gerado_em": datetime.now().isoformat(timespec="seconds"),
+            "commit": commit_atual(),
+            "repeticoes": repeticoes,
+            "perfil": perfil,
+            "passos": estatisticas,
+        }, arquivo, ensure_ascii=False, indent=2)
+
+
+# Um passo regrediu se piorou mais que `limite` % E mais que `folga_ms` (ruído).
+# Passo da baseline (nos tamanhos executados) que não foi medido agora também
+# conta como regressão: a interação falhou ou deixou de existir.
+def comparar(estatisticas, baseline, limite, folga_ms, metricas=("mediana_ms",), tamanhos=None):
+    comparacoes = []
+    passos_base = baseline["passos"] if baseline else {}
+    chaves = set(estatisticas) | {chave for chave in passos_base
+                                  if tamanhos is None or chave_ordenacao(chave)[0] in tamanhos}
+    for chave in sorted(chaves, key=chave_ordenacao):
+        atual = estatisticas.get(chave)
+        base = passos_base.get(chave)
+        for metrica in metricas:
+            variacao = None
+            if atual is None:
+                regrediu = True
+            else:
+                regrediu = False
+                if base and base.get(metrica):
+                    variacao = (atual[metrica] - base[metrica]) / base[metrica] * 100
+                    regrediu = variacao > limite and atual[metrica] - base[metrica] > folga_ms
+            comparacoes.append({
+                "passo": chave,
+                "metrica": metrica,
+                "atual_ms": atual[metrica] if atual else None,
+                "baseline_ms": base.get(metrica) if base else None,
+                "variacao_pct": None if variacao is None else round(variacao, 1),
+                "regrediu": regrediu,
+            })
+    return comparacoes
+
+
+def chave_ordenacao(chave):
+    tamanho, passo = chave.split(":", 1)
+    return int(tamanho), passo
+
+
+def imprimir_comparacoes(comparacoes, limite):
+    print("\n" + "="*80)
+    print(f"BENCHMARK (limite de regressão: {limite:.0f}%)")
+    print("="*80)
+    print(f"  {'despesas:passo':<32} {'métrica':<11} {'atual':>10} {'baseline':>10} {'variação':>9}")
+    for c in comparacoes:
+        simbolo = "❌" if c["regrediu"] else "✓"
+        base = f"{c['baseline_ms']:.0f}ms" if c["baseline_ms"] is not None else "-"
+        variacao = f"{c['variacao_pct']:+.1f}%" if c["variacao_pct"] is not None else "-"
+        atual = f"{c['atual_ms']:.0f}ms" if c["atual_ms"] is not None else "não medido"
+        print(f"{simbolo} {c['passo']:<32} {c['metrica']:<11} {atual:>10} {base:>10} {variacao:>9}")
+
+
+# Nós do DOM, heap e tempo de API de cada passo (só informativo, não entra na comparação)
+def imprimir_memoria(estatisticas):
+    print("\n" + "="*80)
+    print("DOM, MEMÓRIA E API (mediana ao final do passo)")
+    print("="*80)
+    print(f"  {'despesas:passo':<32} {'nós DOM':>10} {'heap JS':>10} {'chamadas':>9} {'API':>9}")
+    for chave, atual in sorted(estatisticas.items(), key=lambda item: chave_ordenacao(item[0])):
+        nos = f"{atual['nos_dom']}" if atual.get("nos_dom") is not None else "-"
+        heap = f"{atual['heap_mb']:.1f}MB" if atual.get("heap_mb") is not None else "-"
+        chamadas = f"{atual['chamadas_api']}" if atual.get("chamadas_api") is not None else "-"
+        api = f"{atual['api_ms']:.0f}ms" if atual.get("api_ms") is not None else "-"
+        print(f"  {chave:<32} {nos:>10} {heap:>10} {chamadas:>9} {api:>9}")
+
+
+# ============================================================================
+# EXECUÇÃO
+# ============================================================================
+def executar_benchmark(tamanhos, repeticoes, aquecimento=1, porta=8000, semente=42, latencia_ms=0, headless=True,
+                       perfil=PERFIL_PADRAO):
+    execucoes = []
+    relatorio = []
+    # Interações que falharam: (tamanho, interação, rodada, erro)
+    falhas = []
+    servidor = ServidorFalso(porta, semente=semente, latencia_ms=latencia_ms).iniciar()
+    navegador = criar_navegador(headless=headless, perfil=perfil)
+    try:
+        for tamanho in tamanhos:
+            print(f"\n▶ {tamanho} despesas por república ({repeticoes} repetições + {aquecimento} de aquecimento)")
+            servidor.estado.reiniciar(semente)
+            credenciais = servidor.estado.semear(republicas=2, despesas=tamanho)
+            entrar(navegador, credenciais)
+
+            metricas = Metricas(navegador, f"benchmark_{tamanho}")
+            for rodada in range(aquecimento + repeticoes):
+                if rodada == aquecimento:
+                    # Rodadas de aquecimento não entram nas estatísticas
+                    metricas.passos.clear()
+                for interacao in INTERACOES:
+                    try:
+                        interacao(navegador, metricas, rodada)
+                    except Exception as e:
+                        metricas.finalizar()
+                        print(f"❌ {interacao.__name__} (rodada {rodada}): {e}")
+                        falhas.append((tamanho, interacao.__name__, rodada, str(e)))
+            metricas.finalizar()
+            execucoes.append((tamanho, metricas.passos))
+            relatorio.append(metricas)
+            print(f"✓ {len(metricas.passos)} medições")
+    finally:
+        navegador.quit()
+        servidor.parar()
+    return execucoes, relatorio, falhas
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de desempenho do frontend com baseline")
+    parser.add_argument("-k", "--repeticoes", type=int, default=5, help="repetições de cada interação")
+    parser.add_argument("--aquecimento", type=int, default=1, help="rodadas descartadas antes de medir")
+    parser.add_argument("--tamanhos", type=lambda v: [int(t) for t in v.split(",")], default=TAMANHOS_PADRAO,
+                        help="quantidades de despesas semeadas, separadas por vírgula (padrão: 10,100,1000,5000)")
+    parser.add_argument("--baseline", default=BASELINE_PADRAO, help="arquivo de baseline")
+    parser.add_argument("--atualizar-baseline", action="store_true",
+                        help="grava os resultados desta execução como nova baseline")
+    parser.add_argument("--limite", type=float, default=20, help="regressão máxima tolerada (%%)")
+    parser.add_argument("--folga", type=float, default=25,
+                        help="diferença mínima (ms) para considerar regressão, abaixo disso é ruído")
+    parser.add_argument("--p95", action="store_true", help="compara também o p95, além da mediana")
+    parser.add_argument("--porta", type=int, default=8000, help="porta do backend falso")
+    parser.add_argument("--semente", type=int, default=42)
+    parser.add_argument("--latencia", type=float, default=0, help="latência (ms) do backend falso")
+    parser.add_argument("--com-janela", action="store_true", help="abre o Chrome com janela em vez de headless")
+    parser.add_argument("--perfil", choices=list(PERFIS), default=PERFIL_PADRAO, help="perfil de rede/CPU do Chrome")
+    parser.add_argument("--relatorio", default=RELATORIO_BENCHMARK, metavar="ARQUIVO.json")
+    args = parser.parse_args()
+
+    # Sem baseline compatível não há com o que comparar: falha antes de abrir o navegador
+    baseline = carregar_baseline(args.baseline)
+    if not args.atualizar_baseline:
+        if baseline is None:
+            print(f"❌ Baseline {args.baseline} não encontrada; rode com --atualizar-baseline para criá-la")
+            sys.exit(1)
+        if baseline.get("perfil", PERFIL_PADRAO) != args.perfil:
+            print(f"❌ A baseline foi gravada com o perfil {baseline.get('perfil', PERFIL_PADRAO)}, "
+                  f"não {args.perfil}: a comparação não é válida")
+            sys.exit(2)
+
+    execucoes, relatorio, falhas = executar_benchmark(args.tamanhos, args.repeticoes, args.aquecimento, args.porta,
+                                                      args.semente, args.latencia, headless=not args.com_janela,
+                                                      perfil=args.perfil)
+    estatisticas = calcular_estatisticas(execucoes)
+    metricas = ("mediana_ms", "p95_ms") if args.p95 else ("mediana_ms",)
+    comparacoes = comparar(estatisticas, None if args.atualizar_baseline else baseline, args.limite, args.folga,
+                           metricas, set(args.tamanhos))
+    imprimir_comparacoes(comparacoes, args.limite)
+    imprimir_memoria(estatisticas)
+
+    caminhos = salvar_relatorio(relatorio, args.relatorio, {
+        "repeticoes": args.repeticoes,
+        "latencia_ms": args.latencia,
+        "perfil": args.perfil,
+        "estatisticas": estatisticas,
+        "comparacoes": comparacoes,
+        "falhas": [{"tamanho": t, "interacao": nome, "rodada": rodada, "erro": erro}
+                   for t, nome, rodada, erro in falhas],
+    })
+    print(f"✓ Relatório: {', '.join(caminhos)}")
+
+    # Uma interação que falhou não tem medição confiável: reprova e não vira baseline
+    if falhas:
+        print(f"\n❌ {len(falhas)} interação(ões) falharam; veja 'falhas' no relatório")
+        sys.exit(1)
+    if args.atualizar_baseline:
+        salvar_baseline(args.baseline, estatisticas, args.repeticoes, args.perfil)
+        print(f"✓ Baseline atualizada: {args.baseline}")
+        sys.exit(0)
+
+    regressoes = [c for c in comparacoes if c["regrediu"]]
+    if regressoes:
+        print(f"\n❌ {len(regressoes)} passo(s) regrediram mais de {args.limite:.0f}% ou não foram medidos")
+        sys.exit(1)
+    print("\n✅ Nenhuma regressão acima do limite")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,471 @@
+import argparse
+import asyncio
+import json
+import math
+import os
+import random
+import re
+import ssl
+import statistics
+import subprocess
+import sys
+import time
+import urllib.parse
+from datetime import datetime
+
+from servidor_falso import SENHA_SEMENTE
+
+# Gerador de carga na API: N usuários virtuais repetem as mesmas requisições que
+# o frontend faz no login, ao abrir o dashboard e ao trocar de seção, cada um com
+# suas conexões keep-alive (até 6, como o navegador) e o cache do queryCache/payments.
+# Mede vazão e percentis de latência por rota. Sem dependências externas:
+#   python3 test/servidor_falso.py --porta 8000 --latencia 40        # em outro terminal
+#   python3 test/carga.py --url http://127.0.0.1:8000 --semear --usuarios 50 --rampa 20
+
+RELATORIO_CARGA = "relatorio_carga.json"
+
+# Mesmos limites do frontend: conexões por host no Chrome, pagamentos buscados
+# em páginas de 50 com 6 simultâneos (payments.js) e validade dos caches
+CONEXOES_POR_USUARIO = 6
+PAGINA_PAGAMENTOS = 50
+PAGAMENTOS_SIMULTANEOS = 6
+CACHE_FRESCO = 30          # queryCache STALE_TIME (s)
+CACHE_PAGAMENTOS = 5 * 60  # payments CACHE_TTL (s)
+
+
+# ============================================================================
+# HTTP/1.1 COM CONEXÕES REAPROVEITADAS
+# ============================================================================
+class ErroHttp(Exception):
+    pass
+
+
+class Conexoes:
+    """Pool de conexões keep-alive de um usuário virtual para um host."""
+
+    def __init__(self, url_base, maximo=CONEXOES_POR_USUARIO, tempo_limite=30):
+        partes = urllib.parse.urlsplit(url_base)
+        self.host = partes.hostname
+        self.https = partes.scheme == "https"
+        self.porta = partes.port or (443 if self.https else 80)
+        self.prefixo = partes.path.rstrip("/")
+        self.cabecalho_host = partes.netloc
+        self.tempo_limite = tempo_limite
+        self.semaforo = asyncio.Semaphore(maximo)
+        self.livres = []
+        self.abertas = 0
+
+    async def _abrir(self):
+        contexto = ssl.create_default_context() if self.https else None
+        leitor, escritor = await asyncio.open_connection(self.host, self.porta, ssl=contexto)
+        self.abertas += 1
+        return leitor, escritor
+
+    async def _ler_resposta(self, leitor):
+        linha = await leitor.readline()
+        if not linha:
+            raise ConnectionResetError("conexão fechada pelo servidor")
+        status = int(linha.split(b" ", 2)[1])
+        cabecalhos = {}
+        while True:
+            linha = await leitor.readline()
+            if linha in (b"\r\n", b"\n", b""):
+                break
+            nome, _, valor = linha.decode("latin-1").partition(":")
+            cabecalhos[nome.strip().lower()] = valor.strip()
+
+        if cabecalhos.get("transfer-encoding", "").lower() == "chunked":
+            partes = []
+            while True:
+                tamanho = int((await leitor.readline()).split(b";")[0], 16)
+                if tamanho == 0:
+                    await leitor.readline()
+                    break
+                partes.append(await leitor.readexactly(tamanho))
+                await leitor.readline()
+            corpo = b"".join(partes)
+        elif "content-length" in cabecalhos:
+            corpo = await leitor.readexactly(int(cabecalhos["content-length"]))
+        else:
+            corpo = await leitor.read()
+            cabecalhos["connection"] = "close"
+        return status, cabecalhos, corpo
+
+    async def _enviar(self, conexao, metodo, caminho, corpo, cabecalhos):
+        leitor, escritor = conexao
+        linhas = [f"{metodo} {self.prefixo}{caminho} HTTP/1.1", f"Host: {self.cabecalho_host}",
+                  "Connection: keep-alive", "Accept: application/json", f"Content-Length: {len(corpo)}"]
+        linhas += [f"{nome}: {valor}" for nome, valor in cabecalhos.items()]
+        escritor.write(("\r\n".join(linhas) + "\r\n\r\n").encode("latin-1") + corpo)
+        await escritor.drain()
+        return await self._ler_resposta(leitor)
+
+    async def requisitar(self, metodo, caminho, corpo=b"", cabecalhos=None):
+        async with self.semaforo:
+            reaproveitada = bool(self.livres)
+            conexao = self.livres.pop() if reaproveitada else await self._abrir()
+            try:
+                status, resposta, dados = await asyncio.wait_for(
+                    self._enviar(conexao, metodo, caminho, corpo, cabecalhos or {}), self.tempo_limite)
+            except (ConnectionError, asyncio.IncompleteReadError) as erro:
+                conexao[1].close()
+                if not reaproveitada:
+                    raise ErroHttp(str(erro) or type(erro).__name__)
+                # O servidor fechou a conexão ociosa: tenta uma vez numa nova
+                conexao = await self._abrir()
+                status, resposta, dados = await asyncio.wait_for(
+                    self._enviar(conexao, metodo, caminho, corpo, cabecalhos or {}), self.tempo_limite)
+            except BaseException:
+                conexao[1].close()
+                raise
+            if resposta.get("connection", "").lower() == "close":
+                conexao[1].close()
+            else:
+                self.livres.append(conexao)
+            return status, dados
+
+    def fechar(self):
+        for _, escritor in self.livres:
+            escritor.close()
+        self.livres.clear()
+
+
+# ============================================================================
+# COLETA
+# ============================================================================
+# /despesas/3/17/pagamentos -> /despesas/{rep}/{despesa}/pagamentos (mesmos moldes do servidor_falso)
+MOLDES = [
+    (re.compile(r"^/despesas/\d+/\d+/pagamentos$"), "/despesas/{rep}/{despesa}/pagamentos"),
+    (re.compile(r"^/despesas/\d+/\d+$"), "/despesas/{rep}/{despesa}"),
+    (re.compile(r"^/despesas/\d+$"), "/despesas/{rep}"),
+    (re.compile(r"^/membros/\d+$"), "/membros/{rep}"),
+    (re.compile(r"^/republicas/\d+$"), "/republicas/{rep}"),
+]
+
+
+def molde_da_rota(caminho):
+    caminho = caminho.split("?")[0].rstrip("/") or "/"
+    return next((molde for padrao, molde in MOLDES if padrao.match(caminho)), caminho)
+
+
+class Coleta:
+    def __init__(self):
+        self.amostras = []  # (instante, "MÉTODO molde", duração_ms, status, bytes)
+        self.falhas = []  # (instante, motivo): sessões que não chegaram às seções
+        self.inicio = time.perf_counter()
+        self.medindo_desde = None
+
+    def registrar(self, rota, duracao_ms, status, tamanho):
+        self.amostras.append((time.perf_counter() - self.inicio, rota, duracao_ms, status, tamanho))
+
+    def registrar_falha(self, motivo):
+        self.falhas.append((time.perf_counter() - self.inicio, motivo))
+
+
+def percentil(valores, p):
+    ordenados = sorted(valores)
+    return ordenados[max(0, math.ceil(p / 100 * len(ordenados)) - 1)]
+
+
+# Vazão e latência por rota, só com as amostras depois da rampa (carga estável)
+def resumir(coleta, duracao_total, incluir_rampa=False):
+    desde = 0 if incluir_rampa or coleta.medindo_desde is None else coleta.medindo_desde
+    janela = max(duracao_total - desde, 1e-9)
+    grupos = {}
+    for instante, rota, duracao, status, tamanho in coleta.amostras:
+        if instante >= desde:
+            grupos.setdefault(rota, []).append((duracao, status, tamanho))
+    grupos["TOTAL"] = [amostra for amostras in grupos.values() for amostra in amostras]
+
+    resumo = {}
+    for rota, amostras in grupos.items():
+        if not amostras:
+            continue
+        tempos = [a[0] for a in amostras]
+        resumo[rota] = {
+            "requisicoes": len(amostras),
+            "por_segundo": round(len(amostras) / janela, 1),
+            "erros": sum(1 for a in amostras if a[1] is None or a[1] >= 400),
+            "p50_ms": round(percentil(tempos, 50), 1),
+            "p90_ms": round(percentil(tempos, 90), 1),
+            "p95_ms": round(percentil(tempos, 95), 1),
+            "p99_ms": round(percentil(tempos, 99), 1),
+            "max_ms": round(max(tempos), 1),
+            "media_ms": round(statistics.mean(tempos), 1),
+            "bytes": sum(a[2] for a in amostras),
+        }
+    falhas = {}
+    for instante, motivo in coleta.falhas:
+        if instante >= desde:
+            falhas[motivo] = falhas.get(motivo, 0) + 1
+    return {"janela_s": round(janela, 1), "rotas": resumo, "sessoes_falhas": falhas}
+
+
+# Requisições concluídas por segundo ao longo do teste (mostra a rampa e a saturação)
+def linha_do_tempo(coleta):
+    por_segundo = {}
+    for instante, _, _, status, _ in coleta.amostras:
+        segundo = int(instante)
+        atual = por_segundo.setdefault(segundo, {"segundo": segundo, "requisicoes": 0, "erros": 0})
+        atual["requisicoes"] += 1
+        if status is None or status >= 400:
+            atual["erros"] += 1
+    return [por_segundo[s] for s in sorted(por_segundo)]
+
+
+# ============================================================================
+# USUÁRIO VIRTUAL
+# ============================================================================
+class UsuarioVirtual:
+    def __init__(self, numero, url_base, credenciais, coleta, pensar=(1.0, 3.0), com_cache=True):
+        self.numero = numero
+        self.conexoes = Conexoes(url_base)
+        self.credenciais = credenciais
+        self.coleta = coleta
+        self.pensar = pensar
+        self.com_cache = com_cache
+        self.aleatorio = random.Random(numero)
+        self.token = None
+        self.cache = {}
+
+    async def requisitar(self, metodo, caminho, corpo=b"", cabecalhos=None):
+        cabecalhos = dict(cabecalhos or {})
+        if self.token:
+            cabecalhos["Authorization"] = f"Bearer {self.token}"
+        rota = f"{metodo} {molde_da_rota(caminho)}"
+        inicio = time.perf_counter()
+        try:
+            status, dados = await self.conexoes.requisitar(metodo, caminho, corpo, cabecalhos)
+        except (ErroHttp, OSError, asyncio.TimeoutError):
+            self.coleta.registrar(rota, (time.perf_counter() - inicio) * 1000, None, 0)
+            return None, None
+        self.coleta.registrar(rota, (time.perf_counter() - inicio) * 1000, status, len(dados))
+        if status >= 400:
+            return status, None
+        return status, json.loads(dados or b"null")
+
+    # GET com o mesmo cache do frontend: dentro da validade não vai à rede
+    async def obter(self, caminho, validade=CACHE_FRESCO):
+        guardado = self.cache.get(caminho)
+        if self.com_cache and guardado and time.monotonic() - guardado[0] < validade:
+            return guardado[1]
+        _, dados = await self.requisitar("GET", caminho)
+        if dados is not None:
+            self.cache[caminho] = (time.monotonic(), dados)
+        return dados
+
+    async def pausar(self):
+        await asyncio.sleep(self.aleatorio.uniform(*self.pensar))
+
+    # --- Fluxos do frontend ---------------------------------------------------
+    # Login.jsx: form-urlencoded em /auth/login
+    async def entrar(self):
+        self.cache.clear()
+        corpo = urllib.parse.urlencode({"username": self.credenciais["email"],
+                                        "password": self.credenciais["senha"]}).encode()
+        _, dados = await self.requisitar("POST", "/auth/login", corpo,
+                                         {"Content-Type": "application/x-www-form-urlencoded"})
+        self.token = (dados or {}).get("access_token")
+        return self.token is not None
+
+    # Dashboard: useRepublicas + useMembersCount (membros de todas, em paralelo)
+    async def abrir_dashboard(self):
+        dados = await self.obter("/republicas") or {}
+        republicas = [r["id"] for r in (dados if isinstance(dados, list) else dados.get("republicas", []))]
+        await asyncio.gather(*(self.obter(f"/membros/{rep}") for rep in republicas))
+        return republicas
+
+    async def pagamentos(self, rep, despesas):
+        for inicio in range(0, len(despesas), PAGINA_PAGAMENTOS):
+            pagina = despesas[inicio:inicio + PAGINA_PAGAMENTOS]
+            limite = asyncio.Semaphore(PAGAMENTOS_SIMULTANEOS)
+
+            async def buscar(despesa):
+                async with limite:
+                    await self.obter(f"/despesas/{rep}/{despesa['id']}/pagamentos", CACHE_PAGAMENTOS)
+            await asyncio.gather(*(buscar(d) for d in pagina))
+
+    # Requisições de cada seção (DashboardContent), na ordem/paralelismo dos componentes
+    async def abrir_secao(self, secao, rep):
+        if secao == "resumo":
+            await self.obter(f"/despesas/{rep}")
+        elif secao == "despesas":
+            await asyncio.gather(self.obter(f"/despesas/{rep}"), self.obter(f"/membros/{rep}"))
+        elif secao == "pagamentos":
+            _, dados = await asyncio.gather(self.obter(f"/membros/{rep}"), self.obter(f"/despesas/{rep}"))
+            await self.pagamentos(rep, (dados or {}).get("despesas", []))
+        elif secao == "quartos":
+            await asyncio.gather(self.obter(f"/quartos/?republica_id={rep}"), self.obter(f"/membros/{rep}"))
+        elif secao == "membros":
+            await asyncio.gather(self.obter(f"/membros/{rep}"), self.obter(f"/quartos/?republica_id={rep}"))
+
+    # Uma sessão: login, dashboard e `trocas` seções (às vezes trocando de república),
+    # interrompida no fim do teste
+    async def sessao(self, ate, secoes, trocas):
+        # Sessão que não chega às seções também pausa: sem isso o usuário repete
+        # login e /republicas sem intervalo justamente quando o servidor está lento
+        if not await self.entrar():
+            self.coleta.registrar_falha("login")
+            await self.pausar()
+            return
+        republicas = await self.abrir_dashboard()
+        if not republicas:
+            # /republicas falhou ou a conta não tem repúblicas
+            self.coleta.registrar_falha("dashboard_vazio")
+            await self.pausar()
+            return
+        rep = republicas[0]
+        for _ in range(trocas):
+            await self.pausar()
+            if time.perf_counter() >= ate:
+                return
+            if len(republicas) > 1 and self.aleatorio.random() < 0.2:
+                rep = self.aleatorio.choice(republicas)
+                await self.abrir_secao("resumo", rep)
+                continue
+            await self.abrir_secao(self.aleatorio.choice(secoes), rep)
+
+    async def executar(self, ate, secoes, trocas):
+        try:
+            while time.perf_counter() < ate:
+                await self.sessao(ate, secoes, trocas)
+        finally:
+            self.conexoes.fechar()
+
+
+# ============================================================================
+# EXECUÇÃO
+# ============================================================================
+SECOES = ["resumo", "despesas", "pagamentos", "quartos", "membros"]
+
+
+# Contas no backend falso (POST /__controle/semear), uma por `contas`
+async def semear_contas(url_base, contas, despesas):
+    conexoes = Conexoes(url_base, maximo=1, tempo_limite=600)
+    credenciais = []
+    try:
+        for indice in range(contas):
+            email = f"carga{indice + 1}@republica.test"
+            corpo = json.dumps({"republicas": 2, "despesas": despesas, "email": email}).encode()
+            status, _ = await conexoes.requisitar("POST", "/__controle/semear", corpo,
+                                                  {"Content-Type": "application/json"})
+            if status != 200:
+                raise ErroHttp(f"/__controle/semear respondeu {status} (o alvo é o servidor_falso?)")
+            credenciais.append({"email": email, "senha": SENHA_SEMENTE})
+    finally:
+        conexoes.fechar()
+    return credenciais
+
+
+async def executar_carga(url_base, credenciais, usuarios, rampa, duracao, pensar, trocas, secoes,
+                         com_cache=True):
+    coleta = Coleta()
+    ate = time.perf_counter() + rampa + duracao
+    tarefas = []
+    for numero in range(usuarios):
+        usuario = UsuarioVirtual(numero, url_base, credenciais[numero % len(credenciais)], coleta,
+                                 pensar, com_cache)
+        tarefas.append(asyncio.create_task(usuario.executar(ate, secoes, trocas)))
+        # Rampa: os usuários entram espaçados ao longo de `rampa` segundos
+        if rampa and numero < usuarios - 1:
+            await asyncio.sleep(rampa / usuarios)
+    coleta.medindo_desde = time.perf_counter() - coleta.inicio
+    print(f"✓ {usuarios} usuários ativos; medindo por {duracao:.0f}s")
+    await asyncio.gather(*tarefas)
+    return coleta, time.perf_counter() - coleta.inicio
+
+
+def imprimir_resumo(resumo):
+    print("\n" + "="*80)
+    print(f"CARGA POR ROTA (após a rampa, {resumo['janela_s']:.0f}s)")
+    print("="*80)
+    print(f"  {'rota':<42} {'req/s':>7} {'p50':>7} {'p95':>7} {'p99':>7} {'erros':>6}")
+    rotas = sorted(resumo["rotas"].items(), key=lambda item: (item[0] == "TOTAL", -item[1]["requisicoes"]))
+    for rota, dados in rotas:
+        simbolo = "❌" if dados["erros"] else "✓"
+        print(f"{simbolo} {rota:<42} {dados['por_segundo']:>7.1f} {dados['p50_ms']:>5.0f}ms "
+              f"{dados['p95_ms']:>5.0f}ms {dados['p99_ms']:>5.0f}ms {dados['erros']:>6}")
+
+
+# Mesmo que metricas.commit_atual, sem importar o Selenium
+def commit_atual():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def salvar(caminho, conteudo):
+    pasta = os.path.dirname(caminho)
+    if pasta:
+        os.makedirs(pasta, exist_ok=True)
+    with open(caminho, "w", encoding="utf-8") as arquivo:
+        json.dump(conteudo, arquivo, ensure_ascii=False, indent=2)
+    return caminho
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Gerador de carga com o mesmo padrão de requisições do frontend")
+    parser.add_argument("--url", default=os.environ.get("URL_API_CARGA", "http://127.0.0.1:8000"),
+                        help="URL da API (backend falso local ou staging)")
+    parser.add_argument("-u", "--usuarios", type=int, default=10, help="usuários virtuais simultâneos")
+    parser.add_argument("--rampa", type=float, default=10, help="segundos até todos os usuários estarem ativos")
+    parser.add_argument("--duracao", type=float, default=60, help="segundos de carga estável após a rampa")
+    parser.add_argument("--pensar", type=lambda v: tuple(float(t) for t in v.split(",")), default=(1.0, 3.0),
+                        metavar="MIN,MAX", help="pausa (s) entre ações de cada usuário (padrão: 1,3)")
+    parser.add_argument("--trocas", type=int, default=8, help="trocas de seção por sessão antes de novo login")
+    parser.add_argument("--secoes", type=lambda v: v.split(","), default=SECOES,
+                        help="seções sorteadas, separadas por vírgula (padrão: todas)")
+    parser.add_argument("--sem-cache", action="store_true",
+                        help="ignora o cache do frontend (toda troca de seção vai à rede)")
+    parser.add_argument("--email", default=os.environ.get("CARGA_EMAIL"), help="conta usada por todos os usuários")
+    parser.add_argument("--senha", default=os.environ.get("CARGA_SENHA"))
+    parser.add_argument("--semear", action="store_true",
+                        help="cria as contas no backend falso (/__controle/semear) antes da carga")
+    parser.add_argument("--contas", type=int, default=10, help="contas semeadas (os usuários se revezam nelas)")
+    parser.add_argument("--despesas", type=int, default=100, help="despesas por república semeada")
+    parser.add_argument("--relatorio", default=RELATORIO_CARGA, metavar="ARQUIVO.json")
+    args = parser.parse_args()
+
+    if args.semear:
+        print(f"▶ Semeando {args.contas} conta(s) com {args.despesas} despesas por república...")
+        credenciais = asyncio.run(semear_contas(args.url, args.contas, args.despesas))
+    elif args.email and args.senha:
+        credenciais = [{"email": args.email, "senha": args.senha}]
+    else:
+        print("❌ Informe --email/--senha (ou CARGA_EMAIL/CARGA_SENHA) ou use --semear com o backend falso")
+        sys.exit(2)
+
+    print(f"▶ {args.usuarios} usuários contra {args.url} (rampa {args.rampa:.0f}s, pausa {args.pensar})")
+    coleta, duracao_total = asyncio.run(executar_carga(
+        args.url, credenciais, args.usuarios, args.rampa, args.duracao, args.pensar, args.trocas,
+        args.secoes, com_cache=not args.sem_cache))
+
+    resumo = resumir(coleta, duracao_total)
+    imprimir_resumo(resumo)
+    caminho = salvar(args.relatorio, {
+        "gerado_em": datetime.now().isoformat(timespec="seconds"),
+        "commit": commit_atual(),
+        "url": args.url,
+        "usuarios": args.usuarios,
+        "rampa_s": args.rampa,
+        "duracao_s": args.duracao,
+        "pensar_s": list(args.pensar),
+        "com_cache": not args.sem_cache,
+        **resumo,
+        "linha_do_tempo": linha_do_tempo(coleta),
+    })
+    print(f"\n✓ Relatório: {caminho}")
+
+    total = resumo["rotas"].get("TOTAL", {})
+    for motivo, quantidade in resumo["sessoes_falhas"].items():
+        print(f"⚠️ {quantidade} sessão(ões) interrompidas: {motivo}")
+    if total.get("erros"):
+        print(f"⚠️ {total['erros']} de {total['requisicoes']} requisições falharam")
+    if total.get("erros") or resumo["sessoes_falhas"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
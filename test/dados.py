@@ -0,0 +1,100 @@
+import json
+import random
+import urllib.error
+import urllib.request
+import uuid
+
+from navegador import URL_API
+
+SENHA_PADRAO = "SenhaForte@123"
+
+
+# Sufixo curto e único por cenário, para que workers paralelos não colidam
+def gerar_sufixo():
+    return uuid.uuid4().hex[:8]
+
+
+def gerar_telefone():
+    return f"(11) 9{random.randint(1000, 9999)}-{random.randint(1000, 9999)}"
+
+
+def gerar_usuario(sufixo=None):
+    sufixo = sufixo or gerar_sufixo()
+    return {
+        "nome": f"João Silva {sufixo}",
+        "email": f"joao.teste.{sufixo}@universidade.edu.br",
+        "telefone": gerar_telefone(),
+        "senha": SENHA_PADRAO,
+    }
+
+
+def gerar_republica(sufixo=None):
+    sufixo = sufixo or gerar_sufixo()
+    return {
+        "nome": f"República Teste Selenium {sufixo}",
+        "cep": "01310-100",  # CEP válido (Av. Paulista, SP)
+        "numero": "1000",
+    }
+
+
+def gerar_membro(sufixo=None):
+    sufixo = sufixo or gerar_sufixo()
+    return {
+        "nome": f"Membro Teste {sufixo}",
+        "email": f"membro.{sufixo}@email.com",
+        "telefone": gerar_telefone(),
+    }
+
+
+# Dados isolados de um cenário: usuário, república, quarto e membro próprios
+def gerar_contexto():
+    sufixo = gerar_sufixo()
+    return {
+        "sufixo": sufixo,
+        "usuario": gerar_usuario(sufixo),
+        "republica": gerar_republica(sufixo),
+        "membro": gerar_membro(sufixo),
+        "numero_quarto": str(100 + random.randint(1, 99)),
+    }
+
+
+# Cadastrar o usuário direto na API (para cenários que começam pelo login)
+def cadastrar_usuario_api(usuario):
+    corpo = json.dumps({
+        "fullname": usuario["nome"],
+        "email": usuario["email"],
+        "telephone": usuario["telefone"],
+        "password": usuario["senha"],
+    }).encode()
+    requisicao = urllib.request.Request(
+        f"{URL_API}/users",
+        data=corpo,
+        headers={"Content-Type": "application/json"},
+        method="POST",
+    )
+    try:
+        with urllib.request.urlopen(requisicao, timeout=10) as resposta:
+            return json.loads(resposta.read() or b"{}")
+    except urllib.error.HTTPError as erro:
+        # Usuário já existente não impede o cenário de continuar
+        if erro.code in (400, 409):
+            return None
+        raise
+
+
+# Rotas de controle do backend falso (test/servidor_falso.py); None se o
+# backend não as tiver (API real)
+def controle_servidor(metodo, rota, corpo=None):
+    requisicao = urllib.request.Request(
+        f"{URL_API}/__controle/{rota}",
+        data=None if corpo is None else json.dumps(corpo).encode(),
+        headers={"Content-Type": "application/json"},
+        method=metodo,
+    )
+    try:
+        with urllib.request.urlopen(requisicao, timeout=10) as resposta:
+            return json.loads(resposta.read() or b"{}")
+    except urllib.error.HTTPError as erro:
+        if erro.code == 404:
+            return None
+        raise
@@ -0,0 +1,217 @@
+import os
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import StaleElementReferenceException, WebDriverException
+
+# Tempo máximo (s) de qualquer espera e intervalo entre verificações
+TEMPO_LIMITE_PADRAO = 10
+INTERVALO_VERIFICACAO = 0.05
+
+# Seletores compartilhados pelos componentes do dashboard
+SELETOR_MODAL = ".modal-overlay"
+SELETOR_CONTEUDO_MODAL = ".modal-content"
+SELETOR_CARREGANDO = ".loading-state"
+
+# Script injetado na página: conta requisições XHR/fetch pendentes e registra
+# o instante da última resposta e da primeira/última mutação do DOM
+SCRIPT_MONITOR = """
+(function () {
+  if (window.__rfMonitor) return;
+  window.__rfMonitor = true;
+  window.__rfPendentes = 0;
+  window.__rfUltimaRede = performance.now();
+  window.__rfUltimaMutacao = performance.now();
+  window.__rfPrimeiraMutacao = null;
+  if (performance.setResourceTimingBufferSize) performance.setResourceTimingBufferSize(10000);
+
+  const concluir = () => {
+    window.__rfPendentes = Math.max(0, window.__rfPendentes - 1);
+    window.__rfUltimaRede = performance.now();
+  };
+
+  const enviar = XMLHttpRequest.prototype.send;
+  XMLHttpRequest.prototype.send = function () {
+    window.__rfPendentes += 1;
+    this.addEventListener('loadend', concluir, { once: true });
+    return enviar.apply(this, arguments);
+  };
+
+  if (window.fetch) {
+    const buscar = window.fetch;
+    window.fetch = function () {
+      window.__rfPendentes += 1;
+      return buscar.apply(this, arguments).finally(concluir);
+    };
+  }
+
+  new MutationObserver(() => {
+    window.__rfUltimaMutacao = performance.now();
+    if (window.__rfPrimeiraMutacao === null) window.__rfPrimeiraMutacao = window.__rfUltimaMutacao;
+  }).observe(document, { subtree: true, childList: true, attributes: true, characterData: true });
+})();
+"""
+
+
+# Criar um WebDriverWait com o intervalo curto usado em todo o suite; em perfis
+# de rede/CPU lentos (perfis_rede.py) o tempo limite é multiplicado pelo fator do perfil
+def aguardar(navegador, tempo=TEMPO_LIMITE_PADRAO):
+    return WebDriverWait(
+        navegador,
+        tempo * getattr(navegador, "fator_espera", 1),
+        poll_frequency=INTERVALO_VERIFICACAO,
+        ignored_exceptions=(StaleElementReferenceException,),
+    )
+
+
+# Esperar uma condição qualquer (expected_conditions ou função própria)
+def esperar(navegador, condicao, tempo=TEMPO_LIMITE_PADRAO, mensagem=""):
+    return aguardar(navegador, tempo).until(condicao, mensagem)
+
+
+# Instalar o monitor de rede/DOM na página atual e nas próximas navegações
+def instalar_monitor(navegador):
+    try:
+        navegador.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": SCRIPT_MONITOR})
+    except (AttributeError, WebDriverException):
+        # Navegadores sem CDP: o monitor é reinjetado a cada espera
+        pass
+    navegador.execute_script(SCRIPT_MONITOR)
+
+
+# ============================================================================
+# CONDIÇÕES
+# ============================================================================
+
+# Nenhuma requisição pendente há pelo menos `ocioso_ms` milissegundos
+def rede_ociosa(ocioso_ms=250):
+    def condicao(navegador):
+        estado = navegador.execute_script(
+            "return window.__rfMonitor ? [window.__rfPendentes, performance.now() - window.__rfUltimaRede] : null"
+        )
+        if estado is None:
+            navegador.execute_script(SCRIPT_MONITOR)
+            return False
+        pendentes, desde_ultima = estado
+        return pendentes == 0 and desde_ultima >= ocioso_ms
+    return condicao
+
+
+# O elemento (ou a página inteira) não sofre mutações há `quieto_ms` milissegundos,
+# ou seja, o React terminou de re-renderizar aquele nó
+def dom_estavel(elemento=None, quieto_ms=150):
+    def condicao(navegador):
+        if elemento is None:
+            desde_ultima = navegador.execute_script(
+                "return window.__rfMonitor ? performance.now() - window.__rfUltimaMutacao : null"
+            )
+            if desde_ultima is None:
+                navegador.execute_script(SCRIPT_MONITOR)
+                return False
+        else:
+            desde_ultima = navegador.execute_script("""
+                const el = arguments[0];
+                if (!el.__rfObservador) {
+                  el.__rfUltimaMutacao = performance.now();
+                  el.__rfObservador = new MutationObserver(() => {
+                    el.__rfUltimaMutacao = performance.now();
+                  });
+                  el.__rfObservador.observe(el, { subtree: true, childList: true, attributes: true, characterData: true });
+                }
+                return performance.now() - el.__rfUltimaMutacao;
+            """, elemento)
+        return desde_ultima >= quieto_ms
+    return condicao
+
+
+# Algum elemento de `localizador` contém `texto`; retorna esse elemento
+def lista_contem(localizador, texto):
+    def condicao(navegador):
+        for linha in navegador.find_elements(*localizador):
+            if texto in linha.text:
+                return linha
+        return False
+    return condicao
+
+
+# Um arquivo novo com a extensão esperada terminou de baixar em `pasta`
+# (o Chrome grava como .crdownload até concluir); retorna o caminho
+def download_concluido(pasta, extensao, existentes=()):
+    def condicao(navegador):
+        if not os.path.isdir(pasta):
+            return False
+        if any(nome.endswith(".crdownload") for nome in os.listdir(pasta)):
+            return False
+        novos = [nome for nome in os.listdir(pasta) if nome.endswith(extensao) and nome not in existentes]
+        if not novos:
+            return False
+        return os.path.join(pasta, max(novos, key=lambda nome: os.path.getmtime(os.path.join(pasta, nome))))
+    return condicao
+
+
+# O campo (input/select) possui um valor não vazio; retorna o valor
+def campo_preenchido(localizador):
+    def condicao(navegador):
+        valor = navegador.find_element(*localizador).get_attribute("value")
+        return valor or False
+    return condicao
+
+
+# ============================================================================
+# ESPERAS DE ALTO NÍVEL
+# ============================================================================
+
+def esperar_rede_ociosa(navegador, ocioso_ms=250, tempo=TEMPO_LIMITE_PADRAO):
+    return esperar(navegador, rede_ociosa(ocioso_ms), tempo, "requisições ainda pendentes")
+
+
+def esperar_dom_estavel(navegador, elemento=None, quieto_ms=150, tempo=TEMPO_LIMITE_PADRAO):
+    return esperar(navegador, dom_estavel(elemento, quieto_ms), tempo, "DOM ainda em re-renderização")
+
+
+def esperar_visivel(navegador, localizador, tempo=TEMPO_LIMITE_PADRAO):
+    return esperar(navegador, EC.visibility_of_element_located(localizador), tempo, f"{localizador} não ficou visível")
+
+
+def esperar_clicavel(navegador, localizador, tempo=TEMPO_LIMITE_PADRAO):
+    return esperar(navegador, EC.element_to_be_clickable(localizador), tempo, f"{localizador} não ficou clicável")
+
+
+def esperar_url(navegador, trecho, tempo=TEMPO_LIMITE_PADRAO):
+    return esperar(navegador, EC.url_contains(trecho), tempo, f"URL não contém '{trecho}'")
+
+
+def esperar_modal_aberto(navegador, tempo=TEMPO_LIMITE_PADRAO):
+    return esperar_visivel(navegador, (By.CSS_SELECTOR, SELETOR_CONTEUDO_MODAL), tempo)
+
+
+def esperar_modal_fechado(navegador, tempo=TEMPO_LIMITE_PADRAO):
+    return esperar(
+        navegador,
+        EC.invisibility_of_element_located((By.CSS_SELECTOR, SELETOR_MODAL)),
+        tempo,
+        "modal continua aberto",
+    )
+
+
+def esperar_lista_contem(navegador, localizador, texto, tempo=TEMPO_LIMITE_PADRAO):
+    return esperar(navegador, lista_contem(localizador, texto), tempo, f"'{texto}' não apareceu em {localizador}")
+
+
+def esperar_campo_preenchido(navegador, localizador, tempo=TEMPO_LIMITE_PADRAO):
+    return esperar(navegador, campo_preenchido(localizador), tempo, f"{localizador} continua vazio")
+
+
+def esperar_download(navegador, pasta, extensao, existentes=(), tempo=TEMPO_LIMITE_PADRAO):
+    return esperar(navegador, download_concluido(pasta, extensao, existentes), tempo,
+                   f"nenhum arquivo {extensao} baixado em {pasta}")
+
+
+# Seção do dashboard pronta: sem "Carregando...", rede ociosa e DOM estável
+def esperar_secao_carregada(navegador, seletor_secao, tempo=TEMPO_LIMITE_PADRAO):
+    secao = esperar(navegador, EC.presence_of_element_located((By.CSS_SELECTOR, seletor_secao)), tempo)
+    esperar(navegador, EC.invisibility_of_element_located((By.CSS_SELECTOR, SELETOR_CARREGANDO)), tempo)
+    esperar_rede_ociosa(navegador, tempo=tempo)
+    esperar_dom_estavel(navegador, tempo=tempo)
+    return secao
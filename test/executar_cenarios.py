@@ -0,0 +1,259 @@
+import argparse
+import io
+import os
+import sys
+import threading
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from navegador import criar_navegador, limpar_sessao
+from dados import gerar_contexto
+from metricas import RELATORIO_PADRAO, Metricas, salvar_relatorio
+from perfis_rede import PERFIL_PADRAO, PERFIS, aplicar_perfil, imprimir_lado_a_lado, validar_perfis
+from web_vitals import coletar_vitals, combinar, resumir_vitals, zerar_vitals
+from har import CapturaHar
+from analisador_har import RELATORIO_HAR, analisar_arquivos, imprimir_ranking, salvar_analise
+from servidor_falso import ServidorFalso
+from test_selenium import cenario_fluxo_completo
+from test_login_selenium import cenario_login_perfil
+from test_sessao_selenium import cenario_sessao_expirada
+
+# Cenários independentes: cada execução recebe usuário e república próprios
+CENARIOS = {
+    "fluxo_completo": cenario_fluxo_completo,
+    "login_perfil": cenario_login_perfil,
+    "sessao_expirada": cenario_sessao_expirada,
+}
+
+# Passos que cada cenário precisa registrar: um caminho de erro que pule o
+# resto do fluxo reprova o cenário mesmo sem ter registrado a falha
+PASSOS_OBRIGATORIOS = {
+    "fluxo_completo": ("criar_republica", "adicionar_quarto", "adicionar_membro", "criar_despesa",
+                       "registrar_pagamento", "abrir_pagamentos", "exportar_csv"),
+    "login_perfil": ("login", "abrir_perfil", "salvar_perfil"),
+    "sessao_expirada": ("login", "renovar_token", "repetir_falhas"),
+}
+
+
+# Saída separada por thread: cada cenário escreve no próprio buffer e o
+# resultado é impresso de uma vez ao final, sem misturar linhas dos workers
+class SaidaPorThread(io.TextIOBase):
+    def __init__(self, original):
+        self.original = original
+        self.local = threading.local()
+
+    def write(self, texto):
+        buffer = getattr(self.local, "buffer", None)
+        return (buffer or self.original).write(texto)
+
+    def flush(self):
+        self.original.flush()
+
+    def capturar(self):
+        self.local.buffer = io.StringIO()
+
+    def liberar(self):
+        buffer = self.local.buffer
+        self.local.buffer = None
+        return buffer.getvalue()
+
+
+# Pool de navegadores: um Chrome por thread, reaproveitado entre cenários
+class PoolNavegadores:
+    def __init__(self, headless=True, har=False):
+        self.headless = headless
+        self.har = har
+        self.local = threading.local()
+        self.navegadores = []
+        self.trava = threading.Lock()
+
+    def obter(self):
+        navegador = getattr(self.local, "navegador", None)
+        if navegador is None:
+            navegador = criar_navegador(headless=self.headless, har=self.har)
+            self.local.navegador = navegador
+            with self.trava:
+                self.navegadores.append(navegador)
+        else:
+            limpar_sessao(navegador)
+        return navegador
+
+    def fechar(self):
+        for navegador in self.navegadores:
+            try:
+                navegador.quit()
+            except Exception:
+                pass
+
+
+# Com `pasta_har`, as requisições do cenário são gravadas em <pasta>/<cenario>_<indice>_<perfil>.har
+def executar_cenario(pool, saida, nome, indice, sessao=True, perfil=PERFIL_PADRAO, pasta_har=None):
+    saida.capturar()
+    inicio = time.perf_counter()
+    erro = None
+    metricas = None
+    captura = None
+    vitals = {}
+    try:
+        # O navegador do pool pode vir de outro perfil: o perfil é reaplicado a cada cenário
+        navegador = aplicar_perfil(pool.obter(), perfil)
+        zerar_vitals(navegador)
+        metricas = Metricas(navegador, nome, indice)
+        if pasta_har:
+            # Descarta o log da limpeza de sessão e do cenário anterior
+            captura = metricas.har = CapturaHar(navegador)
+        CENARIOS[nome](navegador, {**gerar_contexto(), "metricas": metricas, "sessao": sessao})
+    except Exception:
+        erro = traceback.format_exc()
+        print(erro)
+    faltando = []
+    if metricas:
+        metricas.finalizar()
+        vitals = coletar_vitals(metricas.navegador)
+        # Cenário ignorado (não se aplica ao backend) não precisa dos passos
+        registrados = {passo["passo"] for passo in metricas.passos}
+        obrigatorios = () if metricas.ignorado else PASSOS_OBRIGATORIOS.get(nome, ())
+        faltando = [passo for passo in obrigatorios if passo not in registrados]
+        if faltando:
+            print(f"❌ Passos não executados: {', '.join(faltando)}")
+    caminho_har = None
+    if captura:
+        caminho_har = captura.salvar(os.path.join(pasta_har, f"{nome}_{indice}_{perfil}.har"))
+    texto = saida.liberar()
+    return {
+        "cenario": nome,
+        "indice": indice,
+        "perfil": perfil,
+        "worker": threading.current_thread().name,
+        "duracao": time.perf_counter() - inicio,
+        # Os cenários registram falhas em Metricas (falhar / concluir(sucesso=False)) e seguem adiante
+        "sucesso": erro is None and metricas is not None and metricas.sucesso and not faltando,
+        "saida": texto,
+        "metricas": metricas,
+        "vitals": vitals,
+        "har": caminho_har,
+    }
+
+
+def executar(nomes, workers, repeticoes=1, headless=True, verboso=False, relatorio=RELATORIO_PADRAO, sessao=True,
+             perfis=(PERFIL_PADRAO,), orcamentos=True, pasta_har=None):
+    tarefas = [(nome, i, perfil) for perfil in perfis for i in range(1, repeticoes + 1) for nome in nomes]
+    saida = SaidaPorThread(sys.stdout)
+    pool = PoolNavegadores(headless=headless, har=bool(pasta_har))
+    resultados = []
+
+    sys.stdout = saida
+    inicio = time.perf_counter()
+    try:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="worker") as executor:
+            futuros = [executor.submit(executar_cenario, pool, saida, nome, i, sessao, perfil, pasta_har)
+                       for nome, i, perfil in tarefas]
+            for futuro in as_completed(futuros):
+                resultado = futuro.result()
+                resultados.append(resultado)
+                simbolo = "✅" if resultado["sucesso"] else "❌"
+                perfil = f" [{resultado['perfil']}]" if len(perfis) > 1 else ""
+                print(f"{simbolo} [{resultado['worker']}] {resultado['cenario']} #{resultado['indice']}{perfil} "
+                      f"({resultado['duracao']:.1f}s)")
+                if verboso or not resultado["sucesso"]:
+                    print(resultado["saida"])
+    finally:
+        sys.stdout = saida.original
+        pool.fechar()
+
+    total = time.perf_counter() - inicio
+    falhas = [r for r in resultados if not r["sucesso"]]
+    soma = sum(r["duracao"] for r in resultados)
+    print("\n" + "="*80)
+    print(f"RESUMO: {len(resultados) - len(falhas)}/{len(resultados)} cenários passaram "
+          f"com {workers} worker(s) em {total:.1f}s (serial estimado: {soma:.1f}s)")
+    print("="*80)
+
+    execucoes = sorted((r["metricas"] for r in resultados if r["metricas"]),
+                       key=lambda m: (m.cenario, list(perfis).index(m.perfil), m.indice))
+    if len(perfis) > 1:
+        imprimir_lado_a_lado([m.como_dict() for m in execucoes], list(perfis))
+
+    # Web Vitals de todos os cenários, por perfil; estourar um orçamento reprova a execução
+    vitals = {perfil: [r["vitals"] for r in resultados if r["perfil"] == perfil] for perfil in perfis}
+    estouros = resumir_vitals(vitals)
+    if estouros and not orcamentos:
+        print("⚠️ Orçamentos de Web Vitals estourados, ignorados por --ignorar-orcamentos")
+        estouros = []
+
+    # Anti-padrões de carregamento encontrados nos HARs (informativo, não reprova)
+    anti_padroes = None
+    hars = sorted(r["har"] for r in resultados if r["har"])
+    if hars:
+        anti_padroes, achados = analisar_arquivos(hars)
+        imprimir_ranking(anti_padroes, len(hars))
+        caminho = salvar_analise(os.path.join(pasta_har, RELATORIO_HAR), anti_padroes, achados,
+                                 {"escopo": "passo", "arquivos": len(hars)})
+        print(f"✓ HARs e análise: {caminho}")
+
+    if relatorio:
+        caminhos = salvar_relatorio(execucoes, relatorio, {
+            "workers": workers,
+            "repeticoes": repeticoes,
+            "perfis": list(perfis),
+            "web_vitals": {perfil: combinar(coletas) for perfil, coletas in vitals.items()},
+            "orcamentos_estourados": estouros,
+            "anti_padroes_har": anti_padroes,
+        })
+        print(f"✓ Relatório de desempenho: {', '.join(caminhos)}")
+    return resultados, estouros
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Executa os cenários Selenium em paralelo")
+    parser.add_argument("cenarios", nargs="*", default=list(CENARIOS), choices=list(CENARIOS),
+                        help="cenários a executar (padrão: todos)")
+    parser.add_argument("-w", "--workers", type=int, default=os.cpu_count() or 1,
+                        help="quantidade de navegadores Chrome em paralelo (padrão: núcleos da CPU)")
+    parser.add_argument("-r", "--repeticoes", type=int, default=1,
+                        help="quantas vezes cada cenário é executado")
+    parser.add_argument("--com-janela", action="store_true",
+                        help="abre o Chrome com janela em vez de headless")
+    parser.add_argument("-v", "--verboso", action="store_true",
+                        help="mostra a saída completa de todos os cenários")
+    parser.add_argument("--login-pela-interface", action="store_true",
+                        help="cadastra/entra pelas telas em vez de injetar o token no localStorage")
+    parser.add_argument("--relatorio", default=RELATORIO_PADRAO, metavar="ARQUIVO.json",
+                        help=f"relatório de tempos por passo (padrão: {RELATORIO_PADRAO}; CSV ao lado)")
+    parser.add_argument("--servidor-falso", type=int, nargs="?", const=8000, metavar="PORTA",
+                        help="sobe o backend falso neste processo (padrão: porta 8000)")
+    parser.add_argument("--latencia", type=float, default=0,
+                        help="latência (ms) de cada resposta do backend falso")
+    parser.add_argument("--semente", type=int, default=0,
+                        help="semente do estado do backend falso")
+    parser.add_argument("--perfis", type=lambda v: validar_perfis(v.split(",")), default=[PERFIL_PADRAO],
+                        help=f"perfis de rede/CPU, separados por vírgula ({', '.join(PERFIS)}); "
+                             "com mais de um, os tempos saem lado a lado")
+    parser.add_argument("--ignorar-orcamentos", action="store_true",
+                        help="não reprova a execução quando um orçamento de Web Vitals (web_vitals.py) estoura")
+    parser.add_argument("--har", metavar="PASTA",
+                        help="grava um HAR por cenário nesta pasta e analisa os anti-padrões (analisador_har.py)")
+    args = parser.parse_args()
+
+    servidor = None
+    if args.servidor_falso:
+        servidor = ServidorFalso(args.servidor_falso, semente=args.semente, latencia_ms=args.latencia).iniciar()
+        print(f"✓ Backend falso em {servidor.url}")
+        # Antes de abrir navegadores: login e rota autenticada como o frontend chama
+        if not servidor.verificar():
+            servidor.parar()
+            sys.exit(1)
+    try:
+        resultados, estouros = executar(args.cenarios, args.workers, args.repeticoes,
+                                        headless=not args.com_janela, verboso=args.verboso, relatorio=args.relatorio,
+                                        sessao=not args.login_pela_interface, perfis=args.perfis,
+                                        orcamentos=not args.ignorar_orcamentos, pasta_har=args.har)
+    finally:
+        if servidor:
+            servidor.parar()
+    sys.exit(0 if all(r["sucesso"] for r in resultados) and not estouros else 1)
+
+
+if __name__ == "__main__":
+    main()
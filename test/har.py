@@ -0,0 +1,182 @@
+import json
+import os
+from datetime import datetime, timezone
+
+from selenium.common.exceptions import WebDriverException
+
+# Gravação de HAR a partir do log de performance do Chrome (eventos Network.* do
+# DevTools Protocol; o navegador precisa ser criado com goog:loggingPrefs, ver
+# navegador.opcoes_chrome). Cada passo das Metricas vira uma "page" do HAR, para
+# o analisador (analisador_har.py) separar as requisições por interação.
+
+PAGINA_FORA_DE_PASSO = "fora_de_passo"
+
+
+def _iso(segundos_epoca):
+    return datetime.fromtimestamp(segundos_epoca, tz=timezone.utc).isoformat(timespec="milliseconds")
+
+
+def _cabecalhos(cabecalhos):
+    return [{"name": nome, "value": str(valor)} for nome, valor in (cabecalhos or {}).items()]
+
+
+# Fases do timing do Chrome (ms relativos a requestTime) no formato do HAR
+def _timings(timing, total_ms):
+    if not timing:
+        return {"blocked": -1, "dns": -1, "connect": -1, "ssl": -1, "send": 0, "wait": total_ms, "receive": 0}
+
+    def fase(inicio, fim):
+        a, b = timing.get(inicio, -1), timing.get(fim, -1)
+        return round(b - a, 3) if a >= 0 and b >= 0 else -1
+
+    enviado = timing.get("sendEnd", 0)
+    cabecalhos = timing.get("receiveHeadersEnd", enviado)
+    bloqueado = timing.get("dnsStart", -1)
+    if bloqueado < 0:
+        bloqueado = timing.get("connectStart", -1)
+    if bloqueado < 0:
+        bloqueado = timing.get("sendStart", 0)
+    return {
+        "blocked": round(max(bloqueado, 0), 3),
+        "dns": fase("dnsStart", "dnsEnd"),
+        "connect": fase("connectStart", "connectEnd"),
+        "ssl": fase("sslStart", "sslEnd"),
+        "send": max(fase("sendStart", "sendEnd"), 0),
+        "wait": round(max(cabecalhos - enviado, 0), 3),
+        "receive": round(max(total_ms - cabecalhos, 0), 3),
+    }
+
+
+class CapturaHar:
+    def __init__(self, navegador):
+        self.navegador = navegador
+        self.requisicoes = {}
+        self.entradas = []
+        self.paginas = []
+        self.pagina = PAGINA_FORA_DE_PASSO
+        self.descartar()
+
+    # Jogar fora o log acumulado (ex.: navegação de limpeza antes do cenário)
+    def descartar(self):
+        try:
+            self.navegador.get_log("performance")
+        except (WebDriverException, ValueError):
+            pass
+        self.requisicoes.clear()
+
+    def drenar(self):
+        try:
+            registros = self.navegador.get_log("performance")
+        except (WebDriverException, ValueError):
+            return
+        for registro in registros:
+            mensagem = json.loads(registro["message"])["message"]
+            metodo = mensagem.get("method", "")
+            if metodo.startswith("Network."):
+                self._evento(metodo, mensagem.get("params", {}))
+
+    # Começar uma "page" nova: o que chegou até aqui fica na anterior
+    def iniciar_pagina(self, nome):
+        self.drenar()
+        self.pagina = nome
+        self.paginas.append({
+            "startedDateTime": datetime.now(timezone.utc).isoformat(timespec="milliseconds"),
+            "id": nome,
+            "title": nome,
+            "pageTimings": {},
+        })
+
+    def encerrar_pagina(self):
+        self.drenar()
+        self.pagina = PAGINA_FORA_DE_PASSO
+
+    def _evento(self, metodo, params):
+        id_requisicao = params.get("requestId")
+        if metodo == "Network.requestWillBeSent":
+            # Redirecionamento: fecha a requisição anterior com a resposta de redirect
+            anterior = self.requisicoes.pop(id_requisicao, None)
+            if anterior and params.get("redirectResponse"):
+                anterior["resposta"] = params["redirectResponse"]
+                self._concluir(anterior, params["timestamp"], None)
+            self.requisicoes[id_requisicao] = {
+                "pagina": self.pagina,
+                "requisicao": params["request"],
+                "tipo": params.get("type", "Other"),
+                "inicio": params["timestamp"],
+                "epoca": params.get("wallTime"),
+                "iniciador": (params.get("initiator") or {}).get("type"),
+                "resposta": None,
+            }
+        elif metodo == "Network.responseReceived" and id_requisicao in self.requisicoes:
+            self.requisicoes[id_requisicao]["resposta"] = params["response"]
+        elif metodo == "Network.loadingFinished" and id_requisicao in self.requisicoes:
+            requisicao = self.requisicoes.pop(id_requisicao)
+            self._concluir(requisicao, params["timestamp"], None, params.get("encodedDataLength", 0))
+        elif metodo == "Network.loadingFailed" and id_requisicao in self.requisicoes:
+            requisicao = self.requisicoes.pop(id_requisicao)
+            self._concluir(requisicao, params["timestamp"], params.get("errorText") or "falhou")
+
+    def _concluir(self, requisicao, fim, erro, bytes_recebidos=0):
+        resposta = requisicao["resposta"] or {}
+        pedido = requisicao["requisicao"]
+        total_ms = round((fim - requisicao["inicio"]) * 1000, 3)
+        corpo = pedido.get("postData")
+        entrada = {
+            "pageref": requisicao["pagina"],
+            "startedDateTime": _iso(requisicao["epoca"] or 0),
+            "time": total_ms,
+            "request": {
+                "method": pedido.get("method", "GET"),
+                "url": pedido.get("url", ""),
+                "httpVersion": resposta.get("protocol", "HTTP/1.1"),
+                "headers": _cabecalhos(pedido.get("headers")),
+                "queryString": [],
+                "cookies": [],
+                "headersSize": -1,
+                "bodySize": len(corpo) if corpo else 0,
+            },
+            "response": {
+                "status": resposta.get("status", 0),
+                "statusText": resposta.get("statusText", "") if not erro else erro,
+                "httpVersion": resposta.get("protocol", "HTTP/1.1"),
+                "headers": _cabecalhos(resposta.get("headers")),
+                "cookies": [],
+                "content": {"size": bytes_recebidos, "mimeType": resposta.get("mimeType", "")},
+                "redirectURL": (resposta.get("headers") or {}).get("location", ""),
+                "headersSize": -1,
+                "bodySize": bytes_recebidos,
+            },
+            "cache": {},
+            "timings": _timings(resposta.get("timing"), total_ms),
+            # Campos próprios (prefixo "_", permitido pelo formato)
+            "_resourceType": requisicao["tipo"],
+            "_initiator": requisicao["iniciador"],
+            "_fromCache": bool(resposta.get("fromDiskCache") or resposta.get("fromServiceWorker")),
+        }
+        if corpo:
+            entrada["request"]["postData"] = {"mimeType": (pedido.get("headers") or {}).get("Content-Type", ""),
+                                              "text": corpo}
+        self.entradas.append(entrada)
+
+    def como_har(self):
+        self.drenar()
+        entradas = sorted(self.entradas, key=lambda e: e["startedDateTime"])
+        paginas = list(self.paginas)
+        fora = [e for e in entradas if e["pageref"] == PAGINA_FORA_DE_PASSO]
+        if fora:
+            paginas.insert(0, {"startedDateTime": fora[0]["startedDateTime"], "id": PAGINA_FORA_DE_PASSO,
+                               "title": PAGINA_FORA_DE_PASSO, "pageTimings": {}})
+        return {"log": {
+            "version": "1.2",
+            "creator": {"name": "republica-facil-testes", "version": "1.0"},
+            "pages": paginas,
+            "entries": entradas,
+        }}
+
+    def salvar(self, caminho):
+        pasta = os.path.dirname(caminho)
+        if pasta:
+            os.makedirs(pasta, exist_ok=True)
+        with open(caminho, "w", encoding="utf-8") as arquivo:
+            json.dump(self.como_har(), arquivo, ensure_ascii=False)
+        return caminho
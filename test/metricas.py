@@ -0,0 +1,258 @@
+import csv
+import json
+import os
+import subprocess
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+from esperas import SCRIPT_MONITOR
+
+# Arquivo padrão do relatório (o CSV é gravado ao lado, com a mesma base)
+RELATORIO_PADRAO = "relatorio_desempenho.json"
+
+# Marca o início de um passo: zera a primeira mutação observada e devolve o
+# instante atual em ms desde a época (comparável entre navegações)
+SCRIPT_MARCAR = """
+if (!window.__rfMonitor) { %s }
+window.__rfPrimeiraMutacao = null;
+return performance.timeOrigin + performance.now();
+""" % SCRIPT_MONITOR
+
+# Coleta o que aconteceu no navegador desde a marca: Navigation Timing (se a
+# página foi recarregada), Resource Timing, as chamadas registradas pela
+# telemetria do app (window.__perf), a primeira mutação do DOM e, ao final do
+# passo, o total de nós do DOM e o heap JS (performance.memory, só Chrome)
+SCRIPT_COLETAR = """
+const marca = arguments[0];
+const origem = performance.timeOrigin;
+const agora = origem + performance.now();
+const ms = (v) => Math.round(v * 10) / 10;
+
+let navegacao = null;
+const [nav] = performance.getEntriesByType('navigation');
+if (nav && origem >= marca) {
+  navegacao = {
+    tipo: nav.type,
+    ttfb_ms: ms(nav.responseStart),
+    dom_interativo_ms: ms(nav.domInteractive),
+    dom_carregado_ms: ms(nav.domContentLoadedEventEnd),
+    carregado_ms: ms(nav.loadEventEnd),
+    bytes: nav.transferSize || 0
+  };
+}
+
+const recursos = performance.getEntriesByType('resource')
+  .filter((r) => origem + r.startTime >= marca)
+  .map((r) => ({
+    url: r.name,
+    tipo: r.initiatorType,
+    inicio_ms: ms(origem + r.startTime - marca),
+    duracao_ms: ms(r.duration),
+    ttfb_ms: r.requestStart ? ms(r.responseStart - r.requestStart) : null,
+    bytes: r.transferSize || 0
+  }));
+
+const chamadas = window.__perf ? window.__perf.entries(marca).map((c) => ({
+  rota: c.method + ' ' + c.endpoint,
+  status: c.status,
+  ok: c.ok,
+  cache: c.cache,
+  tentativa: c.retry,
+  inicio_ms: ms(c.start - marca),
+  duracao_ms: ms(c.duration),
+  bytes: c.bytesIn,
+  simultaneas: c.inFlight
+})) : null;
+
+const primeira = window.__rfPrimeiraMutacao;
+return {
+  agora: agora,
+  primeira_mutacao_ms: primeira == null ? null : ms(origem + primeira - marca),
+  nos_dom: document.getElementsByTagName('*').length,
+  heap_bytes: performance.memory ? performance.memory.usedJSHeapSize : null,
+  navegacao: navegacao,
+  recursos: recursos,
+  chamadas: chamadas
+};
+"""
+
+
+# Resumo das chamadas da telemetria num passo: quantas foram à rede, quantas o
+# cache respondeu e o tempo de API (do início da primeira ao fim da última ida à
+# rede, para não somar duas vezes chamadas paralelas). None se o app não expõe window.__perf
+def resumir_chamadas(chamadas):
+    if chamadas is None:
+        return {"chamadas_api": None, "cache_api": None, "api_ms": None, "api_max_simultaneas": None}
+    rede = [c for c in chamadas if not c["cache"]]
+    api_ms = 0
+    if rede:
+        api_ms = max(c["inicio_ms"] + c["duracao_ms"] for c in rede) - min(c["inicio_ms"] for c in rede)
+    return {
+        "chamadas_api": len(rede),
+        "cache_api": len(chamadas) - len(rede),
+        "api_ms": round(api_ms, 1),
+        "api_max_simultaneas": max((c["simultaneas"] for c in rede), default=0),
+    }
+
+
+# ============================================================================
+# COLETA POR PASSO
+# ============================================================================
+class Metricas:
+    def __init__(self, navegador, cenario, indice=1):
+        self.navegador = navegador
+        self.cenario = cenario
+        self.indice = indice
+        self.perfil = getattr(navegador, "perfil", None)
+        # Captura de HAR opcional (har.CapturaHar): cada passo vira uma "page"
+        self.har = None
+        self.passos = []
+        self.atual = None
+        # Falhas registradas pelo cenário ({"passo", "erro"}) e, se ele não se aplica, o motivo
+        self.falhas = []
+        self.ignorado = None
+
+    # Começa um passo; um passo anterior ainda aberto é encerrado como interrompido
+    def iniciar(self, nome):
+        if self.atual:
+            self.concluir(sucesso=False)
+        try:
+            marca = self.navegador.execute_script(SCRIPT_MARCAR)
+        except Exception:
+            marca = time.time() * 1000
+        self.atual = {"nome": nome, "marca": marca, "inicio": time.perf_counter()}
+        if self.har:
+            self.har.iniciar_pagina(nome)
+
+    def concluir(self, sucesso=True):
+        if not self.atual:
+            return None
+        duracao = (time.perf_counter() - self.atual["inicio"]) * 1000
+        try:
+            coleta = self.navegador.execute_script(SCRIPT_COLETAR, self.atual["marca"])
+        except Exception:
+            coleta = {"primeira_mutacao_ms": None, "nos_dom": None, "heap_bytes": None,
+                      "navegacao": None, "recursos": [], "chamadas": None}
+        recursos = coleta["recursos"]
+        chamadas = coleta.get("chamadas")
+        passo = {
+            "passo": self.atual["nome"],
+            "sucesso": sucesso,
+            "tempo_ms": round(duracao, 1),
+            "primeira_mutacao_ms": coleta["primeira_mutacao_ms"],
+            "requisicoes": len(recursos),
+            "api": sum(1 for r in recursos if r["tipo"] in ("xmlhttprequest", "fetch")),
+            "bytes": sum(r["bytes"] for r in recursos),
+            "nos_dom": coleta.get("nos_dom"),
+            "heap_bytes": coleta.get("heap_bytes"),
+            **resumir_chamadas(chamadas),
+            "navegacao": coleta["navegacao"],
+            "recursos": recursos,
+            "chamadas": chamadas,
+        }
+        self.passos.append(passo)
+        self.atual = None
+        if self.har:
+            self.har.encerrar_pagina()
+        return passo
+
+    @contextmanager
+    def medir(self, nome):
+        self.iniciar(nome)
+        try:
+            yield
+        except Exception:
+            self.concluir(sucesso=False)
+            raise
+        self.concluir()
+
+    # Falha de um cenário que segue adiante: o passo aberto (se houver) termina sem sucesso
+    def falhar(self, motivo):
+        print(f"❌ {motivo}")
+        self.falhas.append({"passo": self.atual["nome"] if self.atual else None, "erro": motivo})
+        if self.atual:
+            self.concluir(sucesso=False)
+
+    # Cenário que não se aplica ao ambiente (ex.: backend sem rotas de controle)
+    def ignorar(self, motivo):
+        print(f"⚠️ {motivo}")
+        self.ignorado = motivo
+
+    # Encerrar o cenário: um passo deixado aberto por uma falha fica como interrompido
+    def finalizar(self):
+        if self.atual:
+            self.concluir(sucesso=False)
+        return self.passos
+
+    # Sucesso do cenário pelo que foi registrado, não pela saída impressa
+    @property
+    def sucesso(self):
+        return not self.falhas and all(passo["sucesso"] for passo in self.passos)
+
+    def como_dict(self):
+        return {"cenario": self.cenario, "indice": self.indice, "perfil": self.perfil, "passos": self.passos,
+                "falhas": self.falhas, "ignorado": self.ignorado}
+
+    def imprimir(self):
+        print("\n" + "="*80)
+        perfil = f" [{self.perfil}]" if self.perfil else ""
+        print(f"TEMPOS POR PASSO - {self.cenario} #{self.indice}{perfil}")
+        print("="*80)
+        for passo in self.passos:
+            simbolo = "✓" if passo["sucesso"] else "❌"
+            mutacao = passo["primeira_mutacao_ms"]
+            mutacao = f"{mutacao:.0f}ms" if mutacao is not None else "-"
+            api = f"{passo['api_ms']:.0f}ms" if passo.get("api_ms") is not None else "-"
+            print(f"{simbolo} {passo['passo']:<22} {passo['tempo_ms']:>9.0f}ms   "
+                  f"1ª mutação: {mutacao:>7}   requisições: {passo['requisicoes']:>3} ({passo['api']} API)   "
+                  f"tempo de API: {api:>7}")
+
+
+# ============================================================================
+# RELATÓRIO
+# ============================================================================
+def commit_atual():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+# Grava o relatório JSON completo e um CSV com uma linha por passo
+def salvar_relatorio(execucoes, caminho=RELATORIO_PADRAO, extras=None):
+    from navegador import URL_BASE
+
+    relatorio = {
+        "gerado_em": datetime.now().isoformat(timespec="seconds"),
+        "commit": commit_atual(),
+        "url_base": URL_BASE,
+        **(extras or {}),
+        "execucoes": [m.como_dict() if isinstance(m, Metricas) else m for m in execucoes],
+    }
+    pasta = os.path.dirname(caminho)
+    if pasta:
+        os.makedirs(pasta, exist_ok=True)
+    with open(caminho, "w", encoding="utf-8") as arquivo:
+        json.dump(relatorio, arquivo, ensure_ascii=False, indent=2)
+
+    caminho_csv = os.path.splitext(caminho)[0] + ".csv"
+    colunas = ["commit", "cenario", "indice", "perfil", "passo", "sucesso", "tempo_ms", "primeira_mutacao_ms",
+               "requisicoes", "api", "bytes", "chamadas_api", "cache_api", "api_ms", "api_max_simultaneas",
+               "nos_dom", "heap_bytes", "navegacao_ms"]
+    with open(caminho_csv, "w", encoding="utf-8", newline="") as arquivo:
+        escritor = csv.DictWriter(arquivo, fieldnames=colunas)
+        escritor.writeheader()
+        for execucao in relatorio["execucoes"]:
+            for passo in execucao["passos"]:
+                navegacao = passo["navegacao"] or {}
+                escritor.writerow({
+                    "commit": relatorio["commit"],
+                    "cenario": execucao["cenario"],
+                    "indice": execucao["indice"],
+                    "perfil": execucao.get("perfil"),
+                    "navegacao_ms": navegacao.get("carregado_ms"),
+                    **{c: passo[c] for c in colunas if c in passo},
+                })
+    return caminho, caminho_csv
@@ -0,0 +1,74 @@
+import os
+import tempfile
+
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+from webdriver_manager.chrome import ChromeDriverManager
+
+from esperas import instalar_monitor
+from perfis_rede import PERFIL_PADRAO, aplicar_perfil
+from web_vitals import instalar_vitals
+
+# Endereço do frontend (Vite) e da API (proxy /api do Vite por padrão)
+URL_BASE = os.environ.get("URL_BASE", "http://127.0.0.1:3000").rstrip("/")
+URL_API = os.environ.get("URL_API", f"{URL_BASE}/api").rstrip("/")
+
+# O ChromeDriver é baixado uma única vez por processo, mesmo com vários workers
+_caminho_driver = None
+
+
+def caminho_chromedriver():
+    global _caminho_driver
+    if _caminho_driver is None:
+        _caminho_driver = ChromeDriverManager().install()
+    return _caminho_driver
+
+
+# Configurar opções do Chrome; downloads vão para `pasta_downloads` sem perguntar.
+# `har` liga o log de performance (eventos Network.* do DevTools, lidos por har.py)
+def opcoes_chrome(headless=False, pasta_downloads=None, har=False):
+    chrome_options = Options()
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    # performance.memory sem arredondamento (heap por passo nas métricas)
+    chrome_options.add_argument("--enable-precise-memory-info")
+    if headless:
+        chrome_options.add_argument("--headless=new")
+        chrome_options.add_argument("--window-size=1920,1080")
+    else:
+        chrome_options.add_argument("--start-maximized")
+    if pasta_downloads:
+        chrome_options.add_experimental_option("prefs", {
+            "download.default_directory": pasta_downloads,
+            "download.prompt_for_download": False,
+            "download.directory_upgrade": True,
+        })
+    if har:
+        chrome_options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+    return chrome_options
+
+
+# Criar um navegador pronto para os cenários (monitor de rede/DOM e coletor de
+# Web Vitals já instalados).
+# Cada navegador tem a própria pasta de downloads (navegador.pasta_downloads),
+# então workers em paralelo não disputam o mesmo arquivo. `perfil` (ou a variável
+# PERFIL_REDE) aplica um perfil de rede/CPU de perfis_rede.py; `har` permite
+# gravar as requisições com har.CapturaHar
+def criar_navegador(headless=False, perfil=None, har=False):
+    pasta_downloads = tempfile.mkdtemp(prefix="republica_facil_downloads_")
+    service = Service(caminho_chromedriver())
+    navegador = webdriver.Chrome(service=service, options=opcoes_chrome(headless, pasta_downloads, har))
+    navegador.pasta_downloads = pasta_downloads
+    aplicar_perfil(navegador, perfil or os.environ.get("PERFIL_REDE") or PERFIL_PADRAO)
+    navegador.get(f"{URL_BASE}/")
+    instalar_monitor(navegador)
+    instalar_vitals(navegador)
+    return navegador
+
+
+# Apagar tokens e cookies para que o próximo cenário comece deslogado
+def limpar_sessao(navegador):
+    navegador.get(f"{URL_BASE}/")
+    navegador.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+    navegador.delete_all_cookies()
@@ -0,0 +1,291 @@
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import Select
+from selenium.common.exceptions import StaleElementReferenceException
+
+from esperas import (
+    TEMPO_LIMITE_PADRAO,
+    esperar,
+    esperar_campo_preenchido,
+    esperar_secao_carregada,
+    lista_contem,
+)
+
+# Page objects do dashboard. Todo elemento é localizado pelo data-testid dos
+# componentes (src/components/Dashboard) com CSS, a partir da raiz do
+# componente (seção ou modal), e fica guardado no objeto:
+# - a raiz é buscada uma vez; os filhos, uma vez cada, dentro dela
+# - ids repetidos entre modais ("modal-submit", "add-button") não colidem,
+#   porque a busca nunca sai da raiz
+# - se o React trocar o nó (StaleElementReference), o cache é descartado e a
+#   ação é repetida uma vez com os elementos buscados de novo
+# Listas (cartões, linhas) não entram no cache: mudam a cada render.
+
+
+def testid(nome):
+    return (By.CSS_SELECTOR, f'[data-testid="{nome}"]')
+
+
+def seletor_testid(*nomes):
+    return " ".join(f'[data-testid="{nome}"]' for nome in nomes)
+
+
+class Componente:
+    TESTID = None
+
+    def __init__(self, navegador, tempo=TEMPO_LIMITE_PADRAO):
+        self.navegador = navegador
+        self.tempo = tempo
+        self._raiz = None
+        self._cache = {}
+
+    @property
+    def seletor(self):
+        return seletor_testid(self.TESTID)
+
+    @property
+    def raiz(self):
+        if self._raiz is None:
+            self._raiz = esperar(self.navegador, EC.presence_of_element_located(testid(self.TESTID)), self.tempo,
+                                 f"{self.TESTID} não encontrado")
+        return self._raiz
+
+    def esquecer(self):
+        self._raiz = None
+        self._cache.clear()
+        return self
+
+    # Elemento com data-testid dentro da raiz (ou campo por id, com `por_id`)
+    def elemento(self, nome, por_id=False):
+        chave = ("#" if por_id else "") + nome
+        if chave not in self._cache:
+            localizador = (By.CSS_SELECTOR, f"#{nome}") if por_id else testid(nome)
+            self._cache[chave] = self.raiz.find_element(*localizador)
+        return self._cache[chave]
+
+    def elementos(self, nome):
+        return self.raiz.find_elements(*testid(nome))
+
+    def _repetir(self, acao):
+        try:
+            return acao()
+        except StaleElementReferenceException:
+            self.esquecer()
+            return acao()
+
+    def clicar(self, nome):
+        def acao():
+            elemento = self.elemento(nome)
+            esperar(self.navegador, EC.element_to_be_clickable(elemento), self.tempo, f"{nome} não ficou clicável")
+            elemento.click()
+        self._repetir(acao)
+
+    def campo(self, id_campo):
+        return self._repetir(lambda: self.elemento(id_campo, por_id=True))
+
+    def preencher(self, id_campo, valor, limpar=True):
+        def acao():
+            campo = self.elemento(id_campo, por_id=True)
+            if limpar:
+                campo.clear()
+            campo.send_keys(valor)
+        self._repetir(acao)
+
+    # Opção de um <select> por valor; sem valor, a última da lista
+    def selecionar(self, id_campo, valor=None):
+        def acao():
+            select = Select(self.elemento(id_campo, por_id=True))
+            if valor is None:
+                select.select_by_index(len(select.options) - 1)
+            else:
+                select.select_by_value(valor)
+        self._repetir(acao)
+
+    # Texto do erro do componente (modal-error / section-error), sem esperar
+    def erro(self, nome):
+        erros = self._repetir(lambda: self.elementos(nome))
+        return erros[0].text if erros else None
+
+
+# ============================================================================
+# MODAIS
+# ============================================================================
+class Modal(Componente):
+    def aberto(self):
+        esperar(self.navegador, EC.visibility_of_element_located((By.CSS_SELECTOR, f"{self.seletor} .modal-content")),
+                self.tempo, f"modal {self.TESTID} não abriu")
+        # Botões do rodapé já no cache: confirmar() não busca nada dentro de um passo medido
+        for botao in self.raiz.find_elements(By.CSS_SELECTOR, seletor_testid("modal-submit") + ", "
+                                             + seletor_testid("modal-close")):
+            self._cache[botao.get_attribute("data-testid")] = botao
+        return self
+
+    def esperar_fechado(self):
+        esperar(self.navegador, EC.invisibility_of_element_located(testid(self.TESTID)), self.tempo,
+                f"modal {self.TESTID} continua aberto")
+        self.esquecer()
+
+    # Depois de confirmar: None se o modal fechou, ou o texto do erro mostrado nele
+    def esperar_resultado(self):
+        esperar(self.navegador, EC.any_of(
+            EC.invisibility_of_element_located(testid(self.TESTID)),
+            EC.visibility_of_element_located((By.CSS_SELECTOR, seletor_testid(self.TESTID, "modal-error"))),
+        ), self.tempo, f"modal {self.TESTID} sem resultado")
+        erro = self.erro("modal-error") if self.navegador.find_elements(*testid(self.TESTID)) else None
+        if erro is None:
+            self.esquecer()
+        return erro
+
+    def erro_formulario(self):
+        return self.erro("modal-error")
+
+    def confirmar(self):
+        self.clicar("modal-submit")
+
+    def fechar(self):
+        self.clicar("modal-close")
+        self.esperar_fechado()
+
+
+class ModalRepublica(Modal):
+    TESTID = "republic-create-modal"
+
+    # O endereço é consultado sozinho quando os 8 dígitos do CEP ficam completos
+    def preencher_cep(self, cep):
+        self.preencher("cep", cep)
+        esperar_campo_preenchido(self.navegador, (By.CSS_SELECTOR, f"{self.seletor} #rua"), self.tempo)
+
+
+class ModalQuarto(Modal):
+    TESTID = "room-create-modal"
+
+
+class ModalMembro(Modal):
+    TESTID = "member-form-modal"
+
+
+class ModalDespesa(Modal):
+    TESTID = "expense-create-modal"
+
+
+class ModalPagamento(Modal):
+    TESTID = "expense-payment-modal"
+
+
+# ============================================================================
+# SEÇÕES
+# ============================================================================
+class Secao(Componente):
+    MENU = None
+    ITEM = None
+    MODAL_NOVO = None
+
+    @property
+    def TESTID(self):
+        return f"section-{self.MENU}"
+
+    # Seção pronta (sem "Carregando...", rede ociosa e DOM estável); o cache recomeça
+    def carregada(self):
+        self.esquecer()
+        esperar_secao_carregada(self.navegador, self.seletor, tempo=self.tempo)
+        return self
+
+    def adicionar(self):
+        self.clicar("add-button")
+        return self.MODAL_NOVO(self.navegador, self.tempo).aberto()
+
+    def erro_secao(self):
+        return self.erro("section-error")
+
+    @property
+    def localizador_itens(self):
+        return (By.CSS_SELECTOR, seletor_testid(self.TESTID, self.ITEM))
+
+    def itens(self):
+        return self.elementos(self.ITEM)
+
+    # Item (cartão/linha) que contém `texto`, esperando ele aparecer
+    def esperar_item(self, texto):
+        return esperar(self.navegador, lista_contem(self.localizador_itens, texto), self.tempo,
+                       f"'{texto}' não apareceu em {self.TESTID}")
+
+
+class SecaoRepublicas(Secao):
+    MENU = "republicas"
+    ITEM = "republic-card"
+    MODAL_NOVO = ModalRepublica
+
+    def selecionar(self, nome):
+        for cartao in self.itens():
+            if cartao.find_element(*testid("republic-name")).text.strip() == nome:
+                cartao.click()
+                return cartao
+        raise LookupError(f"república '{nome}' não está na lista")
+
+
+class SecaoQuartos(Secao):
+    MENU = "quartos"
+    ITEM = "room-card"
+    MODAL_NOVO = ModalQuarto
+
+
+class SecaoMembros(Secao):
+    MENU = "membros"
+    ITEM = "member-row"
+    MODAL_NOVO = ModalMembro
+
+
+class SecaoDespesas(Secao):
+    MENU = "despesas"
+    ITEM = "expense-card"
+    MODAL_NOVO = ModalDespesa
+
+    # "aberto" ou "historico"
+    def abrir_aba(self, aba):
+        nome = f"tab-{aba}"
+        self.clicar(nome)
+        classes = lambda nav: self._repetir(lambda: self.elemento(nome).get_attribute("class"))
+        esperar(self.navegador, lambda nav: "active" in classes(nav), self.tempo, f"aba {aba} não ficou ativa")
+
+    def registrar_pagamento(self, descricao):
+        cartao = self.esperar_item(descricao)
+        botao = cartao.find_element(*testid("register-payment-button"))
+        esperar(self.navegador, EC.element_to_be_clickable(botao), self.tempo, "botão de pagar indisponível")
+        botao.click()
+        return ModalPagamento(self.navegador, self.tempo).aberto()
+
+
+class SecaoPagamentos(Secao):
+    MENU = "pagamentos"
+    ITEM = "payment-row"
+
+
+class SecaoResumo(Secao):
+    MENU = "resumo"
+    ITEM = "report-row"
+
+    def botao_exportar(self, formato="csv"):
+        botao = self.elemento(f"export-{formato}")
+        return esperar(self.navegador, EC.element_to_be_clickable(botao), self.tempo, f"exportar {formato} indisponível")
+
+    def filtrar_categoria(self, categoria):
+        self.selecionar("category", categoria)
+
+
+SECOES = {secao.MENU: secao for secao in
+          (SecaoRepublicas, SecaoQuartos, SecaoMembros, SecaoDespesas, SecaoPagamentos, SecaoResumo)}
+
+
+class BarraLateral(Componente):
+    TESTID = "sidebar"
+
+    def item(self, menu):
+        return self.elemento(f"nav-{menu}")
+
+    # Clicar no menu e devolver a seção já carregada
+    def abrir(self, menu):
+        self.clicar(f"nav-{menu}")
+        return SECOES[menu](self.navegador, self.tempo).carregada()
+
+    def secao(self, menu):
+        return SECOES[menu](self.navegador, self.tempo)
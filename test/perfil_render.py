@@ -0,0 +1,168 @@
+import argparse
+import json
+import os
+import sys
+from datetime import datetime
+
+from selenium.webdriver.support.ui import Select
+
+from esperas import esperar, esperar_dom_estavel, esperar_rede_ociosa
+from navegador import criar_navegador
+from metricas import commit_atual
+from paginas import BarraLateral, SecaoResumo
+from servidor_falso import ServidorFalso
+from benchmark import TEMPO_LIMITE_BENCHMARK, entrar, ir_para
+
+# Perfil de renders do dashboard: executa interações roteirizadas e lê, para
+# cada uma, os commits e o tempo de render de cada região do <Profiler>
+# (src/utils/renderProfiler.jsx: Dashboard, Sidebar, secao:<menu>).
+# O frontend precisa estar no modo profile, com o proxy no backend falso:
+#   API_PROXY_TARGET=http://127.0.0.1:8000 npm run dev:profile
+
+RELATORIO_RENDER = "relatorio_render.json"
+
+
+# ============================================================================
+# INTERAÇÕES ROTEIRIZADAS
+# ============================================================================
+# Cada interação recebe o nome com que deve se marcar; quando ela parte de outra
+# seção, os renders para chegar lá ficam numa marca "preparacao" descartada
+def preparar(navegador, menu):
+    marcar(navegador, "preparacao")
+    return ir_para(navegador, menu)
+
+
+def abrir_menu(menu):
+    def interacao(navegador, nome):
+        barra = BarraLateral(navegador, TEMPO_LIMITE_BENCHMARK)
+        barra.item(menu)
+        marcar(navegador, nome)
+        barra.abrir(menu)
+    interacao.__name__ = f"abrir_{menu}"
+    return interacao
+
+
+def trocar_republica(navegador, nome):
+    cartoes = preparar(navegador, "republicas").itens()
+    marcar(navegador, nome)
+    cartoes[-1].click()
+    SecaoResumo(navegador, TEMPO_LIMITE_BENCHMARK).carregada()
+
+
+def filtrar_relatorio(navegador, nome):
+    categoria = Select(preparar(navegador, "resumo").campo("category"))
+    marcar(navegador, nome)
+    categoria.select_by_value("luz")
+    esperar_dom_estavel(navegador, tempo=TEMPO_LIMITE_BENCHMARK)
+
+
+# Abrir e fechar o modal: só o estado `showModal` do Dashboard muda
+def abrir_modal_republica(navegador, nome):
+    republicas = preparar(navegador, "republicas")
+    marcar(navegador, nome)
+    republicas.adicionar().fechar()
+
+
+INTERACOES = [
+    abrir_menu("resumo"),
+    abrir_menu("despesas"),
+    abrir_menu("pagamentos"),
+    abrir_menu("quartos"),
+    abrir_menu("membros"),
+    abrir_menu("republicas"),
+    trocar_republica,
+    filtrar_relatorio,
+    abrir_modal_republica,
+]
+
+
+def marcar(navegador, nome):
+    navegador.execute_script("window.__profile.mark(arguments[0])", nome)
+
+
+# ============================================================================
+# RELATÓRIO
+# ============================================================================
+def imprimir_perfil(interacoes):
+    print("\n" + "="*80)
+    print("RENDERS POR INTERAÇÃO (commits / tempo de render somado)")
+    print("="*80)
+    for interacao in interacoes:
+        regioes = interacao["regioes"]
+        commits = sum(r["commits"] for r in regioes.values())
+        print(f"\n▶ {interacao['nome']}: {commits} commits")
+        for nome, regiao in sorted(regioes.items(), key=lambda item: -item[1]["render_ms"]):
+            print(f"  {nome:<22} {regiao['commits']:>5} commits ({regiao['atualizacoes']} atualizações)"
+                  f"   {regiao['render_ms']:>8.1f}ms   maior: {regiao['maior_render_ms']:>7.1f}ms")
+
+
+def salvar_perfil(caminho, perfil, extras):
+    pasta = os.path.dirname(caminho)
+    if pasta:
+        os.makedirs(pasta, exist_ok=True)
+    with open(caminho, "w", encoding="utf-8") as arquivo:
+        json.dump({
+            "gerado_em": datetime.now().isoformat(timespec="seconds"),
+            "commit": commit_atual(),
+            **extras,
+            "interacoes": perfil,
+        }, arquivo, ensure_ascii=False, indent=2)
+    return caminho
+
+
+# ============================================================================
+# EXECUÇÃO
+# ============================================================================
+def executar_perfil(despesas, repeticoes=1, porta=8000, semente=42, latencia_ms=0, headless=True):
+    servidor = ServidorFalso(porta, semente=semente, latencia_ms=latencia_ms).iniciar()
+    navegador = criar_navegador(headless=headless)
+    try:
+        credenciais = servidor.estado.semear(republicas=2, despesas=despesas)
+        entrar(navegador, credenciais)
+        try:
+            esperar(navegador, lambda nav: nav.execute_script("return !!window.__profile"), tempo=5,
+                    mensagem="window.__profile ausente")
+        except Exception:
+            print("❌ O frontend não está no modo profile (use `npm run dev:profile`)")
+            sys.exit(2)
+
+        navegador.execute_script("window.__profile.clear()")
+        for rodada in range(repeticoes):
+            for interacao in INTERACOES:
+                nome = interacao.__name__ if repeticoes == 1 else f"{interacao.__name__}#{rodada + 1}"
+                try:
+                    interacao(navegador, nome)
+                    esperar_rede_ociosa(navegador, tempo=TEMPO_LIMITE_BENCHMARK)
+                except Exception as e:
+                    print(f"❌ {nome}: {e}")
+        # Fecha a última interação; "inicial", "preparacao" e "fim" ficam fora do relatório
+        marcar(navegador, "fim")
+        relatorio = navegador.execute_script("return window.__profile.report()")
+    finally:
+        navegador.quit()
+        servidor.parar()
+
+    nomes = {i.__name__ for i in INTERACOES}
+    return [i for i in relatorio["interacoes"] if i["nome"].split("#")[0] in nomes]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Perfil de renders das seções do dashboard (React Profiler)")
+    parser.add_argument("--despesas", type=int, default=500, help="despesas semeadas por república")
+    parser.add_argument("-k", "--repeticoes", type=int, default=1, help="vezes que o roteiro é repetido")
+    parser.add_argument("--porta", type=int, default=8000, help="porta do backend falso")
+    parser.add_argument("--semente", type=int, default=42)
+    parser.add_argument("--latencia", type=float, default=0, help="latência (ms) do backend falso")
+    parser.add_argument("--com-janela", action="store_true", help="abre o Chrome com janela em vez de headless")
+    parser.add_argument("--relatorio", default=RELATORIO_RENDER, metavar="ARQUIVO.json")
+    args = parser.parse_args()
+
+    perfil = executar_perfil(args.despesas, args.repeticoes, args.porta, args.semente, args.latencia,
+                             headless=not args.com_janela)
+    imprimir_perfil(perfil)
+    caminho = salvar_perfil(args.relatorio, perfil, {"despesas": args.despesas, "latencia_ms": args.latencia})
+    print(f"\n✓ Relatório: {caminho}")
+
+
+if __name__ == "__main__":
+    main()
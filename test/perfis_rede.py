@@ -0,0 +1,102 @@
+import statistics
+
+from selenium.common.exceptions import WebDriverException
+
+# Perfis de rede e CPU aplicados ao Chrome pelo DevTools Protocol
+# (Network.emulateNetworkConditions e Emulation.setCPUThrottlingRate).
+# Latência em ms, vazão em bytes/s (-1 = sem limite), CPU = quantas vezes mais lenta.
+# "4g" e "slow-3g" seguem os presets do Chrome DevTools (os mesmos números do
+# TTI estimado em vite.config.js); `fator_espera` multiplica os tempos limite das esperas.
+PERFIS = {
+    "sem-limite": {"rede": None, "cpu": 1, "fator_espera": 1},
+    "fast-wifi": {
+        "rede": {"latencia_ms": 5, "download": 30_000_000 // 8, "upload": 15_000_000 // 8},
+        "cpu": 1,
+        "fator_espera": 1,
+    },
+    "4g": {
+        "rede": {"latencia_ms": 170, "download": 9_000_000 // 8, "upload": 1_500_000 // 8},
+        "cpu": 2,
+        "fator_espera": 3,
+    },
+    "slow-3g": {
+        "rede": {"latencia_ms": 2000, "download": 400_000 // 8, "upload": 400_000 // 8},
+        "cpu": 4,
+        "fator_espera": 12,
+    },
+    # Celular de entrada em rede boa: isola o custo de JS/render
+    "low-end-cpu": {"rede": None, "cpu": 6, "fator_espera": 4},
+}
+
+PERFIL_PADRAO = "sem-limite"
+
+
+def validar_perfis(nomes):
+    desconhecidos = [nome for nome in nomes if nome not in PERFIS]
+    if desconhecidos:
+        raise ValueError(f"perfil desconhecido: {', '.join(desconhecidos)} (disponíveis: {', '.join(PERFIS)})")
+    return nomes
+
+
+# Aplicar (ou trocar) o perfil de um navegador já aberto; vale para as próximas
+# navegações da aba. "sem-limite" desfaz um perfil anterior
+def aplicar_perfil(navegador, nome):
+    perfil = PERFIS[nome]
+    rede = perfil["rede"]
+    try:
+        navegador.execute_cdp_cmd("Network.enable", {})
+        navegador.execute_cdp_cmd("Network.emulateNetworkConditions", {
+            "offline": False,
+            "latency": rede["latencia_ms"] if rede else 0,
+            "downloadThroughput": rede["download"] if rede else -1,
+            "uploadThroughput": rede["upload"] if rede else -1,
+        })
+        navegador.execute_cdp_cmd("Emulation.setCPUThrottlingRate", {"rate": perfil["cpu"]})
+    except (AttributeError, WebDriverException) as erro:
+        if nome != PERFIL_PADRAO:
+            raise RuntimeError(f"o navegador não aceita o perfil {nome} (requer Chrome com CDP): {erro}")
+    navegador.perfil = nome
+    navegador.fator_espera = perfil["fator_espera"]
+    return navegador
+
+
+# ============================================================================
+# COMPARAÇÃO ENTRE PERFIS
+# ============================================================================
+# Mediana do tempo de cada "cenario:passo" em cada perfil (só passos com sucesso)
+def tempos_por_perfil(execucoes):
+    grupos = {}
+    for execucao in execucoes:
+        perfil = execucao.get("perfil") or PERFIL_PADRAO
+        for passo in execucao["passos"]:
+            if passo["sucesso"]:
+                chave = f"{execucao['cenario']}:{passo['passo']}"
+                grupos.setdefault(chave, {}).setdefault(perfil, []).append(passo["tempo_ms"])
+    return {
+        chave: {perfil: round(statistics.median(tempos), 1) for perfil, tempos in por_perfil.items()}
+        for chave, por_perfil in grupos.items()
+    }
+
+
+def imprimir_lado_a_lado(execucoes, perfis):
+    tabela = tempos_por_perfil(execucoes)
+    if not tabela:
+        return tabela
+    base = perfis[0]
+    print("\n" + "="*80)
+    print(f"TEMPOS POR PERFIL (mediana; entre parênteses, quantas vezes o tempo em {base})")
+    print("="*80)
+    print(f"  {'cenario:passo':<40}" + "".join(f"{perfil:>18}" for perfil in perfis))
+    for chave in sorted(tabela):
+        celulas = []
+        for perfil in perfis:
+            tempo = tabela[chave].get(perfil)
+            referencia = tabela[chave].get(base)
+            if tempo is None:
+                celulas.append(f"{'-':>18}")
+            elif perfil != base and referencia:
+                celulas.append(f"{f'{tempo:.0f}ms ({tempo / referencia:.1f}x)':>18}")
+            else:
+                celulas.append(f"{f'{tempo:.0f}ms':>18}")
+        print(f"  {chave:<40}" + "".join(celulas))
+    return tabela
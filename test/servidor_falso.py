@@ -0,0 +1,918 @@
+import argparse
+import base64
+import json
+import random
+import re
+import sys
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from datetime import date, datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+# Backend falso usado pelos cenários Selenium: implementa as rotas que o
+# frontend chama, com estado em memória semeável, latência configurável e
+# injeção de falhas. Pode rodar dentro do processo dos testes ou pela CLI:
+#   python3 test/servidor_falso.py --porta 8000 --latencia 120 --semente 42
+
+SENHA_SEMENTE = "SenhaForte@123"
+CATEGORIAS = ["luz", "agua", "internet", "gas", "condominio", "limpeza", "manutencao", "outros"]
+VALIDADE_REFRESH = 30 * 24 * 3600
+
+# Base local de CEPs (o que não estiver aqui é resolvido com dados genéricos)
+CEPS = {
+    "01310100": {"logradouro": "Avenida Paulista", "bairro": "Bela Vista", "localidade": "São Paulo", "uf": "SP"},
+    "20040020": {"logradouro": "Avenida Rio Branco", "bairro": "Centro", "localidade": "Rio de Janeiro", "uf": "RJ"},
+    "30130010": {"logradouro": "Avenida Afonso Pena", "bairro": "Centro", "localidade": "Belo Horizonte", "uf": "MG"},
+    "70040010": {"logradouro": "Esplanada dos Ministérios", "bairro": "Zona Cívico-Administrativa",
+                 "localidade": "Brasília", "uf": "DF"},
+}
+
+
+class ErroApi(Exception):
+    def __init__(self, status, detalhe):
+        super().__init__(detalhe)
+        self.status = status
+        self.detalhe = detalhe
+
+
+# ============================================================================
+# ESTADO EM MEMÓRIA
+# ============================================================================
+class Estado:
+    def __init__(self, semente=0, validade_token=3600):
+        self.trava = threading.RLock()
+        # Validade (s) do token de acesso; o de renovação dura VALIDADE_REFRESH
+        self.validade_token = validade_token
+        self.reiniciar(semente)
+
+    def reiniciar(self, semente=0):
+        with self.trava:
+            self.semente = semente
+            self.aleatorio = random.Random(semente)
+            self.usuarios = {}
+            self.tokens = {}
+            self.republicas = {}
+            self.quartos = {}
+            self.membros = {}
+            self.despesas = {}
+            self.pagamentos = {}
+            # Índice despesa -> pagamentos, para não varrer tudo com milhares de despesas
+            self.pagamentos_por_despesa = {}
+            self.codigos = {}
+            self.contadores = {}
+
+    def proximo_id(self, tabela):
+        self.contadores[tabela] = self.contadores.get(tabela, 0) + 1
+        return self.contadores[tabela]
+
+    # Token no formato JWT (header.payload.assinatura) para o ProfileSection decodificar
+    def emitir_token(self, usuario, tipo="access"):
+        validade = VALIDADE_REFRESH if tipo == "refresh" else self.validade_token
+        vence = time.time() + validade
+        payload = {
+            "sub": usuario["email"],
+            "id": usuario["id"],
+            "type": tipo,
+            "exp": int(vence),
+            "jti": self.aleatorio.getrandbits(64),
+        }
+        partes = [{"alg": "HS256", "typ": "JWT"}, payload]
+        codificadas = [base64.b64encode(json.dumps(p).encode()).decode().rstrip("=") for p in partes]
+        token = ".".join(codificadas + ["falso"])
+        self.tokens[token] = (usuario["id"], tipo, vence)
+        return token
+
+    def usuario_do_token(self, token, tipo="access"):
+        registro = self.tokens.get(token)
+        if registro is None or registro[1] != tipo:
+            raise ErroApi(401, "Could not validate credentials")
+        if time.time() > registro[2]:
+            raise ErroApi(401, "Token expirado")
+        return self.usuarios[registro[0]]
+
+    # Invalidar os tokens de acesso (de um usuário ou de todos), mantendo os de renovação
+    def expirar_tokens(self, email=None):
+        expirados = [
+            token for token, (usuario_id, tipo, _) in self.tokens.items()
+            if tipo == "access" and (email is None or self.usuarios[usuario_id]["email"] == email)
+        ]
+        for token in expirados:
+            del self.tokens[token]
+        return len(expirados)
+
+    def criar_usuario(self, fullname, email, telephone, password):
+        if any(u["email"] == email for u in self.usuarios.values()):
+            raise ErroApi(400, "Email já cadastrado")
+        usuario = {
+            "id": self.proximo_id("usuarios"),
+            "fullname": fullname,
+            "email": email,
+            "telephone": telephone,
+            "password": password,
+        }
+        self.usuarios[usuario["id"]] = usuario
+        return usuario
+
+    def criar_republica(self, dono_id, dados):
+        republica = {
+            "id": self.proximo_id("republicas"),
+            "nome": dados.get("nome"),
+            "cep": dados.get("cep"),
+            "rua": dados.get("rua"),
+            "numero": dados.get("numero"),
+            "complemento": dados.get("complemento"),
+            "bairro": dados.get("bairro"),
+            "cidade": dados.get("cidade"),
+            "estado": dados.get("estado"),
+            "user_id": dono_id,
+        }
+        self.republicas[republica["id"]] = republica
+        return republica
+
+    def criar_quarto(self, republica_id, numero):
+        if any(q["republica_id"] == republica_id and q["numero"] == numero for q in self.quartos.values()):
+            raise ErroApi(400, "Já existe um quarto com este número")
+        quarto = {"id": self.proximo_id("quartos"), "numero": numero, "republica_id": republica_id}
+        self.quartos[quarto["id"]] = quarto
+        return quarto
+
+    def criar_membro(self, republica_id, dados):
+        quarto_id = dados.get("quarto_id")
+        if quarto_id is not None:
+            self.quarto(republica_id, quarto_id)
+        membro = {
+            "id": self.proximo_id("membros"),
+            "fullname": dados.get("fullname"),
+            "email": dados.get("email"),
+            "telephone": dados.get("telephone"),
+            "quarto_id": quarto_id,
+            "republica_id": republica_id,
+        }
+        self.membros[membro["id"]] = membro
+        return membro
+
+    def criar_despesa(self, republica_id, dados):
+        despesa = {
+            "id": self.proximo_id("despesas"),
+            "descricao": dados.get("descricao"),
+            "valor_total": float(dados.get("valor_total") or 0),
+            "data_vencimento": dados.get("data_vencimento"),
+            "categoria": dados.get("categoria") or "outros",
+            "republica_id": republica_id,
+        }
+        self.despesas[despesa["id"]] = despesa
+        return despesa
+
+    def registrar_pagamento(self, republica_id, despesa_id, membro_id, data_pagamento=None):
+        despesa = self.despesa(republica_id, despesa_id)
+        membro = self.membros.get(membro_id)
+        if membro is None or membro["republica_id"] != republica_id:
+            raise ErroApi(404, "Membro não encontrado")
+        if any(p["membro_id"] == membro_id for p in self.pagamentos_da(despesa_id)):
+            raise ErroApi(400, "Este membro já pagou esta despesa")
+        quantidade = max(1, len(self.membros_da(republica_id)))
+        pagamento = {
+            "id": self.proximo_id("pagamentos"),
+            "despesa_id": despesa_id,
+            "membro_id": membro_id,
+            "valor_pago": round(despesa["valor_total"] / quantidade, 2),
+            "data_pagamento": data_pagamento or datetime.now().replace(microsecond=0).isoformat(),
+        }
+        self.pagamentos[pagamento["id"]] = pagamento
+        self.pagamentos_por_despesa.setdefault(despesa_id, []).append(pagamento)
+        return pagamento
+
+    def remover_pagamento(self, pagamento):
+        del self.pagamentos[pagamento["id"]]
+        self.pagamentos_por_despesa[pagamento["despesa_id"]].remove(pagamento)
+
+    # ------------------------------------------------------------------
+    # Consultas
+    # ------------------------------------------------------------------
+    def republica(self, usuario, republica_id):
+        republica = self.republicas.get(republica_id)
+        if republica is None or republica["user_id"] != usuario["id"]:
+            raise ErroApi(404, "República não encontrada")
+        return republica
+
+    def quarto(self, republica_id, quarto_id):
+        quarto = self.quartos.get(quarto_id)
+        if quarto is None or quarto["republica_id"] != republica_id:
+            raise ErroApi(404, "Quarto não encontrado")
+        return quarto
+
+    def membro(self, republica_id, membro_id):
+        membro = self.membros.get(membro_id)
+        if membro is None or membro["republica_id"] != republica_id:
+            raise ErroApi(404, "Membro não encontrado")
+        return membro
+
+    def despesa(self, republica_id, despesa_id):
+        despesa = self.despesas.get(despesa_id)
+        if despesa is None or despesa["republica_id"] != republica_id:
+            raise ErroApi(404, "Despesa não encontrada")
+        return despesa
+
+    def membros_da(self, republica_id):
+        return [m for m in self.membros.values() if m["republica_id"] == republica_id]
+
+    def pagamentos_da(self, despesa_id):
+        return list(self.pagamentos_por_despesa.get(despesa_id, []))
+
+    # Status calculado como no backend: pago quando todos os membros pagaram
+    def despesa_publica(self, despesa):
+        membros = len(self.membros_da(despesa["republica_id"]))
+        pagos = len(self.pagamentos_da(despesa["id"]))
+        status = "PAGO" if membros and pagos >= membros else "PENDENTE"
+        return {**despesa, "status": status}
+
+    # ------------------------------------------------------------------
+    # Semeadura determinística
+    # ------------------------------------------------------------------
+    def semear(self, republicas=1, quartos=4, membros=4, despesas=10, taxa_pagamento=0.5,
+               email="semente@republica.test", senha=SENHA_SEMENTE):
+        with self.trava:
+            aleatorio = self.aleatorio
+            usuario = next((u for u in self.usuarios.values() if u["email"] == email), None)
+            if usuario is None:
+                usuario = self.criar_usuario("Usuário Semente", email, "(11) 90000-0000", senha)
+            inicio = date(2025, 1, 1)
+            ids_republicas = []
+            for r in range(1, republicas + 1):
+                republica = self.criar_republica(usuario["id"], {
+                    "nome": f"República Semente {self.contadores.get('republicas', 0) + 1}",
+                    "cep": "01310100", "rua": "Avenida Paulista", "numero": str(100 * r),
+                    "complemento": None, "bairro": "Bela Vista", "cidade": "São Paulo", "estado": "SP",
+                })
+                ids_republicas.append(republica["id"])
+                ids_quartos = [self.criar_quarto(republica["id"], 100 + q)["id"] for q in range(1, quartos + 1)]
+                ids_membros = []
+                for m in range(1, membros + 1):
+                    membro = self.criar_membro(republica["id"], {
+                        "fullname": f"Morador {m:03d}",
+                        "email": f"morador{m}.r{republica['id']}@republica.test",
+                        "telephone": f"(11) 9{aleatorio.randint(1000, 9999)}-{aleatorio.randint(1000, 9999)}",
+                        "quarto_id": ids_quartos[(m - 1) % len(ids_quartos)] if ids_quartos else None,
+                    })
+                    ids_membros.append(membro["id"])
+                for d in range(1, despesas + 1):
+                    categoria = aleatorio.choice(CATEGORIAS)
+                    vencimento = inicio + timedelta(days=aleatorio.randint(0, 540))
+                    despesa = self.criar_despesa(republica["id"], {
+                        "descricao": f"{categoria.capitalize()} #{d}",
+                        "valor_total": round(aleatorio.uniform(30, 1500), 2),
+                        "data_vencimento": vencimento.isoformat(),
+                        "categoria": categoria,
+                    })
+                    for membro_id in ids_membros:
+                        if aleatorio.random() < taxa_pagamento:
+                            pago_em = datetime.combine(vencimento, datetime.min.time()) - timedelta(
+                                days=aleatorio.randint(0, 10), hours=aleatorio.randint(0, 23))
+                            self.registrar_pagamento(republica["id"], despesa["id"], membro_id, pago_em.isoformat())
+            return {"usuario_id": usuario["id"], "email": email, "senha": senha, "republicas": ids_republicas}
+
+
+# ============================================================================
+# LATÊNCIA E FALHAS
+# ============================================================================
+class Comportamento:
+    """Atraso e falhas por rota; as chaves são os moldes das rotas
+    (ex.: "GET /despesas/{rep}") ou "*" para todas."""
+
+    def __init__(self, latencia_ms=0, variacao_ms=0, semente=0):
+        self.trava = threading.Lock()
+        self.aleatorio = random.Random(semente)
+        self.latencia_ms = latencia_ms
+        self.variacao_ms = variacao_ms
+        self.latencias = {}
+        self.falhas = {}
+        self.falhas_seguidas = {}
+
+    def configurar(self, latencia_ms=None, variacao_ms=None, latencias=None, falhas=None):
+        with self.trava:
+            if latencia_ms is not None:
+                self.latencia_ms = latencia_ms
+            if variacao_ms is not None:
+                self.variacao_ms = variacao_ms
+            if latencias is not None:
+                self.latencias = dict(latencias)
+            if falhas is not None:
+                # {"POST /despesas/{rep}": {"taxa": 0.3, "status": 500}}
+                self.falhas = {rota: dict(f) for rota, f in falhas.items()}
+
+    # Faz as próximas `quantidade` chamadas da rota falharem (reprodução exata)
+    def falhar_proximas(self, rota, quantidade=1, status=500):
+        with self.trava:
+            self.falhas_seguidas[rota] = [quantidade, status]
+
+    def limpar(self):
+        self.configurar(latencia_ms=0, variacao_ms=0, latencias={}, falhas={})
+        with self.trava:
+            self.falhas_seguidas = {}
+
+    def atraso(self, rota):
+        with self.trava:
+            base = self.latencias.get(rota, self.latencias.get("*", self.latencia_ms))
+            variacao = self.aleatorio.uniform(-self.variacao_ms, self.variacao_ms) if self.variacao_ms else 0
+        return max(0, base + variacao) / 1000
+
+    def falha(self, rota):
+        with self.trava:
+            for chave in (rota, "*"):
+                seguidas = self.falhas_seguidas.get(chave)
+                if seguidas and seguidas[0] > 0:
+                    seguidas[0] -= 1
+                    return seguidas[1]
+            for chave in (rota, "*"):
+                falha = self.falhas.get(chave)
+                if falha and self.aleatorio.random() < falha.get("taxa", 0):
+                    return falha.get("status", 500)
+        return None
+
+
+# ============================================================================
+# ROTAS
+# ============================================================================
+ROTAS = []
+
+
+def rota(metodo, molde):
+    padrao = re.compile("^" + re.sub(r"\{(\w+)\}", r"(?P<\1>[^/]+)", molde.rstrip("/")) + "/?$")
+
+    def registrar(funcao):
+        ROTAS.append((metodo, padrao, f"{metodo} {molde}", funcao))
+        return funcao
+    return registrar
+
+
+def inteiro(valor, nome="id"):
+    try:
+        return int(valor)
+    except (TypeError, ValueError):
+        raise ErroApi(422, f"{nome} inválido")
+
+
+# --- Autenticação e usuários -------------------------------------------------
+@rota("POST", "/auth/login")
+def login(req, estado):
+    dados = req.formulario()
+    usuario = next((u for u in estado.usuarios.values() if u["email"] == dados.get("username")), None)
+    if usuario is None or usuario["password"] != dados.get("password"):
+        raise ErroApi(401, "Email ou senha incorretos")
+    return 200, {
+        "access_token": estado.emitir_token(usuario),
+        "refresh_token": estado.emitir_token(usuario, "refresh"),
+        "token_type": "bearer",
+    }
+
+
+# Troca o token de renovação (de uso único) por um novo par de tokens
+@rota("POST", "/auth/refresh")
+def renovar_token(req, estado):
+    refresh = req.json().get("refresh_token")
+    usuario = estado.usuario_do_token(refresh, "refresh")
+    estado.tokens.pop(refresh, None)
+    return 200, {
+        "access_token": estado.emitir_token(usuario),
+        "refresh_token": estado.emitir_token(usuario, "refresh"),
+        "token_type": "bearer",
+    }
+
+
+@rota("POST", "/auth/logout")
+def logout(req, estado):
+    estado.tokens.pop(req.token(), None)
+    estado.tokens.pop(req.json().get("refresh_token"), None)
+    return 200, {"message": "Logout realizado com sucesso"}
+
+
+@rota("POST", "/auth/forgot-password")
+def esqueci_senha(req, estado):
+    email = req.json().get("email")
+    if any(u["email"] == email for u in estado.usuarios.values()):
+        estado.codigos[email] = f"{estado.aleatorio.randint(0, 999999):06d}"
+    return 200, {"message": "Se o email existir, um código foi enviado"}
+
+
+@rota("POST", "/auth/verify-code")
+def verificar_codigo(req, estado):
+    dados = req.json()
+    codigo = estado.codigos.get(dados.get("email"))
+    if codigo is None or codigo != dados.get("code"):
+        raise ErroApi(400, "Código inválido ou expirado")
+    usuario = next(u for u in estado.usuarios.values() if u["email"] == dados["email"])
+    del estado.codigos[dados["email"]]
+    return 200, {"reset_token": estado.emitir_token(usuario, "reset")}
+
+
+@rota("PATCH", "/auth/reset-password")
+def redefinir_senha(req, estado):
+    usuario = estado.usuario_do_token(req.token(), "reset")
+    usuario["password"] = req.json().get("new_password")
+    estado.tokens.pop(req.token(), None)
+    return 200, {"message": "Senha redefinida com sucesso"}
+
+
+@rota("POST", "/users")
+def cadastrar_usuario(req, estado):
+    dados = req.json()
+    if not dados.get("email") or not dados.get("password"):
+        raise ErroApi(422, "Email e senha são obrigatórios")
+    usuario = estado.criar_usuario(dados.get("fullname"), dados["email"], dados.get("telephone"), dados["password"])
+    return 201, sem_senha(usuario)
+
+
+@rota("GET", "/users/{id}")
+def obter_usuario(req, estado, id):
+    return 200, sem_senha(usuario_proprio(req, estado, id))
+
+
+@rota("PUT", "/users/{id}")
+def atualizar_usuario(req, estado, id):
+    usuario = usuario_proprio(req, estado, id)
+    dados = req.json()
+    for campo in ("fullname", "email", "telephone"):
+        if campo in dados:
+            usuario[campo] = dados[campo]
+    return 200, sem_senha(usuario)
+
+
+@rota("PATCH", "/users/change-password/{id}")
+def alterar_senha(req, estado, id):
+    usuario = usuario_proprio(req, estado, id)
+    dados = req.json()
+    if dados.get("old_password") != usuario["password"]:
+        raise ErroApi(400, "Senha atual incorreta")
+    usuario["password"] = dados.get("new_password")
+    return 200, {"message": "Senha alterada com sucesso"}
+
+
+def usuario_proprio(req, estado, id):
+    usuario = req.usuario(estado)
+    if usuario["id"] != inteiro(id):
+        raise ErroApi(403, "Acesso negado")
+    return usuario
+
+
+def sem_senha(usuario):
+    return {chave: valor for chave, valor in usuario.items() if chave != "password"}
+
+
+# --- Repúblicas --------------------------------------------------------------
+@rota("GET", "/republicas")
+def listar_republicas(req, estado):
+    usuario = req.usuario(estado)
+    return 200, [publica(r, estado) for r in estado.republicas.values() if r["user_id"] == usuario["id"]]
+
+
+@rota("POST", "/republicas")
+def criar_republica(req, estado):
+    return 201, publica(estado.criar_republica(req.usuario(estado)["id"], req.json()), estado)
+
+
+@rota("GET", "/republicas/{rep}")
+def obter_republica(req, estado, rep):
+    return 200, publica(estado.republica(req.usuario(estado), inteiro(rep)), estado)
+
+
+@rota("DELETE", "/republicas/{rep}")
+def remover_republica(req, estado, rep):
+    republica = estado.republica(req.usuario(estado), inteiro(rep))
+    del estado.republicas[republica["id"]]
+    return 204, None
+
+
+def publica(republica, estado):
+    return {**republica, "membros": len(estado.membros_da(republica["id"]))}
+
+
+# --- Quartos -----------------------------------------------------------------
+def republica_da_query(req, estado):
+    return estado.republica(req.usuario(estado), inteiro(req.query("republica_id"), "republica_id"))
+
+
+@rota("GET", "/quartos")
+def listar_quartos(req, estado):
+    republica = republica_da_query(req, estado)
+    quartos = [q for q in estado.quartos.values() if q["republica_id"] == republica["id"]]
+    return 200, {"quartos": quartos}
+
+
+@rota("POST", "/quartos")
+def criar_quarto(req, estado):
+    republica = republica_da_query(req, estado)
+    return 201, estado.criar_quarto(republica["id"], inteiro(req.json().get("numero"), "numero"))
+
+
+@rota("PATCH", "/quartos/{quarto}")
+def atualizar_quarto(req, estado, quarto):
+    republica = republica_da_query(req, estado)
+    encontrado = estado.quarto(republica["id"], inteiro(quarto))
+    encontrado["numero"] = inteiro(req.json().get("numero"), "numero")
+    return 200, encontrado
+
+
+@rota("DELETE", "/quartos/{quarto}")
+def remover_quarto(req, estado, quarto):
+    republica = republica_da_query(req, estado)
+    encontrado = estado.quarto(republica["id"], inteiro(quarto))
+    if any(m["quarto_id"] == encontrado["id"] for m in estado.membros.values()):
+        raise ErroApi(400, "Não é possível excluir um quarto com membros")
+    del estado.quartos[encontrado["id"]]
+    return 204, None
+
+
+@rota("PATCH", "/quartos/{quarto}/membros")
+def adicionar_membro_quarto(req, estado, quarto):
+    usuario = req.usuario(estado)
+    encontrado = estado.quartos.get(inteiro(quarto))
+    if encontrado is None:
+        raise ErroApi(404, "Quarto não encontrado")
+    estado.republica(usuario, encontrado["republica_id"])
+    membro = estado.membro(encontrado["republica_id"], inteiro(req.json().get("membro_id"), "membro_id"))
+    membro["quarto_id"] = encontrado["id"]
+    return 200, membro
+
+
+@rota("DELETE", "/quartos/{quarto}/membros/{membro}")
+def remover_membro_quarto(req, estado, quarto, membro):
+    usuario = req.usuario(estado)
+    encontrado = estado.quartos.get(inteiro(quarto))
+    if encontrado is None:
+        raise ErroApi(404, "Quarto não encontrado")
+    estado.republica(usuario, encontrado["republica_id"])
+    alvo = estado.membro(encontrado["republica_id"], inteiro(membro))
+    novo = req.query("novo_quarto_id")
+    alvo["quarto_id"] = estado.quarto(encontrado["republica_id"], inteiro(novo))["id"] if novo else None
+    return 200, alvo
+
+
+# --- Membros -----------------------------------------------------------------
+@rota("GET", "/membros/{rep}")
+def listar_membros(req, estado, rep):
+    republica = estado.republica(req.usuario(estado), inteiro(rep))
+    return 200, {"members": estado.membros_da(republica["id"])}
+
+
+@rota("POST", "/membros/{rep}")
+def criar_membro(req, estado, rep):
+    republica = estado.republica(req.usuario(estado), inteiro(rep))
+    return 201, estado.criar_membro(republica["id"], req.json())
+
+
+@rota("PUT", "/membros/{rep}/{membro}")
+def atualizar_membro(req, estado, rep, membro):
+    republica = estado.republica(req.usuario(estado), inteiro(rep))
+    encontrado = estado.membro(republica["id"], inteiro(membro))
+    dados = req.json()
+    for campo in ("fullname", "email", "telephone"):
+        if campo in dados:
+            encontrado[campo] = dados[campo]
+    return 200, encontrado
+
+
+@rota("DELETE", "/membros/{rep}/{membro}")
+def remover_membro(req, estado, rep, membro):
+    republica = estado.republica(req.usuario(estado), inteiro(rep))
+    encontrado = estado.membro(republica["id"], inteiro(membro))
+    del estado.membros[encontrado["id"]]
+    for pagamento in [p for p in estado.pagamentos.values() if p["membro_id"] == encontrado["id"]]:
+        estado.remover_pagamento(pagamento)
+    return 204, None
+
+
+# --- Despesas e pagamentos ---------------------------------------------------
+@rota("GET", "/despesas/{rep}")
+def listar_despesas(req, estado, rep):
+    republica = estado.republica(req.usuario(estado), inteiro(rep))
+    despesas = [estado.despesa_publica(d) for d in estado.despesas.values() if d["republica_id"] == republica["id"]]
+    return 200, {"despesas": despesas}
+
+
+@rota("POST", "/despesas/{rep}")
+def criar_despesa(req, estado, rep):
+    republica = estado.republica(req.usuario(estado), inteiro(rep))
+    return 201, estado.despesa_publica(estado.criar_despesa(republica["id"], req.json()))
+
+
+@rota("GET", "/despesas/{rep}/{despesa}")
+def obter_despesa(req, estado, rep, despesa):
+    republica = estado.republica(req.usuario(estado), inteiro(rep))
+    return 200, estado.despesa_publica(estado.despesa(republica["id"], inteiro(despesa)))
+
+
+@rota("PATCH", "/despesas/{rep}/{despesa}")
+def atualizar_despesa(req, estado, rep, despesa):
+    republica = estado.republica(req.usuario(estado), inteiro(rep))
+    encontrada = estado.despesa(republica["id"], inteiro(despesa))
+    dados = req.json()
+    for campo in ("descricao", "data_vencimento", "categoria"):
+        if campo in dados:
+            encontrada[campo] = dados[campo]
+    if "valor_total" in dados:
+        encontrada["valor_total"] = float(dados["valor_total"])
+    return 200, estado.despesa_publica(encontrada)
+
+
+@rota("DELETE", "/despesas/{rep}/{despesa}")
+def remover_despesa(req, estado, rep, despesa):
+    republica = estado.republica(req.usuario(estado), inteiro(rep))
+    encontrada = estado.despesa(republica["id"], inteiro(despesa))
+    del estado.despesas[encontrada["id"]]
+    for pagamento in estado.pagamentos_da(encontrada["id"]):
+        estado.remover_pagamento(pagamento)
+    return 204, None
+
+
+@rota("POST", "/despesas/{rep}/{despesa}/pagamento")
+def registrar_pagamento(req, estado, rep, despesa):
+    republica = estado.republica(req.usuario(estado), inteiro(rep))
+    membro_id = inteiro(req.json().get("membro_id"), "membro_id")
+    return 201, estado.registrar_pagamento(republica["id"], inteiro(despesa), membro_id)
+
+
+@rota("GET", "/despesas/{rep}/{despesa}/pagamentos")
+def listar_pagamentos(req, estado, rep, despesa):
+    republica = estado.republica(req.usuario(estado), inteiro(rep))
+    encontrada = estado.despesa(republica["id"], inteiro(despesa))
+    return 200, {"pagamentos": estado.pagamentos_da(encontrada["id"])}
+
+
+# --- ViaCEP ------------------------------------------------------------------
+@rota("GET", "/viacep/ws/{cep}/json")
+def viacep(req, estado, cep):
+    cep = re.sub(r"\D", "", cep)
+    if len(cep) != 8 or cep == "00000000":
+        return 200, {"erro": True}
+    endereco = CEPS.get(cep) or {"logradouro": f"Rua {cep[:5]}", "bairro": "Centro",
+                                 "localidade": "Cidade Teste", "uf": "SP"}
+    return 200, {"cep": f"{cep[:5]}-{cep[5:]}", "complemento": "", **endereco}
+
+
+# --- Controle (usado pelos scripts de teste, sem latência nem falhas) --------
+@rota("GET", "/__controle/estado")
+def controle_estado(req, estado):
+    tabelas = ("usuarios", "republicas", "quartos", "membros", "despesas", "pagamentos")
+    return 200, {"semente": estado.semente, **{t: len(getattr(estado, t)) for t in tabelas}}
+
+
+# Requisições atendidas por rota e status ({"GET /membros/{rep} 200": 3, ...})
+@rota("GET", "/__controle/historico")
+def controle_historico(req, estado):
+    contagem = {}
+    with req.server.trava_historico:
+        for metodo, molde, status, _ in req.server.historico:
+            chave = f"{molde} {status}"
+            contagem[chave] = contagem.get(chave, 0) + 1
+    return 200, contagem
+
+
+# Simula o vencimento dos tokens de acesso: {"email": "..."} ou todos
+@rota("POST", "/__controle/expirar-tokens")
+def controle_expirar_tokens(req, estado):
+    return 200, {"expirados": estado.expirar_tokens(req.json().get("email"))}
+
+
+@rota("POST", "/__controle/reiniciar")
+def controle_reiniciar(req, estado):
+    estado.reiniciar(req.json().get("semente", estado.semente))
+    return 200, {"semente": estado.semente}
+
+
+@rota("POST", "/__controle/semear")
+def controle_semear(req, estado):
+    return 200, estado.semear(**req.json())
+
+
+@rota("POST", "/__controle/comportamento")
+def controle_comportamento(req, estado):
+    dados = req.json()
+    comportamento = req.server.comportamento
+    if dados.get("limpar"):
+        comportamento.limpar()
+    comportamento.configurar(
+        latencia_ms=dados.get("latencia_ms"),
+        variacao_ms=dados.get("variacao_ms"),
+        latencias=dados.get("latencias"),
+        falhas=dados.get("falhas"),
+    )
+    for rota_alvo, falha in (dados.get("falhar_proximas") or {}).items():
+        comportamento.falhar_proximas(rota_alvo, falha.get("quantidade", 1), falha.get("status", 500))
+    return 200, {"latencia_ms": comportamento.latencia_ms, "variacao_ms": comportamento.variacao_ms}
+
+
+# ============================================================================
+# SERVIDOR HTTP
+# ============================================================================
+class Requisicao(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Cabeçalhos e corpo saem em escritas separadas: sem isto, Nagle + ACK
+    # atrasado somam ~40ms a cada resposta numa conexão keep-alive
+    disable_nagle_algorithm = True
+
+    def log_message(self, formato, *args):
+        if self.server.verboso:
+            super().log_message(formato, *args)
+
+    def do_OPTIONS(self):
+        self.responder(204, None)
+
+    def do_GET(self):
+        self.despachar("GET")
+
+    def do_POST(self):
+        self.despachar("POST")
+
+    def do_PUT(self):
+        self.despachar("PUT")
+
+    def do_PATCH(self):
+        self.despachar("PATCH")
+
+    def do_DELETE(self):
+        self.despachar("DELETE")
+
+    # --- leitura ---------------------------------------------------------
+    def corpo(self):
+        if not hasattr(self, "_corpo"):
+            tamanho = int(self.headers.get("Content-Length") or 0)
+            self._corpo = self.rfile.read(tamanho) if tamanho else b""
+        return self._corpo
+
+    def json(self):
+        try:
+            return json.loads(self.corpo() or b"{}")
+        except ValueError:
+            raise ErroApi(422, "JSON inválido")
+
+    def formulario(self):
+        return {chave: valores[0] for chave, valores in parse_qs(self.corpo().decode()).items()}
+
+    def query(self, nome):
+        valores = parse_qs(urlsplit(self.path).query).get(nome)
+        return valores[0] if valores else None
+
+    def token(self):
+        # O esquema não diferencia maiúsculas: o api.js envia o token_type do login ("bearer")
+        cabecalho = self.headers.get("Authorization") or ""
+        return cabecalho[7:] if cabecalho[:7].lower() == "bearer " else None
+
+    def usuario(self, estado):
+        if not self.token():
+            raise ErroApi(401, "Not authenticated")
+        return estado.usuario_do_token(self.token())
+
+    # --- despacho --------------------------------------------------------
+    def despachar(self, metodo):
+        # Consumir o corpo sempre, para manter a conexão keep-alive consistente (a
+        # mesma instância atende todas as requisições da conexão: descartar o anterior)
+        self.__dict__.pop("_corpo", None)
+        self.corpo()
+        caminho = urlsplit(self.path).path
+        # Aceitar também chamadas com o prefixo /api (sem o rewrite do Vite)
+        if caminho.startswith("/api/"):
+            caminho = caminho[4:]
+        for metodo_rota, padrao, molde, funcao in ROTAS:
+            encontrado = padrao.match(caminho)
+            if metodo_rota == metodo and encontrado:
+                break
+        else:
+            self.responder(404, {"detail": "Not Found"})
+            return
+
+        inicio = time.perf_counter()
+        status = None
+        if not molde.split(" ")[1].startswith("/__controle"):
+            time.sleep(self.server.comportamento.atraso(molde))
+            status = self.server.comportamento.falha(molde)
+        if status is not None:
+            resposta = {"detail": f"Falha injetada em {molde}"}
+        else:
+            try:
+                with self.server.estado.trava:
+                    status, resposta = funcao(self, self.server.estado, **encontrado.groupdict())
+            except ErroApi as erro:
+                status, resposta = erro.status, {"detail": erro.detalhe}
+        self.responder(status, resposta)
+        self.server.registrar(metodo, molde, status, time.perf_counter() - inicio)
+
+    def responder(self, status, resposta):
+        corpo = b"" if resposta is None else json.dumps(resposta, ensure_ascii=False).encode()
+        self.send_response(status)
+        self.send_header("Access-Control-Allow-Origin", self.headers.get("Origin") or "*")
+        self.send_header("Access-Control-Allow-Credentials", "true")
+        self.send_header("Access-Control-Allow-Methods", "GET, POST, PUT, PATCH, DELETE, OPTIONS")
+        self.send_header("Access-Control-Allow-Headers", "Authorization, Content-Type")
+        if resposta is not None:
+            self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(corpo)))
+        self.end_headers()
+        self.wfile.write(corpo)
+
+
+class ServidorFalso(ThreadingHTTPServer):
+    daemon_threads = True
+    # O proxy do Vite abre muitas conexões simultâneas quando há milhares de despesas
+    request_queue_size = 128
+
+    def __init__(self, porta=8000, host="127.0.0.1", semente=0, latencia_ms=0, variacao_ms=0, verboso=False,
+                 validade_token=3600):
+        super().__init__((host, porta), Requisicao)
+        self.estado = Estado(semente, validade_token)
+        self.comportamento = Comportamento(latencia_ms, variacao_ms, semente)
+        self.verboso = verboso
+        self.historico = []
+        self.trava_historico = threading.Lock()
+        self.thread = None
+
+    @property
+    def url(self):
+        host, porta = self.server_address[:2]
+        return f"http://{host}:{porta}"
+
+    # Histórico (método, rota, status, duração em s) para medições nos testes
+    def registrar(self, metodo, molde, status, duracao):
+        with self.trava_historico:
+            self.historico.append((metodo, molde, status, duracao))
+
+    def iniciar(self):
+        self.thread = threading.Thread(target=self.serve_forever, name="servidor-falso", daemon=True)
+        self.thread.start()
+        return self
+
+    def parar(self):
+        self.shutdown()
+        self.server_close()
+
+    # Ida e volta de autenticação como o frontend faz: cadastro, login em
+    # /auth/login e /republicas com o cabeçalho "<token_type> <token>" do api.js
+    def verificar(self):
+        def chamar(metodo, rota, corpo=None, cabecalhos=None):
+            requisicao = urllib.request.Request(f"{self.url}{rota}", data=corpo, headers=cabecalhos or {},
+                                                method=metodo)
+            with urllib.request.urlopen(requisicao, timeout=10) as resposta:
+                return resposta.status, json.loads(resposta.read() or b"null")
+
+        email = f"verificacao_{time.time_ns()}@teste.com"
+        try:
+            chamar("POST", "/users", json.dumps({"fullname": "Verificação", "email": email, "telephone": "",
+                                                 "password": SENHA_SEMENTE}).encode(),
+                   {"Content-Type": "application/json"})
+            _, sessao = chamar("POST", "/auth/login",
+                               urllib.parse.urlencode({"username": email, "password": SENHA_SEMENTE}).encode(),
+                               {"Content-Type": "application/x-www-form-urlencoded"})
+            autorizacao = f"{sessao['token_type']} {sessao['access_token']}"
+            status, _ = chamar("GET", "/republicas", cabecalhos={"Authorization": autorizacao})
+        except urllib.error.HTTPError as erro:
+            print(f"❌ Verificação do backend falso: {erro.code} em {erro.url}")
+            return False
+        return status == 200
+
+    def __enter__(self):
+        return self.iniciar()
+
+    def __exit__(self, *erro):
+        self.parar()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Backend falso para os testes do frontend")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--porta", type=int, default=8000)
+    parser.add_argument("--semente", type=int, default=0, help="semente do gerador aleatório")
+    parser.add_argument("--latencia", type=float, default=0, help="latência base de cada resposta (ms)")
+    parser.add_argument("--variacao", type=float, default=0, help="variação aleatória da latência (± ms)")
+    parser.add_argument("--despesas", type=int, default=0,
+                        help="semear uma república com esta quantidade de despesas")
+    parser.add_argument("--validade-token", type=float, default=3600,
+                        help="validade (s) do token de acesso; use poucos segundos para testar a renovação")
+    parser.add_argument("-v", "--verboso", action="store_true", help="registra cada requisição no terminal")
+    parser.add_argument("--verificar", action="store_true",
+                        help="só confere login + rota autenticada (como o frontend chama) e sai")
+    args = parser.parse_args()
+
+    servidor = ServidorFalso(args.porta, args.host, args.semente, args.latencia, args.variacao, args.verboso,
+                             args.validade_token)
+    if args.verificar:
+        with servidor:
+            ok = servidor.verificar()
+        print("✅ Login e rota autenticada funcionando" if ok else "❌ Autenticação do backend falso falhou")
+        sys.exit(0 if ok else 1)
+    if args.despesas:
+        semente = servidor.estado.semear(despesas=args.despesas)
+        print(f"✓ Dados semeados: {semente['email']} / {semente['senha']}")
+    print(f"✓ Servidor falso em {servidor.url} (ViaCEP em {servidor.url}/viacep)")
+    try:
+        servidor.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        servidor.server_close()
+
+
+if __name__ == "__main__":
+    main()
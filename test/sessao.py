@@ -0,0 +1,56 @@
+import json
+import urllib.parse
+import urllib.request
+
+from esperas import TEMPO_LIMITE_PADRAO, esperar_secao_carregada, esperar_url
+from navegador import URL_API, URL_BASE
+from dados import cadastrar_usuario_api
+
+# Sessão injetada direto no localStorage, sem passar pelas telas de cadastro e
+# login. O ganho é pular a interface; o login na API (uma requisição) acontece
+# a cada cenário. Não há cache de tokens: cada cenário cadastra um usuário novo
+# (dados.gerar_contexto), para que workers em paralelo não compartilhem
+# repúblicas, então um token guardado por conta nunca seria reaproveitado.
+
+
+# Login direto na API, no mesmo formato do Login.jsx (form-urlencoded)
+def obter_token(usuario):
+    corpo = urllib.parse.urlencode({"username": usuario["email"], "password": usuario["senha"]}).encode()
+    requisicao = urllib.request.Request(
+        f"{URL_API}/auth/login",
+        data=corpo,
+        headers={"Content-Type": "application/x-www-form-urlencoded"},
+        method="POST",
+    )
+    with urllib.request.urlopen(requisicao, timeout=10) as resposta:
+        dados = json.loads(resposta.read())
+    return {
+        "access_token": dados["access_token"],
+        "token_type": dados.get("token_type", "bearer"),
+        "refresh_token": dados.get("refresh_token"),
+    }
+
+
+# Gravar os tokens no localStorage com as mesmas chaves que o api.js lê
+def injetar_sessao(navegador, sessao):
+    if not navegador.current_url.startswith(URL_BASE):
+        navegador.get(f"{URL_BASE}/")
+    navegador.execute_script(
+        "window.localStorage.setItem('access_token', arguments[0]);"
+        "window.localStorage.setItem('token_type', arguments[1]);"
+        "if (arguments[2]) window.localStorage.setItem('refresh_token', arguments[2]);",
+        sessao["access_token"],
+        sessao["token_type"],
+        sessao.get("refresh_token"),
+    )
+
+
+# Navegador já autenticado no dashboard, sem passar pelas telas de cadastro/login
+def entrar_com_sessao(navegador, usuario, cadastrar=True, tempo=TEMPO_LIMITE_PADRAO):
+    if cadastrar:
+        cadastrar_usuario_api(usuario)
+    injetar_sessao(navegador, obter_token(usuario))
+    navegador.get(f"{URL_BASE}/dashboard")
+    esperar_url(navegador, "/dashboard", tempo=tempo)
+    esperar_secao_carregada(navegador, ".republics-section", tempo=tempo)
+    print(f"✓ Sessão reaproveitada para {usuario['email']} (sem cadastro/login pela interface)")
@@ -0,0 +1,98 @@
+from selenium.webdriver.common.by import By
+
+from esperas import esperar, esperar_secao_carregada, esperar_visivel
+from navegador import URL_BASE, criar_navegador
+from dados import gerar_contexto, controle_servidor
+from sessao import entrar_com_sessao
+from metricas import Metricas, salvar_relatorio
+
+
+# Quantas vezes o backend falso atendeu "MÉTODO /rota STATUS"
+def contagem(rota):
+    return (controle_servidor("GET", "historico") or {}).get(rota, 0)
+
+
+def token_atual(navegador):
+    return navegador.execute_script("return window.localStorage.getItem('access_token')")
+
+
+# ============================================================================
+# CENÁRIO: TOKEN VENCIDO + FALHAS TRANSITÓRIAS (requer test/servidor_falso.py)
+# ============================================================================
+def cenario_sessao_expirada(navegador, contexto):
+    usuario = contexto["usuario"]
+    metricas = contexto.setdefault("metricas", Metricas(navegador, "sessao_expirada"))
+
+    print("\n" + "="*80)
+    print("TESTE AUTOMATIZADO - RENOVAÇÃO DE TOKEN E NOVAS TENTATIVAS")
+    print("="*80)
+
+    if controle_servidor("GET", "estado") is None:
+        metricas.ignorar("Backend sem rotas de controle (use test/servidor_falso.py); cenário ignorado")
+        return
+
+    with metricas.medir("login"):
+        entrar_com_sessao(navegador, usuario)
+
+    # ============================================================================
+    # TESTE 1: TOKEN DE ACESSO VENCIDO
+    # ============================================================================
+    print("\n1. Expirando o token de acesso no backend...")
+    token_antigo = token_atual(navegador)
+    renovacoes = contagem("POST /auth/refresh 200")
+    expirados = controle_servidor("POST", "expirar-tokens", {"email": usuario["email"]})["expirados"]
+    print(f"✓ {expirados} token(s) expirado(s)")
+
+    print("\n2. Recarregando o dashboard com o token vencido...")
+    with metricas.medir("renovar_token"):
+        navegador.get(f"{URL_BASE}/dashboard")
+        esperar(navegador, lambda nav: token_atual(nav) not in (None, token_antigo),
+                mensagem="o token não foi renovado")
+        esperar_secao_carregada(navegador, ".republics-section")
+
+    if "/login" in navegador.current_url:
+        metricas.falhar("Sessão perdida: redirecionado para o login")
+    elif contagem("POST /auth/refresh 200") - renovacoes != 1:
+        metricas.falhar(f"Esperada 1 renovação, houve {contagem('POST /auth/refresh 200') - renovacoes}")
+    else:
+        print("✅ Token renovado uma única vez, sem voltar para o login")
+
+    # ============================================================================
+    # TESTE 2: FALHAS TRANSITÓRIAS (503) SÃO REPETIDAS
+    # ============================================================================
+    print("\n3. Fazendo as próximas 2 chamadas de GET /republicas falharem com 503...")
+    falhas = contagem("GET /republicas 503")
+    sucessos = contagem("GET /republicas 200")
+    controle_servidor("POST", "comportamento",
+                      {"falhar_proximas": {"GET /republicas": {"quantidade": 2, "status": 503}}})
+
+    with metricas.medir("repetir_falhas"):
+        navegador.get(f"{URL_BASE}/dashboard")
+        esperar(navegador, lambda nav: contagem("GET /republicas 200") > sucessos,
+                mensagem="GET /republicas não foi repetido após as falhas")
+        esperar_secao_carregada(navegador, ".republics-section")
+
+    if contagem("GET /republicas 503") - falhas != 2:
+        metricas.falhar("As falhas injetadas não aconteceram")
+    elif navegador.find_elements(By.CSS_SELECTOR, ".republics-section .error-message, .error-banner"):
+        metricas.falhar("Erro exibido mesmo com a requisição repetida com sucesso")
+    else:
+        esperar_visivel(navegador, (By.CSS_SELECTOR, ".republics-section"))
+        print("✅ GET /republicas repetido após 2 falhas 503, sem erro na tela")
+
+    metricas.finalizar()
+    metricas.imprimir()
+
+
+if __name__ == "__main__":
+    navegador = criar_navegador()
+    metricas = Metricas(navegador, "sessao_expirada")
+    try:
+        cenario_sessao_expirada(navegador, {**gerar_contexto(), "metricas": metricas})
+    except Exception as e:
+        print(f"\n❌ ERRO DURANTE A EXECUÇÃO DOS TESTES: {e}")
+        navegador.save_screenshot("erro_geral_teste_sessao.png")
+    finally:
+        metricas.finalizar()
+        print(f"✓ Relatório de desempenho: {', '.join(salvar_relatorio([metricas]))}")
+        navegador.quit()
@@ -0,0 +1,204 @@
+from selenium.common.exceptions import WebDriverException
+
+# Core Web Vitals por rota e seção, coletados com PerformanceObserver em toda
+# navegação dos cenários. As métricas são atribuídas à rota visível quando são
+# observadas: "/login", "/dashboard#Despesas" (seção = título do dashboard).
+# Cada página soma no sessionStorage, então recarregar não perde o acumulado.
+# - LCP e TTFB: por carregamento de página (só a rota, sem seção)
+# - CLS: maior janela de deslocamentos (intervalo de 1s, até 5s), sem os causados por input
+# - INP: maior duração de interação (cliques/teclas) observada
+# - Tarefas longas: quantidade, maior e tempo de bloqueio (o que passa de 50ms)
+
+CHAVE_ARMAZENAMENTO = "__rfVitals"
+
+SCRIPT_VITALS = """
+(function () {
+  if (window.__rfVitals || !window.PerformanceObserver) return;
+  const CHAVE = '%s';
+  let dados = {};
+  try { dados = JSON.parse(sessionStorage.getItem(CHAVE) || '{}'); } catch (e) {}
+
+  const rota = () => location.pathname.replace(/\\/+$/, '') || '/';
+  const chaveAtual = () => {
+    const titulo = rota().startsWith('/dashboard') && document.querySelector('.content-header h1');
+    return titulo && titulo.textContent.trim() ? rota() + '#' + titulo.textContent.trim() : rota();
+  };
+  const registro = (chave) => dados[chave] || (dados[chave] = {
+    lcp_ms: null, ttfb_ms: null, cls: 0, inp_ms: null, tarefas_longas: 0, maior_tarefa_ms: 0, bloqueio_ms: 0
+  });
+  const maximo = (atual, valor) => (atual == null ? valor : Math.max(atual, valor));
+
+  let agendado = false;
+  const salvar = () => {
+    if (agendado) return;
+    agendado = true;
+    setTimeout(() => {
+      agendado = false;
+      try { sessionStorage.setItem(CHAVE, JSON.stringify(dados)); } catch (e) {}
+    }, 0);
+  };
+  const observar = (tipo, aoReceber, opcoes) => {
+    try {
+      new PerformanceObserver((lista) => { lista.getEntries().forEach(aoReceber); salvar(); })
+        .observe(Object.assign({ type: tipo, buffered: true }, opcoes || {}));
+    } catch (e) {}
+  };
+
+  const pagina = rota();
+  const [navegacao] = performance.getEntriesByType('navigation');
+  if (navegacao) registro(pagina).ttfb_ms = maximo(registro(pagina).ttfb_ms, navegacao.responseStart);
+
+  // LCP do carregamento (o navegador para de emitir após o primeiro input)
+  let lcp = 0;
+  observar('largest-contentful-paint', (e) => { lcp = Math.max(lcp, e.startTime); });
+  const fecharLcp = () => { if (lcp) { registro(pagina).lcp_ms = maximo(registro(pagina).lcp_ms, lcp); lcp = 0; salvar(); } };
+  ['pointerdown', 'keydown'].forEach((tipo) => addEventListener(tipo, fecharLcp, { once: true, capture: true }));
+  addEventListener('pagehide', fecharLcp);
+  setTimeout(fecharLcp, 3000);
+
+  // CLS em janelas de sessão, por rota/seção
+  const janelas = {};
+  observar('layout-shift', (e) => {
+    if (e.hadRecentInput) return;
+    const chave = chaveAtual();
+    const janela = janelas[chave] || (janelas[chave] = { inicio: 0, fim: 0, valor: 0 });
+    if (e.startTime - janela.fim > 1000 || e.startTime - janela.inicio > 5000) {
+      janela.inicio = e.startTime;
+      janela.valor = 0;
+    }
+    janela.fim = e.startTime;
+    janela.valor += e.value;
+    registro(chave).cls = Math.max(registro(chave).cls, Math.round(janela.valor * 10000) / 10000);
+  });
+
+  // INP: interações com interactionId (event timing)
+  observar('event', (e) => {
+    if (!e.interactionId) return;
+    const r = registro(chaveAtual());
+    r.inp_ms = maximo(r.inp_ms, e.duration);
+  }, { durationThreshold: 16 });
+
+  observar('longtask', (e) => {
+    const r = registro(chaveAtual());
+    r.tarefas_longas += 1;
+    r.maior_tarefa_ms = Math.max(r.maior_tarefa_ms, Math.round(e.duration));
+    r.bloqueio_ms += Math.round(Math.max(0, e.duration - 50));
+  });
+
+  window.__rfVitals = {
+    dados: () => { fecharLcp(); sessionStorage.setItem(CHAVE, JSON.stringify(dados)); return dados; },
+    zerar: () => { dados = {}; sessionStorage.removeItem(CHAVE); }
+  };
+})();
+""" % CHAVE_ARMAZENAMENTO
+
+# Orçamentos por rota/seção (limites "bons" do web.dev, mais apertados onde a
+# página é leve). "*" vale para o que não tiver entrada própria; "/dashboard#*"
+# para as seções sem entrada própria. None = sem limite para a métrica.
+ORCAMENTOS = {
+    "*": {"lcp_ms": 2500, "cls": 0.1, "inp_ms": 200, "ttfb_ms": 800, "bloqueio_ms": 300},
+    "/": {"lcp_ms": 2000},
+    "/login": {"lcp_ms": 1500, "bloqueio_ms": 150},
+    "/register": {"lcp_ms": 1500, "bloqueio_ms": 150},
+    "/dashboard": {"lcp_ms": 2500, "bloqueio_ms": 400},
+    "/dashboard#*": {"lcp_ms": None, "ttfb_ms": None},
+    "/dashboard#Pagamentos": {"bloqueio_ms": 600},
+    "/dashboard#Resumo": {"bloqueio_ms": 600},
+}
+
+# Orçamentos valem para os perfis sem throttling; nos outros o resumo é só informativo
+PERFIS_COM_ORCAMENTO = {"sem-limite", "fast-wifi"}
+
+METRICAS = ("lcp_ms", "cls", "inp_ms", "ttfb_ms", "bloqueio_ms")
+
+
+# Instalar o coletor na página atual e nas próximas navegações (como o monitor de esperas.py)
+def instalar_vitals(navegador):
+    try:
+        navegador.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": SCRIPT_VITALS})
+    except (AttributeError, WebDriverException):
+        pass
+    navegador.execute_script(SCRIPT_VITALS)
+
+
+def zerar_vitals(navegador):
+    navegador.execute_script(
+        f"window.__rfVitals ? window.__rfVitals.zerar() : sessionStorage.removeItem('{CHAVE_ARMAZENAMENTO}')")
+
+
+def coletar_vitals(navegador):
+    try:
+        return navegador.execute_script(
+            f"return window.__rfVitals ? window.__rfVitals.dados() : "
+            f"JSON.parse(sessionStorage.getItem('{CHAVE_ARMAZENAMENTO}') || '{{}}')") or {}
+    except WebDriverException:
+        return {}
+
+
+def orcamento_de(chave):
+    orcamento = dict(ORCAMENTOS["*"])
+    if "#" in chave:
+        orcamento.update(ORCAMENTOS.get(chave.split("#")[0] + "#*", {}))
+    orcamento.update(ORCAMENTOS.get(chave, {}))
+    return orcamento
+
+
+# Juntar as coletas de vários cenários: pior valor de cada métrica por rota/seção
+def combinar(coletas):
+    combinado = {}
+    for coleta in coletas:
+        for chave, valores in (coleta or {}).items():
+            atual = combinado.setdefault(chave, {})
+            for metrica in METRICAS + ("tarefas_longas", "maior_tarefa_ms"):
+                valor = valores.get(metrica)
+                if valor is not None:
+                    atual[metrica] = max(valor, atual.get(metrica) or 0)
+    return combinado
+
+
+# Lista de estouros: (rota/seção, métrica, valor, limite)
+def verificar_orcamentos(vitals):
+    estouros = []
+    for chave, valores in sorted(vitals.items()):
+        for metrica, limite in orcamento_de(chave).items():
+            valor = valores.get(metrica)
+            if limite is not None and valor is not None and valor > limite:
+                estouros.append((chave, metrica, valor, limite))
+    return estouros
+
+
+def imprimir_vitals(vitals, perfil=None):
+    print("\n" + "="*80)
+    print(f"WEB VITALS POR ROTA/SEÇÃO{f' [{perfil}]' if perfil else ''} (pior valor)")
+    print("="*80)
+    print(f"  {'rota':<28} {'LCP':>8} {'CLS':>7} {'INP':>7} {'TTFB':>7} {'longas':>7} {'bloqueio':>9}")
+    estourados = {(chave, metrica) for chave, metrica, _, _ in verificar_orcamentos(vitals)}
+
+    def celula(chave, metrica, largura, formato):
+        valor = vitals[chave].get(metrica)
+        texto = "-" if valor is None else formato.format(valor)
+        return (texto + ("!" if (chave, metrica) in estourados else "")).rjust(largura)
+
+    for chave in sorted(vitals):
+        simbolo = "❌" if any(c == chave for c, _ in estourados) else "✓"
+        print(f"{simbolo} {chave:<28} {celula(chave, 'lcp_ms', 8, '{:.0f}ms')} {celula(chave, 'cls', 7, '{:.3f}')} "
+              f"{celula(chave, 'inp_ms', 7, '{:.0f}ms')} {celula(chave, 'ttfb_ms', 7, '{:.0f}ms')} "
+              f"{vitals[chave].get('tarefas_longas', 0):>7} {celula(chave, 'bloqueio_ms', 9, '{:.0f}ms')}")
+
+
+# Resumo por perfil e falha se algum perfil com orçamento estourou; devolve os estouros
+def resumir_vitals(coletas_por_perfil):
+    estouros = []
+    for perfil, coletas in coletas_por_perfil.items():
+        vitals = combinar(coletas)
+        if not vitals:
+            continue
+        imprimir_vitals(vitals, perfil)
+        if perfil in PERFIS_COM_ORCAMENTO:
+            for chave, metrica, valor, limite in verificar_orcamentos(vitals):
+                print(f"❌ {chave}: {metrica} = {valor} acima do orçamento de {limite}")
+                estouros.append({"perfil": perfil, "rota": chave, "metrica": metrica,
+                                 "valor": valor, "limite": limite})
+        else:
+            print(f"⚠️ Perfil {perfil}: orçamentos não aplicados (só informativo)")
+    return estouros
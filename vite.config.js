@@ -1,17 +1,147 @@
 import { defineConfig } from 'vite'
 import react from '@vitejs/plugin-react'
+import { writeFileSync } from 'node:fs'
+import { join } from 'node:path'
+import { gzipSync } from 'node:zlib'
+
+// Perfis de rede usados na estimativa de tempo até a página ficar interativa
+// (mesmos valores do throttling "Slow 4G"/"Fast 3G" do Chrome DevTools)
+const NETWORK_PROFILES = {
+  '4g': { kbps: 9000, rttMs: 170 },
+  '3g': { kbps: 1600, rttMs: 562 }
+}
+// Custo aproximado de parse/compilação de JS num celular mediano (ms por KB)
+const PARSE_MS_PER_KB = 1
+
+// Relatório de tamanho dos chunks gerado em todo `vite build` (dist/bundle-report.json).
+// Para cada página (chunk carregado sob demanda) soma o JS/CSS inicial mais o da
+// página e estima o tempo até ficar interativa em cada perfil de rede.
+function bundleReport() {
+  let outDir = 'dist'
+
+  return {
+    name: 'bundle-report',
+    apply: 'build',
+    configResolved(config) {
+      outDir = config.build.outDir
+    },
+    writeBundle(options, bundle) {
+      const files = {}
+      for (const [fileName, output] of Object.entries(bundle)) {
+        const content = output.type === 'chunk' ? output.code : output.source
+        const bytes = Buffer.byteLength(content)
+        files[fileName] = {
+          arquivo: fileName,
+          nome: output.name || null,
+          tipo: output.type === 'chunk' ? 'js' : fileName.split('.').pop(),
+          bytes,
+          gzip: gzipSync(content).length,
+          entrada: output.type === 'chunk' && output.isEntry,
+          sob_demanda: output.type === 'chunk' && output.isDynamicEntry,
+          imports: output.type === 'chunk' ? output.imports : [],
+          css: output.type === 'chunk' ? [...(output.viteMetadata?.importedCss || [])] : []
+        }
+      }
+
+      // Arquivos baixados junto com um chunk: ele, seus imports estáticos e o CSS deles
+      const closure = (fileName, seen = new Set()) => {
+        if (seen.has(fileName) || !files[fileName]) return seen
+        seen.add(fileName)
+        for (const dep of [...files[fileName].imports, ...files[fileName].css]) {
+          closure(dep, seen)
+        }
+        return seen
+      }
+
+      const sum = (names) => [...names].reduce(
+        (total, name) => ({
+          bytes: total.bytes + files[name].bytes,
+          gzip: total.gzip + files[name].gzip,
+          js: total.js + (files[name].tipo === 'js' ? files[name].bytes : 0)
+        }),
+        { bytes: 0, gzip: 0, js: 0 }
+      )
+
+      const estimateTti = ({ js, gzip, requests }) => Object.fromEntries(
+        Object.entries(NETWORK_PROFILES).map(([profile, { kbps, rttMs }]) => [
+          profile,
+          // HTML + uma ida por nível de requisição + transferência + parse do JS
+          Math.round(rttMs * (1 + Math.min(requests, 2)) + (gzip * 8) / kbps + (js / 1024) * PARSE_MS_PER_KB)
+        ])
+      )
+
+      const initial = new Set()
+      for (const file of Object.values(files)) {
+        if (file.entrada) closure(file.arquivo, initial)
+      }
+
+      const pages = {}
+      for (const file of Object.values(files)) {
+        if (!file.sob_demanda) continue
+        const needed = closure(file.arquivo, new Set(initial))
+        const totals = sum(needed)
+        pages[file.nome] = {
+          ...totals,
+          arquivos: needed.size,
+          tti_estimado_ms: estimateTti({ ...totals, requests: needed.size - initial.size })
+        }
+      }
+
+      const report = {
+        gerado_em: new Date().toISOString(),
+        total: sum(Object.keys(files)),
+        inicial: { ...sum(initial), arquivos: [...initial] },
+        paginas: pages,
+        perfis_rede: NETWORK_PROFILES,
+        chunks: Object.values(files).sort((a, b) => b.bytes - a.bytes)
+      }
+      writeFileSync(join(outDir, 'bundle-report.json'), JSON.stringify(report, null, 2))
+
+      const kb = (value) => `${(value / 1024).toFixed(1)} KB`
+      console.log(`\nbundle-report: inicial ${kb(report.inicial.bytes)} (${kb(report.inicial.gzip)} gzip)`)
+      for (const [name, page] of Object.entries(pages).sort((a, b) => b[1].gzip - a[1].gzip)) {
+        const tti = Object.entries(page.tti_estimado_ms).map(([profile, ms]) => `${profile} ~${ms}ms`).join(', ')
+        console.log(`  ${name.padEnd(22)} ${kb(page.gzip).padStart(10)} gzip   TTI estimado: ${tti}`)
+      }
+      console.log(`  relatório completo em ${join(outDir, 'bundle-report.json')}`)
+    }
+  }
+}
 
 // https://vitejs.dev/config/
-export default defineConfig({
-  plugins: [react()],
+// `--mode profile` (npm run dev:profile / build:profile) liga os <Profiler> do
+// dashboard (src/utils/renderProfiler.jsx); no build, troca o react-dom pela
+// versão com profiling, senão o React de produção não chama o onRender
+export default defineConfig(({ mode }) => ({
+  plugins: [react(), bundleReport()],
+  resolve: mode === 'profile'
+    ? { alias: [{ find: /^react-dom$/, replacement: 'react-dom/profiling' }] }
+    : {},
+  build: {
+    outDir: mode === 'profile' ? 'dist-profile' : 'dist',
+    rollupOptions: {
+      output: {
+        // Bibliotecas mudam menos que o código da aplicação: chunks próprios, cache mais longo
+        manualChunks(id) {
+          if (/node_modules\/(react|react-dom|react-router|react-router-dom|@remix-run\/router|scheduler)\//.test(id)) {
+            return 'react-vendor'
+          }
+          if (id.includes('node_modules/@fortawesome/')) {
+            return 'icons'
+          }
+        }
+      }
+    }
+  },
   server: {
     port: 3000,
     proxy: {
       '/api': {
-        target: 'http://localhost:8000',
+        // API_PROXY_TARGET permite apontar para o backend falso dos testes (test/servidor_falso.py)
+        target: process.env.API_PROXY_TARGET || 'http://localhost:8000',
         changeOrigin: true,
         rewrite: (path) => path.replace(/^\/api/, '')
       }
     }
   }
-})
+}))